@@ -1,11 +1,24 @@
+import cProfile
 import logging
+import sys
+from typing import BinaryIO, TextIO
 from urllib.parse import urlparse
 
 import click
 
+from nfe_scanner.logs import configure_logging
 from nfe_scanner.models import Nfe
-from nfe_scanner.nfe import scan_multiple_nfe
+from nfe_scanner.nfe import iter_scan_multiple_nfe, scan_multiple_nfe
+from nfe_scanner.profiling import PROFILER
+from nfe_scanner.receipts import receipt_urls
 from nfe_scanner.reports.console import console_report
+from nfe_scanner.reports.jsonl import jsonl_report
+from nfe_scanner.validation import (
+    JsonlQuarantine,
+    iter_reconciled,
+    log_quarantine,
+    reconcile,
+)
 
 LOGGER = logging.getLogger(__name__)
 
@@ -26,12 +39,108 @@ def validate_urls(_ctx, _param, urls: tuple[str]):
     return urls
 
 
+def report_timings(timings_format: str, f: TextIO | None = None):
+    # stdout may already carry the NFes as JSON lines, timings never go there
+    f = f or sys.stderr
+    if timings_format == "table":
+        LOGGER.info(PROFILER.summary_table())
+    elif timings_format == "jsonl":
+        PROFILER.write_jsonl(f)
+    elif timings_format == "prometheus":
+        f.write(PROFILER.prometheus_text())
+
+
 @click.command()
-@click.argument("urls", nargs=-1, type=str, callback=validate_urls, required=True)
-def scan(urls: tuple[str]):
+@click.argument("urls", nargs=-1, type=str, callback=validate_urls)
+@click.option(
+    "--receipts",
+    "receipt_paths",
+    multiple=True,
+    type=click.Path(exists=True),
+    help="Also scan the QR codes of receipt photos and PDFs in this file or directory.",
+)
+@click.option(
+    "--profile",
+    "profile_file",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Write cProfile stats of the run to this file (pstats format, e.g. for snakeviz).",
+)
+@click.option(
+    "--timings",
+    "timings_format",
+    type=click.Choice(["table", "jsonl", "prometheus"]),
+    help="Collect per-stage timings and output them in the given format.",
+)
+@click.option(
+    "--timings-output",
+    "timings_file",
+    type=click.File("w", encoding="utf-8"),
+    help="Where jsonl or prometheus timings are written, stderr by default.",
+)
+@click.option(
+    "--quarantine",
+    "quarantine_file",
+    type=click.File("a", encoding="utf-8"),
+    help="Append NFes whose totals do not add up to this JSON lines file.",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["console", "jsonl"]),
+    default="console",
+    show_default=True,
+    help="Log a readable report at the end, or write each NFe as a JSON line as it is scanned.",
+)
+@click.option(
+    "--output",
+    "output_file",
+    type=click.File("wb"),
+    default="-",
+    help="Where JSON lines are written, stdout by default.",
+)
+@click.option(
+    "--log-level",
+    type=click.Choice(["DEBUG", "INFO", "WARNING", "ERROR"], case_sensitive=False),
+    default="INFO",
+    show_default=True,
+)
+def scan(
+    urls: tuple[str],
+    receipt_paths: tuple[str],
+    profile_file: str | None,
+    timings_format: str | None,
+    timings_file: TextIO | None,
+    quarantine_file: TextIO | None,
+    output_format: str,
+    output_file: BinaryIO,
+    log_level: str,
+):
     """Scan and Parse NFes"""
-    nfes: list[Nfe] = scan_multiple_nfe(list(urls))
-    console_report(nfes)
+    configure_logging(log_level.upper())
+    if not urls and not receipt_paths:
+        raise click.UsageError("Missing URLS or --receipts.")
+    PROFILER.enabled = bool(profile_file or timings_format)
+    profiler = cProfile.Profile() if profile_file else None
+
+    if profiler:
+        profiler.enable()
+    try:
+        if receipt_paths:
+            urls += tuple(receipt_urls(receipt_paths))
+        quarantine = JsonlQuarantine(quarantine_file) if quarantine_file else log_quarantine
+        if output_format == "jsonl":
+            scanned = (nfe for _, nfe in iter_scan_multiple_nfe(list(urls)))
+            jsonl_report(iter_reconciled(scanned, quarantine), output_file)
+        else:
+            nfes: list[Nfe] = reconcile(scan_multiple_nfe(list(urls)), quarantine)
+            console_report(nfes)
+    finally:
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(profile_file)
+            LOGGER.info("Profile written to '%s'.", profile_file)
+
+    report_timings(timings_format or ("table" if profile_file else ""), timings_file)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,115 @@
+import re
+from operator import mul
+from typing import Iterable, Iterator, NamedTuple
+
+ACCESS_KEY_LENGTH = 44
+ACCESS_KEY_PATTERN = re.compile(rf"^\d{{{ACCESS_KEY_LENGTH}}}$")
+NON_DIGITS_PATTERN = re.compile(r"\D")
+
+# weights cycle from 2 to 9 starting at the rightmost digit
+CHECK_DIGIT_WEIGHTS = tuple(2 + (i % 8) for i in reversed(range(ACCESS_KEY_LENGTH - 1)))
+
+# IBGE state codes used in the first two digits of the access key
+STATE_CODES = {
+    "11": "RO",
+    "12": "AC",
+    "13": "AM",
+    "14": "RR",
+    "15": "PA",
+    "16": "AP",
+    "17": "TO",
+    "21": "MA",
+    "22": "PI",
+    "23": "CE",
+    "24": "RN",
+    "25": "PB",
+    "26": "PE",
+    "27": "AL",
+    "28": "SE",
+    "29": "BA",
+    "31": "MG",
+    "32": "ES",
+    "33": "RJ",
+    "35": "SP",
+    "41": "PR",
+    "42": "SC",
+    "43": "RS",
+    "50": "MS",
+    "51": "MT",
+    "52": "GO",
+    "53": "DF",
+}
+
+
+class AccessKeyInfo(NamedTuple):
+    access_key: str
+    state: str | None
+    year: int
+    month: int
+    issuer_code: str
+    model: str
+    series: int
+    number: int
+    emission_type: str
+    numeric_code: str
+
+    @property
+    def period(self) -> tuple[int, int]:
+        return self.year, self.month
+
+    @property
+    def national_registration_code(self) -> str:
+        """Issuer CNPJ formatted the same way parsers store it in `NfeIssuer`."""
+        code = self.issuer_code
+        return f"{code[:2]}.{code[2:5]}.{code[5:8]}/{code[8:12]}-{code[12:]}"
+
+
+def compute_check_digit(key_without_dv: str) -> int:
+    """Modulo 11 check digit over the first 43 digits of an access key."""
+    total = sum(map(mul, map(int, key_without_dv), CHECK_DIGIT_WEIGHTS))
+    check_digit = 11 - (total % 11)
+    return 0 if check_digit >= 10 else check_digit
+
+
+def is_valid_access_key(key: str) -> bool:
+    if not ACCESS_KEY_PATTERN.match(key):
+        return False
+    return compute_check_digit(key[:-1]) == int(key[-1])
+
+
+def extract_access_key(value: str) -> str | None:
+    """
+    Extract the canonical 44 digits access key from a QR code parameter value.
+
+    The `p` parameter carries `key|version|env|...|hash` while `chNFe` carries the key
+    alone, possibly formatted with spaces. Returns None when no valid key is found.
+    """
+    candidate = NON_DIGITS_PATTERN.sub("", value.split("|", 1)[0])
+    if is_valid_access_key(candidate):
+        return candidate
+    return None
+
+
+def decode_access_key(key: str) -> AccessKeyInfo:
+    """
+    Decode the metadata embedded in a canonical access key, without any validation.
+
+    Layout: cUF(2) AAMM(4) CNPJ(14) mod(2) serie(3) nNF(9) tpEmis(1) cNF(8) cDV(1)
+    """
+    return AccessKeyInfo(
+        key,
+        STATE_CODES.get(key[0:2]),
+        2000 + int(key[2:4]),
+        int(key[4:6]),
+        key[6:20],
+        key[20:22],
+        int(key[22:25]),
+        int(key[25:34]),
+        key[34],
+        key[35:43],
+    )
+
+
+def decode_access_keys(keys: Iterable[str]) -> Iterator[AccessKeyInfo]:
+    """Lazily decode keys in bulk, silently dropping the ones that are not valid."""
+    return map(decode_access_key, filter(is_valid_access_key, keys))
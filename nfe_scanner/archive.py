@@ -0,0 +1,283 @@
+import hashlib
+import logging
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Iterator
+
+from nfe_scanner.access_key import ACCESS_KEY_LENGTH
+from nfe_scanner.exceptions import NfeArchiveException
+from nfe_scanner.fetchers.base import NfeFetcherResponse, NfeFetcherResponseType, NfeUrl
+from nfe_scanner.models import Nfe
+from nfe_scanner.parsers.base import ParseMode
+from nfe_scanner.parsers.factory import NfeParserFactory
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+LOGGER = logging.getLogger(__name__)
+
+DICTIONARY_FILE = "pages.dict"
+DATA_FILE = "pages.data"
+INDEX_FILE = "pages.index"
+
+DICTIONARY_SIZE = 112_640
+COMPRESSION_LEVEL = 9
+
+INDEX_MAGIC = b"NFEPACK1"
+INDEX_HEADER = struct.Struct("<8sQQ")  # magic, capacity, count
+INDEX_SLOT = struct.Struct(f"<{ACCESS_KEY_LENGTH}sQ")  # access key, record offset + 1
+INITIAL_CAPACITY = 1024
+MAX_LOAD_FACTOR = 0.6
+
+# record layout in the data file: access key, url length, payload length, url, payload
+RECORD_HEADER = struct.Struct(f"<{ACCESS_KEY_LENGTH}sHI")
+
+
+def slot_hash(key: bytes) -> int:
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+
+def train_dictionary(samples: list[str], size: int = DICTIONARY_SIZE) -> bytes:
+    """
+    zstd dictionary trained on sample pages.
+
+    SEFAZ pages are mostly template boilerplate, so with too few samples to train on the
+    samples themselves are used as a raw content dictionary.
+    """
+    encoded = [sample.encode("utf-8") for sample in samples]
+    try:
+        return zstandard.train_dictionary(size, encoded).as_bytes()
+    except zstandard.ZstdError as err:
+        LOGGER.debug("Falling back to a raw content dictionary: %s", err)
+        return b"".join(encoded)[-size:]
+
+
+class NfeHtmlArchive:  # pylint: disable=too-many-instance-attributes
+    """
+    Append-only pack of raw receipt pages keyed by access key.
+
+    Pages are zstd compressed with a dictionary trained on SEFAZ templates. Lookups go
+    through an open addressing hash table memory-mapped from disk, so reading one page
+    costs a couple of slot probes and a single read, whatever the archive size.
+
+    Opening an archive recovers from an interrupted `add`: complete records missing from
+    the index are indexed and a partially written last record is cut off.
+    """
+
+    def __init__(self, path: str | Path, samples: list[str] | None = None):
+        if zstandard is None:
+            raise NfeArchiveException(
+                "NfeHtmlArchive requires the 'zstandard' package, install the 'archive' extra"
+            )
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        dictionary_file = self.path / DICTIONARY_FILE
+
+        if not dictionary_file.exists():
+            if not samples:
+                raise NfeArchiveException(
+                    f"Archive '{self.path}' does not exist, sample pages are required to create it"
+                )
+            dictionary_file.write_bytes(train_dictionary(samples))
+
+        dictionary = zstandard.ZstdCompressionDict(
+            dictionary_file.read_bytes(), dict_type=zstandard.DICT_TYPE_AUTO
+        )
+        self._compressor = zstandard.ZstdCompressor(level=COMPRESSION_LEVEL, dict_data=dictionary)
+        self._decompressor = zstandard.ZstdDecompressor(dict_data=dictionary)
+        self._data = open(self.path / DATA_FILE, "a+b")  # pylint: disable=consider-using-with
+        self._index_file = None
+        self._index: mmap.mmap | None = None
+        self._open_index()
+        self._recover()
+
+    def __enter__(self) -> "NfeHtmlArchive":
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def close(self):
+        if self._index is not None:
+            self._index.flush()
+            self._index.close()
+            self._index_file.close()
+            self._index = None
+        self._data.close()
+
+    # index
+
+    def _open_index(self):
+        index_path = self.path / INDEX_FILE
+        if not index_path.exists():
+            self._write_empty_index(index_path, INITIAL_CAPACITY)
+        self._index_file = open(index_path, "r+b")  # pylint: disable=consider-using-with
+        self._index = mmap.mmap(self._index_file.fileno(), 0)
+        magic, self._capacity, self._count = INDEX_HEADER.unpack_from(self._index)
+        if magic != INDEX_MAGIC:
+            raise NfeArchiveException(f"'{index_path}' is not an archive index")
+
+    @staticmethod
+    def _write_empty_index(index_path: Path, capacity: int):
+        with open(index_path, "wb") as f:
+            f.write(INDEX_HEADER.pack(INDEX_MAGIC, capacity, 0))
+            f.truncate(INDEX_HEADER.size + capacity * INDEX_SLOT.size)
+
+    def _probe(self, key: bytes) -> tuple[int, int]:
+        """Slot position holding `key`, or the empty one where it would go, and its offset."""
+        slot = slot_hash(key) % self._capacity
+        while True:
+            position = INDEX_HEADER.size + slot * INDEX_SLOT.size
+            slot_key, offset = INDEX_SLOT.unpack_from(self._index, position)
+            if offset == 0 or slot_key == key:
+                return position, offset
+            slot = (slot + 1) % self._capacity
+
+    def _insert(self, key: bytes, offset: int):
+        position, _ = self._probe(key)
+        # offsets are stored + 1 so that 0 marks an empty slot
+        INDEX_SLOT.pack_into(self._index, position, key, offset + 1)
+        self._count += 1
+        INDEX_HEADER.pack_into(self._index, 0, INDEX_MAGIC, self._capacity, self._count)
+
+    def _indexed_records(self) -> list[tuple[bytes, int]]:
+        slots = INDEX_SLOT.iter_unpack(self._index[INDEX_HEADER.size :])
+        return [(key, offset - 1) for key, offset in slots if offset]
+
+    def _reset_index(self, capacity: int, records: list[tuple[bytes, int]]):
+        self._index.close()
+        self._index_file.close()
+        tmp_path = self.path / f"{INDEX_FILE}.tmp"
+        self._write_empty_index(tmp_path, capacity)
+        os.replace(tmp_path, self.path / INDEX_FILE)
+        self._open_index()
+        for key, offset in records:
+            self._insert(key, offset)
+
+    def _reserve(self):
+        """Grow the index before it gets too full for one more record."""
+        if self._count + 1 > self._capacity * MAX_LOAD_FACTOR:
+            self._reset_index(self._capacity * 2, self._indexed_records())
+
+    def _recover(self):
+        """Index complete records appended after the last indexed one, cut a torn one."""
+        self._data.flush()
+        size = os.fstat(self._data.fileno()).st_size
+        offset = 0
+        if indexed := self._indexed_records():
+            # records up to the last indexed one were complete when it was indexed
+            last_offset = max(record_offset for _, record_offset in indexed)
+            if (offset := self._record_end(last_offset, size)) is None:
+                LOGGER.warning("'%s' is shorter than its index, reindexing.", self.path)
+                self._reset_index(self._capacity, [])
+                offset = 0
+        while offset < size:
+            if (end := self._record_end(offset, size)) is None:
+                LOGGER.warning(
+                    "Cutting a partially written record at offset %d of '%s'.",
+                    offset,
+                    self.path / DATA_FILE,
+                )
+                os.ftruncate(self._data.fileno(), offset)
+                break
+            key = os.pread(self._data.fileno(), ACCESS_KEY_LENGTH, offset)
+            if not self._probe(key)[1]:
+                self._reserve()
+                self._insert(key, offset)
+            offset = end
+
+    def rebuild_index(self):
+        """Re-create the index from the data file, e.g. after a crash between both writes."""
+        self._recover()
+        records = [(key, offset) for key, offset, _, _ in self._iter_records()]
+        capacity = self._capacity
+        while len(records) > capacity * MAX_LOAD_FACTOR:
+            capacity *= 2
+        self._reset_index(capacity, records)
+
+    # records
+
+    def _iter_records(self) -> Iterator[tuple[bytes, int, str, bytes]]:
+        self._data.flush()
+        offset = 0
+        size = os.fstat(self._data.fileno()).st_size
+        while offset < size:
+            if self._record_end(offset, size) is None:
+                # torn by an interrupted write, cut off the next time the archive is opened
+                break
+            key, url, payload = self._read_record(offset)
+            yield key, offset, url, payload
+            offset += RECORD_HEADER.size + len(url.encode("utf-8")) + len(payload)
+
+    def _record_end(self, offset: int, size: int) -> int | None:
+        """Offset following the record at `offset`, None if it does not fit in `size` bytes."""
+        if offset + RECORD_HEADER.size > size:
+            return None
+        _, url_length, payload_length = RECORD_HEADER.unpack(
+            os.pread(self._data.fileno(), RECORD_HEADER.size, offset)
+        )
+        end = offset + RECORD_HEADER.size + url_length + payload_length
+        return end if end <= size else None
+
+    def _read_record(self, offset: int) -> tuple[bytes, str, bytes]:
+        data_fd = self._data.fileno()
+        key, url_length, payload_length = RECORD_HEADER.unpack(
+            os.pread(data_fd, RECORD_HEADER.size, offset)
+        )
+        body = os.pread(data_fd, url_length + payload_length, offset + RECORD_HEADER.size)
+        return key, body[:url_length].decode("utf-8"), body[url_length:]
+
+    @staticmethod
+    def _encode_key(access_key: str) -> bytes:
+        key = access_key.replace(" ", "").encode("ascii")
+        if len(key) != ACCESS_KEY_LENGTH:
+            raise ValueError(f"'{access_key}' is not a {ACCESS_KEY_LENGTH} digits access key")
+        return key
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, access_key: str) -> bool:
+        return self._probe(self._encode_key(access_key))[1] != 0
+
+    def add(self, access_key: str, url: str, html: str) -> bool:
+        """Append a page, returns False if the access key is already archived."""
+        key = self._encode_key(access_key)
+        if self._probe(key)[1]:
+            return False
+
+        self._reserve()
+        url_bytes = url.encode("utf-8")
+        payload = self._compressor.compress(html.encode("utf-8"))
+        self._data.seek(0, os.SEEK_END)
+        offset = self._data.tell()
+        self._data.write(RECORD_HEADER.pack(key, len(url_bytes), len(payload)))
+        self._data.write(url_bytes)
+        self._data.write(payload)
+        self._data.flush()
+        self._insert(key, offset)
+        return True
+
+    def add_response(self, response: NfeFetcherResponse) -> bool:
+        return self.add(response.url.dedup_key, response.url.full, response.text)
+
+    def get(self, access_key: str) -> str | None:
+        _, offset = self._probe(self._encode_key(access_key))
+        if not offset:
+            return None
+        _, _, payload = self._read_record(offset - 1)
+        return self._decompressor.decompress(payload).decode("utf-8")
+
+    def responses(self) -> Iterator[NfeFetcherResponse]:
+        """Stored pages as fetcher responses, in the order they were archived."""
+        for _, _, url, payload in self._iter_records():
+            html = self._decompressor.decompress(payload).decode("utf-8")
+            yield NfeFetcherResponse(NfeUrl(url), html, NfeFetcherResponseType.HTML, True)
+
+    def parse(self, mode: ParseMode = ParseMode.FULL) -> Iterator[Nfe]:
+        for response in self.responses():
+            yield NfeParserFactory(response.url, response, mode).create().parse()
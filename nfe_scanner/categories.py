@@ -0,0 +1,157 @@
+import hashlib
+import json
+import logging
+from collections import deque
+from decimal import Decimal
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from nfe_scanner.models import Nfe, NfeItem
+from nfe_scanner.products import normalize_description
+
+LOGGER = logging.getLogger(__name__)
+
+UNCATEGORIZED = "UNCATEGORIZED"
+
+# bump when the cached tables change so stale caches are rebuilt
+CACHE_VERSION = 2
+
+
+class Categorizer:
+    """
+    Tags item descriptions with categories using a single Aho-Corasick automaton.
+
+    `rules` maps each category to its keywords. Keywords are matched as whole words over
+    the normalized description; the longest matching keyword wins, ties go to the category
+    declared first.
+    """
+
+    def __init__(self, rules: dict[str, list[str]]):
+        self.categories = list(rules)
+        self.fingerprint = rules_fingerprint(rules)
+        # node -> {char: node}, failure link and (keyword length, category index) outputs
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[tuple[int, int] | None] = [None]
+        for category_index, keywords in enumerate(rules.values()):
+            for keyword in keywords:
+                self._add_keyword(f" {normalize_description(keyword)} ", category_index)
+        self._build_failure_links()
+
+    @classmethod
+    def from_tables(cls, tables: dict) -> "Categorizer":
+        """Rebuild a categorizer from the plain data returned by `tables`."""
+        categorizer = cls.__new__(cls)
+        categorizer.categories = list(tables["categories"])
+        categorizer.fingerprint = tables["fingerprint"]
+        categorizer._goto = [dict(node) for node in tables["goto"]]
+        categorizer._fail = list(tables["fail"])
+        categorizer._output = [output and tuple(output) for output in tables["output"]]
+        return categorizer
+
+    def tables(self) -> dict:
+        """The compiled automaton as JSON-serializable data."""
+        return {
+            "categories": self.categories,
+            "fingerprint": self.fingerprint,
+            "goto": self._goto,
+            "fail": self._fail,
+            "output": self._output,
+        }
+
+    def _add_keyword(self, keyword: str, category_index: int):
+        node = 0
+        for char in keyword:
+            if (next_node := self._goto[node].get(char)) is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(None)
+            node = next_node
+        self._output[node] = best_output(self._output[node], (len(keyword), category_index))
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                self._output[child] = best_output(
+                    self._output[child], self._output[self._fail[child]]
+                )
+
+    def categorize(self, description: str) -> str:
+        goto, fail, output = self._goto, self._fail, self._output
+        best: tuple[int, int] | None = None
+        node = 0
+        for char in f" {normalize_description(description)} ":
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if output[node] is not None:
+                best = best_output(best, output[node])
+        return UNCATEGORIZED if best is None else self.categories[best[1]]
+
+    def categorize_items(self, items: Iterable[NfeItem]) -> Iterator[tuple[NfeItem, str]]:
+        for item in items:
+            yield item, self.categorize(item.description)
+
+    def category_totals(self, nfe: Nfe) -> dict[str, Decimal]:
+        totals: dict[str, Decimal] = {}
+        for item, category in self.categorize_items(nfe.items):
+            totals[category] = totals.get(category, Decimal(0)) + item.total_price
+        return totals
+
+
+def best_output(
+    current: tuple[int, int] | None, candidate: tuple[int, int] | None
+) -> tuple[int, int] | None:
+    if current is None:
+        return candidate
+    if candidate is None:
+        return current
+    # longer keyword first, then the category declared first
+    return min(current, candidate, key=lambda output: (-output[0], output[1]))
+
+
+def rules_fingerprint(rules: dict[str, list[str]]) -> str:
+    content = json.dumps([CACHE_VERSION, rules], ensure_ascii=False)
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def load_categorizer(rules_file: str | Path, cache_dir: str | Path | None = None) -> Categorizer:
+    """
+    Build the categorizer for a JSON rules file (`{"category": ["keyword", ...]}`).
+
+    The compiled automaton is stored as JSON in `cache_dir` (next to the rules file by
+    default) and reused while the rules do not change. The cache only holds data, a cache
+    built for other rules is ignored.
+    """
+    rules_file = Path(rules_file)
+    with open(rules_file, encoding="utf-8") as f:
+        rules: dict[str, list[str]] = json.load(f)
+
+    fingerprint = rules_fingerprint(rules)
+    cache_file = Path(cache_dir or rules_file.parent) / (
+        f".{rules_file.stem}-{fingerprint[:16]}.automaton.json"
+    )
+    if cache_file.exists():
+        try:
+            with open(cache_file, encoding="utf-8") as f:
+                tables = json.load(f)
+            if tables["fingerprint"] != fingerprint:
+                raise ValueError("built for other rules")
+            return Categorizer.from_tables(tables)
+        except Exception as err:
+            LOGGER.warning("Ignoring unreadable categorizer cache '%s': %s", cache_file, err)
+
+    categorizer = Categorizer(rules)
+    with open(cache_file, "w", encoding="utf-8") as f:
+        json.dump(categorizer.tables(), f, ensure_ascii=False, separators=(",", ":"))
+    LOGGER.debug("Categorizer cache written to '%s'.", cache_file)
+    return categorizer
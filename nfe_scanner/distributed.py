@@ -0,0 +1,480 @@
+import logging
+import os
+import socket
+import sqlite3
+import time
+import uuid
+import zlib
+from typing import Iterable, Iterator, NamedTuple
+
+import click
+
+from nfe_scanner.fetchers.base import NfeUrl
+from nfe_scanner.logs import configure_logging
+from nfe_scanner.models import Nfe
+from nfe_scanner.nfe import group_urls, index_urls, scan_nfe
+from nfe_scanner.parsers.base import ParseMode
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_SHARD_COUNT = 64
+DEFAULT_LEASE_SECONDS = 120
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_POLL_SECONDS = 10.0
+
+
+class ScanProgress(NamedTuple):
+    total: int
+    done: int
+    failed: int
+    pending: int
+    shards: int
+    shards_done: int
+    shards_leased: int
+    shards_failed: int
+
+    @property
+    def finished(self) -> bool:
+        return self.shards_done + self.shards_failed == self.shards
+
+    def __str__(self):
+        return (
+            f"{self.done + self.failed}/{self.total} NFe(s) scanned ({self.failed} failed), "
+            f"{self.shards_done}/{self.shards} shard(s) done, {self.shards_leased} leased, "
+            f"{self.shards_failed} failed"
+        )
+
+
+class ShardLease(NamedTuple):
+    shard: int
+    token: str
+    worker: str
+
+
+def shard_of(access_key: str, shard_count: int) -> int:
+    return zlib.crc32(access_key.encode("utf-8")) % shard_count
+
+
+def connect(filename: str = "nfe-work.db"):
+    # transactions are managed explicitly, leases are taken with BEGIN IMMEDIATE
+    connection = sqlite3.connect(filename, timeout=30, isolation_level=None)
+    # WAL needs shared memory between the processes, which does not work across the nodes
+    # of a network filesystem; the rollback journal only needs file locks
+    connection.execute("PRAGMA journal_mode=DELETE")
+    return connection
+
+
+def create_tables(connection):
+    connection.execute(
+        """
+    CREATE TABLE IF NOT EXISTS "work_shard" (
+        "shard"          INTEGER,
+        "status"         TEXT DEFAULT 'pending',
+        "worker"         TEXT,
+        "lease_token"    TEXT,
+        "lease_expires"  REAL,
+        "attempts"       INTEGER DEFAULT 0,
+        PRIMARY KEY("shard")
+    )
+    """
+    )
+
+    connection.execute(
+        """
+    CREATE TABLE IF NOT EXISTS "work_item" (
+        "access_key"   TEXT,
+        "url"          TEXT,
+        "shard"        INTEGER,
+        "status"       TEXT DEFAULT 'pending',
+        "worker"       TEXT,
+        "result"       TEXT,
+        "error"        TEXT,
+        PRIMARY KEY("access_key"),
+        FOREIGN KEY("shard") REFERENCES "work_shard"
+    )
+    """
+    )
+    connection.execute(
+        'CREATE INDEX IF NOT EXISTS "work_item_shard" ON "work_item" ("shard", "status")'
+    )
+
+
+class ScanCoordinator:
+    """
+    Shared work table for scans spread over several worker processes or nodes.
+
+    URLs are deduplicated by access key and sharded by its hash. Workers lease whole shards
+    for `lease_seconds` and renew the lease after every NFe; shards whose lease expired are
+    handed to the next worker asking for one. A result is only written while its shard lease
+    is held and its item is still pending, so each access key gets exactly one result even
+    when a slow worker loses its lease. A shard leased `max_attempts` times without being
+    finished, e.g. because it keeps crashing its workers, is marked failed along with its
+    pending items.
+
+    Every node must reach the database file through a filesystem with working locks, and
+    their clocks must be roughly in sync since lease expiry uses wall-clock time.
+    """
+
+    def __init__(
+        self,
+        filename: str = "nfe-work.db",
+        lease_seconds: int = DEFAULT_LEASE_SECONDS,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ):
+        self.filename = filename
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.connection = connect(filename)
+        create_tables(self.connection)
+
+    def submit(self, urls: Iterable[str], shard_count: int = DEFAULT_SHARD_COUNT) -> int:
+        """Queue URLs not seen before, returns how many access keys were added."""
+        rows = [
+            (access_key, nfe_urls[0].full, shard_of(access_key, shard_count))
+            for access_key, nfe_urls in index_urls(list(urls)).items()
+        ]
+        cursor = self.connection.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            added = 0
+            shards: set[int] = set()
+            for row in rows:
+                cursor.execute(
+                    "INSERT OR IGNORE INTO work_item (access_key, url, shard) VALUES (?, ?, ?)", row
+                )
+                if cursor.rowcount:
+                    shards.add(row[2])
+                    added += 1
+            # shards receiving new work are reopened, even if they were finished before
+            cursor.executemany(
+                """
+                INSERT INTO work_shard (shard) VALUES (?)
+                ON CONFLICT (shard) DO UPDATE SET status = 'pending', attempts = 0
+                WHERE status IN ('done', 'failed')
+                """,
+                [(shard,) for shard in shards],
+            )
+            cursor.execute("COMMIT")
+        except BaseException:
+            cursor.execute("ROLLBACK")
+            raise
+        LOGGER.info("Queued %d new NFe(s) out of %d access key(s).", added, len(rows))
+        return added
+
+    def lease(self, worker: str) -> ShardLease | None:
+        """Lease a pending shard, or one whose lease expired, None when there is no work left."""
+        now = time.time()
+        token = uuid.uuid4().hex
+        cursor = self.connection.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            self._fail_exhausted(cursor, now)
+            row = cursor.execute(
+                """
+                SELECT shard FROM work_shard
+                WHERE status = 'pending' OR (status = 'leased' AND lease_expires < ?)
+                ORDER BY attempts, shard LIMIT 1
+                """,
+                (now,),
+            ).fetchone()
+            if row is not None:
+                cursor.execute(
+                    """
+                    UPDATE work_shard SET status = 'leased', worker = ?, lease_token = ?,
+                        lease_expires = ?, attempts = attempts + 1
+                    WHERE shard = ?
+                    """,
+                    (worker, token, now + self.lease_seconds, row[0]),
+                )
+            cursor.execute("COMMIT")
+        except BaseException:
+            cursor.execute("ROLLBACK")
+            raise
+        if row is None:
+            return None
+        LOGGER.debug("Shard %d leased by %s.", row[0], worker)
+        return ShardLease(row[0], token, worker)
+
+    def _fail_exhausted(self, cursor, now: float):
+        """Give up on the shards up for lease that already used all their attempts."""
+        shards = [
+            shard
+            for (shard,) in cursor.execute(
+                """
+                SELECT shard FROM work_shard
+                WHERE (status = 'pending' OR (status = 'leased' AND lease_expires < ?))
+                    AND attempts >= ?
+                """,
+                (now, self.max_attempts),
+            ).fetchall()
+        ]
+        for shard in shards:
+            cursor.execute(
+                """
+                UPDATE work_shard SET status = 'failed', worker = NULL, lease_token = NULL,
+                    lease_expires = NULL
+                WHERE shard = ?
+                """,
+                (shard,),
+            )
+            cursor.execute(
+                "UPDATE work_item SET status = 'failed', error = ? "
+                "WHERE shard = ? AND status = 'pending'",
+                (f"Shard {shard} gave up after {self.max_attempts} attempt(s)", shard),
+            )
+            LOGGER.error("Shard %d failed after %d attempt(s).", shard, self.max_attempts)
+
+    def heartbeat(self, lease: ShardLease) -> bool:
+        """Extend a lease, returns False if it was lost in the meantime."""
+        cursor = self.connection.execute(
+            "UPDATE work_shard SET lease_expires = ? WHERE shard = ? AND lease_token = ?",
+            (time.time() + self.lease_seconds, lease.shard, lease.token),
+        )
+        return cursor.rowcount == 1
+
+    def pending_urls(self, lease: ShardLease) -> list[NfeUrl]:
+        rows = self.connection.execute(
+            "SELECT url FROM work_item WHERE shard = ? AND status = 'pending' ORDER BY access_key",
+            (lease.shard,),
+        )
+        return [NfeUrl(url) for (url,) in rows]
+
+    def complete(
+        self, lease: ShardLease, nfe_url: NfeUrl, nfe: Nfe | None = None, error: str | None = None
+    ) -> bool:
+        """Record the result (or error) of an URL, returns False if the lease was lost."""
+        cursor = self.connection.execute(
+            """
+            UPDATE work_item SET status = ?, worker = ?, result = ?, error = ?
+            WHERE access_key = ? AND status = 'pending' AND EXISTS (
+                SELECT 1 FROM work_shard WHERE shard = work_item.shard AND lease_token = ?
+            )
+            """,
+            (
+                "failed" if nfe is None else "done",
+                lease.worker,
+                None if nfe is None else nfe.json(),
+                error,
+                nfe_url.dedup_key,
+                lease.token,
+            ),
+        )
+        return cursor.rowcount == 1
+
+    def release(self, lease: ShardLease, finished: bool = True):
+        """
+        Give a shard back, done if `finished` and none of its items is pending anymore.
+
+        Items submitted while the shard was leased are not in the worker's snapshot, the
+        shard then goes back to the queue for them.
+        """
+        self.connection.execute(
+            """
+            UPDATE work_shard SET
+                status = CASE WHEN ? AND NOT EXISTS (
+                    SELECT 1 FROM work_item
+                    WHERE shard = work_shard.shard AND status = 'pending'
+                ) THEN 'done' ELSE 'pending' END,
+                worker = NULL, lease_token = NULL, lease_expires = NULL
+            WHERE shard = ? AND lease_token = ?
+            """,
+            (finished, lease.shard, lease.token),
+        )
+
+    def next_lease_time(self) -> float | None:
+        """
+        When a shard can next be leased, now if one is pending, None once all are finished.
+        """
+        (next_time,) = self.connection.execute(
+            """
+            SELECT min(CASE status WHEN 'pending' THEN 0 ELSE lease_expires END)
+            FROM work_shard WHERE status IN ('pending', 'leased')
+            """
+        ).fetchone()
+        return next_time
+
+    def requeue_expired(self) -> int:
+        """Put shards back in the queue when their worker stopped sending heartbeats."""
+        cursor = self.connection.execute(
+            """
+            UPDATE work_shard SET status = 'pending', worker = NULL, lease_token = NULL,
+                lease_expires = NULL
+            WHERE status = 'leased' AND lease_expires < ?
+            """,
+            (time.time(),),
+        )
+        if cursor.rowcount:
+            LOGGER.warning("Requeued %d shard(s) with expired leases.", cursor.rowcount)
+        return cursor.rowcount
+
+    def progress(self) -> ScanProgress:
+        items = dict(
+            self.connection.execute("SELECT status, count(*) FROM work_item GROUP BY status")
+        )
+        shards = dict(
+            self.connection.execute("SELECT status, count(*) FROM work_shard GROUP BY status")
+        )
+        return ScanProgress(
+            total=sum(items.values()),
+            done=items.get("done", 0),
+            failed=items.get("failed", 0),
+            pending=items.get("pending", 0),
+            shards=sum(shards.values()),
+            shards_done=shards.get("done", 0),
+            shards_leased=shards.get("leased", 0),
+            shards_failed=shards.get("failed", 0),
+        )
+
+    def results(self) -> Iterator[Nfe]:
+        for (result,) in self.connection.execute(
+            "SELECT result FROM work_item WHERE status = 'done' ORDER BY access_key"
+        ):
+            yield Nfe.parse_raw(result)
+
+    def errors(self) -> Iterator[tuple[str, str]]:
+        yield from self.connection.execute(
+            "SELECT url, error FROM work_item WHERE status = 'failed' ORDER BY access_key"
+        )
+
+    def watch(self, interval: float = 10):
+        """Requeue expired leases and log progress until every shard is done or failed."""
+        while True:
+            self.requeue_expired()
+            progress = self.progress()
+            LOGGER.info("%s", progress)
+            if progress.finished:
+                return progress
+            time.sleep(interval)
+
+
+def default_worker_name() -> str:
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+class ScanWorker:
+    """
+    Leases shards from a coordinator database and scans their URLs until no work is left.
+
+    While other workers still hold leases, the worker waits for them to expire, at most
+    `poll_seconds` at a time, so the shards of a crashed node are picked up by the others.
+    """
+
+    def __init__(
+        self,
+        coordinator: ScanCoordinator,
+        name: str | None = None,
+        mode: ParseMode = ParseMode.FULL,
+        poll_seconds: float = DEFAULT_POLL_SECONDS,
+    ):
+        self.coordinator = coordinator
+        self.name = name or default_worker_name()
+        self.mode = mode
+        self.poll_seconds = poll_seconds
+
+    def run(self, max_shards: int | None = None) -> int:
+        """Returns the number of shards processed."""
+        processed = 0
+        while max_shards is None or processed < max_shards:
+            if (lease := self.coordinator.lease(self.name)) is None:
+                if (next_time := self.coordinator.next_lease_time()) is None:
+                    break
+                time.sleep(min(max(next_time - time.time(), 0), self.poll_seconds))
+                continue
+            self.process_shard(lease)
+            processed += 1
+        LOGGER.info("Worker %s processed %d shard(s).", self.name, processed)
+        return processed
+
+    def process_shard(self, lease: ShardLease):
+        try:
+            finished = self.scan_shard(lease)
+        except BaseException:
+            self.coordinator.release(lease, finished=False)
+            raise
+        self.coordinator.release(lease, finished)
+
+    def scan_shard(self, lease: ShardLease) -> bool:
+        """Returns False when the lease was lost and the shard is left to another worker."""
+        for entry, nfe_urls in group_urls(self.coordinator.pending_urls(lease)).items():
+            session = entry.fetcher.create_session() if entry else None
+            for nfe_url in nfe_urls:
+                try:
+                    nfe = scan_nfe(nfe_url, session, self.mode)
+                except Exception as err:
+                    # transport errors included, one bad URL must not take the worker down
+                    LOGGER.warning("Failed to scan NFe %s: %r", nfe_url, err)
+                    completed = self.coordinator.complete(lease, nfe_url, error=repr(err))
+                else:
+                    completed = self.coordinator.complete(lease, nfe_url, nfe=nfe)
+                if not (completed and self.coordinator.heartbeat(lease)):
+                    LOGGER.warning("Lease of shard %d lost by %s.", lease.shard, self.name)
+                    return False
+        return True
+
+
+@click.group()
+@click.option(
+    "--db",
+    "filename",
+    default="nfe-work.db",
+    show_default=True,
+    type=click.Path(dir_okay=False),
+    help="Work table shared by the coordinator and the workers.",
+)
+@click.option("--lease", "lease_seconds", default=DEFAULT_LEASE_SECONDS, show_default=True)
+@click.option(
+    "--max-attempts",
+    default=DEFAULT_MAX_ATTEMPTS,
+    show_default=True,
+    help="Leases of a shard before it is marked failed.",
+)
+@click.option(
+    "--log-level",
+    type=click.Choice(["DEBUG", "INFO", "WARNING", "ERROR"], case_sensitive=False),
+    default="INFO",
+    show_default=True,
+)
+@click.pass_context
+def cli(ctx: click.Context, filename: str, lease_seconds: int, max_attempts: int, log_level: str):
+    """Scan NFes across several processes or nodes"""
+    configure_logging(log_level.upper())
+    ctx.obj = ScanCoordinator(filename, lease_seconds, max_attempts)
+
+
+@cli.command()
+@click.argument("urls_file", type=click.File("r", encoding="utf-8"))
+@click.option("--shards", "shard_count", default=DEFAULT_SHARD_COUNT, show_default=True)
+@click.pass_obj
+def submit(coordinator: ScanCoordinator, urls_file, shard_count: int):
+    """Queue the URLs of a file, one per line"""
+    coordinator.submit((line.strip() for line in urls_file if line.strip()), shard_count)
+
+
+@cli.command()
+@click.option("--name", help="Worker name, defaults to hostname-pid.")
+@click.option("--max-shards", type=int)
+@click.option(
+    "--poll",
+    "poll_seconds",
+    default=DEFAULT_POLL_SECONDS,
+    show_default=True,
+    help="Longest wait for the leases of other workers to expire.",
+)
+@click.pass_obj
+def work(
+    coordinator: ScanCoordinator, name: str | None, max_shards: int | None, poll_seconds: float
+):
+    """Scan leased shards until every shard is done or failed"""
+    ScanWorker(coordinator, name, poll_seconds=poll_seconds).run(max_shards)
+
+
+@cli.command()
+@click.option("--interval", default=10.0, show_default=True)
+@click.pass_obj
+def watch(coordinator: ScanCoordinator, interval: float):
+    """Requeue expired leases and report progress until the scan is done"""
+    coordinator.watch(interval)
+
+
+if __name__ == "__main__":
+    cli()
@@ -8,3 +8,19 @@ class NfeFetcherException(NfeBaseException):
 
 class NfeParserException(NfeBaseException):
     pass
+
+
+class NfeUnknownLayoutException(NfeParserException):
+    pass
+
+
+class NfeValidationException(NfeBaseException):
+    pass
+
+
+class NfeArchiveException(NfeBaseException):
+    pass
+
+
+class NfeReceiptException(NfeBaseException):
+    pass
@@ -1,10 +1,13 @@
 import logging
 from abc import ABC, abstractmethod
 from enum import Enum
+from typing import Any
 
 from furl import furl
 from pydash import py_
 
+from nfe_scanner.access_key import AccessKeyInfo, decode_access_key, extract_access_key
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -16,6 +19,18 @@ class NfeUrl:
         self.full = url
         self.host = host
         self.access_key = access_key
+        self.canonical_access_key: str | None = extract_access_key(access_key)
+
+    @property
+    def access_key_info(self) -> AccessKeyInfo | None:
+        if self.canonical_access_key is None:
+            return None
+        return decode_access_key(self.canonical_access_key)
+
+    @property
+    def dedup_key(self) -> str:
+        """Key identifying the receipt, falling back to the raw parameter if not canonical."""
+        return self.canonical_access_key or self.access_key
 
     def validate_url(self, url: str) -> tuple[str, str]:
         furl_url = furl(url)
@@ -47,12 +62,13 @@ class NfeUrl:
 class NfeFetcherResponseType(Enum):
     HTML = "html"
     JSON = "json"
+    XML = "xml"
 
 
 class NfeFetcherResponse:
     def __init__(
         self,
-        url: NfeUrl,
+        url: NfeUrl | None,
         raw: str,
         response_type: NfeFetcherResponseType,
         is_success: bool = False,
@@ -65,7 +81,7 @@ class NfeFetcherResponse:
         self._type = response_type
 
     @property
-    def url(self) -> NfeUrl:
+    def url(self) -> NfeUrl | None:
         return self._url
 
     @property
@@ -86,8 +102,9 @@ class NfeFetcherResponse:
 
 
 class NfeFetcher(ABC):
-    def __init__(self, url: NfeUrl):
+    def __init__(self, url: NfeUrl, session: Any = None):
         self.url: NfeUrl = url
+        self.session = session
         self.raw_content: str | None = None
 
     @abstractmethod
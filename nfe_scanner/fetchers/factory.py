@@ -1,8 +1,9 @@
 import logging
+from typing import Any
 
 from nfe_scanner.exceptions import NfeFetcherException
 from nfe_scanner.fetchers.base import NfeFetcher, NfeUrl
-from nfe_scanner.fetchers.html import NfeHtmlFetcher
+from nfe_scanner.registry import REGISTRY
 
 LOGGER = logging.getLogger(__name__)
 
@@ -11,12 +12,13 @@ class NfeFetcherFactory:
     SEFAZ_RS_HOSTNAME = "www.sefaz.rs.gov.br"
     SEFAZ_RS_V2_HOSTNAME = "dfe-portal.svrs.rs.gov.br"
 
-    def __init__(self, nfe_url: NfeUrl):
+    def __init__(self, nfe_url: NfeUrl, session: Any = None):
         self.nfe_url = nfe_url
+        self.session = session
 
     def create(self) -> NfeFetcher:
-        if self.nfe_url.host in (self.SEFAZ_RS_HOSTNAME, self.SEFAZ_RS_V2_HOSTNAME):
-            return NfeHtmlFetcher(self.nfe_url)
+        if entry := REGISTRY.lookup(self.nfe_url.host):
+            return entry.fetcher(self.nfe_url, session=self.session)
 
         raise NfeFetcherException(
             f"URL is not associated to any available fetcher. url='{self.nfe_url.full}'"
@@ -1,12 +1,16 @@
 import logging
+from datetime import timedelta
 
+from requests import RequestException
 from requests_html import HTMLResponse, HTMLSession
 
+from nfe_scanner.exceptions import NfeFetcherException
 from nfe_scanner.fetchers.base import (
     NfeFetcher,
     NfeFetcherResponse,
     NfeFetcherResponseType,
 )
+from nfe_scanner.profiling import PROFILER, stage, timed
 
 LOGGER = logging.getLogger(__name__)
 
@@ -17,17 +21,36 @@ class NfeHtmlParser:
 
 
 class NfeHtmlFetcher(NfeFetcher):
+    @classmethod
+    def create_session(cls) -> HTMLSession:
+        return HTMLSession()
+
+    @timed("fetch")
     def fetch(self) -> NfeFetcherResponse:
         LOGGER.info("Fetching NFe %s.", self.url)
-        session = HTMLSession()
-        resp: HTMLResponse = session.get(self.url.full)
+        session = self.session or HTMLSession()
+        resp: HTMLResponse = self.get(session, self.url.full)
         resp = self.maybe_process_iframe(session, resp)
         return NfeFetcherResponse(self.url, resp.text, NfeFetcherResponseType.HTML, resp.ok)
 
     @staticmethod
+    def get(session: HTMLSession, url: str) -> HTMLResponse:
+        try:
+            with stage("fetch.http_get"):
+                resp: HTMLResponse = session.get(url)
+        except RequestException as err:
+            raise NfeFetcherException(f"Could not fetch {url}: {err!r}") from err
+        if PROFILER.enabled and isinstance(resp.elapsed, timedelta):
+            # time until response headers, i.e. connection setup plus SEFAZ processing
+            PROFILER.observe("fetch.http_response_headers", resp.elapsed.total_seconds())
+        PROFILER.count("fetch.requests")
+        return resp
+
+    @staticmethod
+    @timed("fetch.iframe")
     def maybe_process_iframe(session: HTMLSession, resp: HTMLResponse) -> HTMLResponse:
         if iframe := resp.html.find("iframe", first=True):
             iframe_source = iframe.attrs.get("src")
             LOGGER.debug("Fetching URL from iframe '%s'", iframe_source)
-            return session.get(iframe_source)
+            return NfeHtmlFetcher.get(session, iframe_source)
         return resp
@@ -0,0 +1,69 @@
+import logging
+
+from nfe_scanner.models import Nfe, NfeIssuer, NfeItem
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 100_000
+
+
+class InternPool:
+    """
+    Shares instances that repeat across receipts of the same stores.
+
+    Issuers (and their addresses) are keyed by their whole value, so receipts of the same
+    CNPJ with a different name, address or IE keep their own issuer. Item barcode and
+    description strings are keyed by the (barcode, description) pair. `NfeIssuer` and
+    `Address` are frozen, so sharing them between `Nfe` objects is safe.
+
+    The pool is emptied once it holds `max_entries`, so it never grows without bound.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._issuers: dict[NfeIssuer, NfeIssuer] = {}
+        self._item_strings: dict[tuple[str, str], tuple[str, str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._issuers) + len(self._item_strings)
+
+    def clear(self):
+        self._issuers.clear()
+        self._item_strings.clear()
+
+    def _check_size(self):
+        if len(self) >= self.max_entries:
+            LOGGER.debug("Intern pool reached %d entries, clearing it.", self.max_entries)
+            self.clear()
+
+    def issuer(self, issuer: NfeIssuer) -> NfeIssuer:
+        """The pooled issuer equal to `issuer`, which is pooled if it was not seen before."""
+        if (pooled := self._issuers.get(issuer)) is None:
+            self._check_size()
+            pooled = self._issuers[issuer] = issuer
+        return pooled
+
+    def item_strings(self, barcode: str, description: str) -> tuple[str, str]:
+        key = (barcode, description)
+        if (pooled := self._item_strings.get(key)) is None:
+            self._check_size()
+            pooled = self._item_strings[key] = key
+        return pooled
+
+    def intern_item(self, item: NfeItem) -> NfeItem:
+        barcode, description = self.item_strings(item.barcode, item.description)
+        # items are mutable, replace the fields in place instead of sharing the instance
+        item.__dict__["barcode"] = barcode
+        item.__dict__["description"] = description
+        return item
+
+    def intern_nfe(self, nfe: Nfe) -> Nfe:
+        """Swap the issuer and item strings of an already built Nfe, e.g. a deserialized one."""
+        nfe.issuer = self.issuer(nfe.issuer)
+        if "items" in nfe.__dict__:
+            for item in nfe.items:
+                self.intern_item(item)
+        return nfe
+
+
+INTERN_POOL = InternPool()
@@ -0,0 +1,137 @@
+import atexit
+import logging
+import multiprocessing
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, TextIO
+
+from nfe_scanner import CLI_FORMAT
+
+LOGGER = logging.getLogger(__name__)
+
+# distinct messages tracked by the rate limiter before its state is reset
+MAX_TRACKED_MESSAGES = 10_000
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Lets each distinct warning through at most `burst` times every `interval` seconds.
+
+    Records below `level` are never dropped. The first record let through after a window
+    with suppressed repetitions reports how many were dropped.
+    """
+
+    def __init__(self, burst: int = 5, interval: float = 60.0, level: int = logging.WARNING):
+        super().__init__()
+        self.burst = burst
+        self.interval = interval
+        self.level = level
+        # (logger, message) -> [window start, records in the window, suppressed records]
+        self._windows: dict[tuple[str, str], list] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno < self.level:
+            return True
+
+        now = time.monotonic()
+        message = record.getMessage()
+        key = (record.name, message)
+        if (window := self._windows.get(key)) is None:
+            if len(self._windows) >= MAX_TRACKED_MESSAGES:
+                self._windows.clear()
+            window = self._windows[key] = [now, 0, 0]
+        elif now - window[0] >= self.interval:
+            window[0], window[1] = now, 0
+
+        window[1] += 1
+        if window[1] > self.burst:
+            window[2] += 1
+            return False
+        if window[2]:
+            record.msg, record.args = f"{message} ({window[2]} similar message(s) suppressed)", None
+            window[2] = 0
+        return True
+
+
+_LISTENER: QueueListener | None = None
+# records of process pool workers, created with the first pool
+_WORKER_LISTENER: QueueListener | None = None
+
+
+def configure_logging(
+    level: int | str = logging.INFO, fmt: str = CLI_FORMAT, stream: TextIO | None = None
+) -> QueueListener:
+    """
+    Route the root logger through a queue so callers never block on the output stream.
+
+    Records are formatted by the caller and written by a background thread to `stream`
+    (stderr by default). Repeated warnings are rate limited before they are queued.
+    Importing the package configures nothing, applications and workers call this once.
+    Process pools pass `pool_logging()` to have their workers logging here as well.
+    """
+    global _LISTENER  # pylint: disable=global-statement
+    stop_logging()
+
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(logging.Formatter(fmt))
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.addFilter(RateLimitFilter())
+
+    root = logging.getLogger()
+    for root_handler in root.handlers[:]:
+        root.removeHandler(root_handler)
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+    logging.getLogger("urllib3.connectionpool").setLevel(logging.WARN)
+
+    _LISTENER = QueueListener(log_queue, handler)
+    _LISTENER.start()
+    return _LISTENER
+
+
+def pool_logging() -> dict[str, Any]:
+    """
+    `initializer` and `initargs` of a `ProcessPoolExecutor` sending the records of its
+    workers to the output set up by `configure_logging`.
+
+    Forked workers inherit the queue of this process, a copy nothing reads, so they get a
+    multiprocessing queue instead. Empty when logging was not configured.
+    """
+    global _WORKER_LISTENER  # pylint: disable=global-statement
+    if _LISTENER is None:
+        return {}
+    if _WORKER_LISTENER is None:
+        log_queue: multiprocessing.Queue = multiprocessing.Queue()
+        _WORKER_LISTENER = QueueListener(log_queue, *_LISTENER.handlers)
+        _WORKER_LISTENER.start()
+    return {
+        "initializer": install_worker_logging,
+        "initargs": (_WORKER_LISTENER.queue, logging.getLogger().level),
+    }
+
+
+def install_worker_logging(log_queue: multiprocessing.Queue, level: int):
+    """Pool initializer, replaces the inherited handlers by the queue of the parent."""
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.addFilter(RateLimitFilter())
+    root = logging.getLogger()
+    for root_handler in root.handlers[:]:
+        root.removeHandler(root_handler)
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+
+
+def stop_logging():
+    """Flush the queued records and stop the background writers, if any."""
+    global _LISTENER, _WORKER_LISTENER  # pylint: disable=global-statement
+    if _WORKER_LISTENER is not None:
+        _WORKER_LISTENER.stop()
+        _WORKER_LISTENER = None
+    if _LISTENER is not None:
+        _LISTENER.stop()
+        _LISTENER = None
+
+
+atexit.register(stop_logging)
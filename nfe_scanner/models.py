@@ -1,8 +1,9 @@
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
+from typing import Callable
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 
 class MetricUnit(Enum):
@@ -21,6 +22,11 @@ class Address(BaseModel):
     country: str | None
     zip_code: str | None
 
+    class Config:
+        # shared between receipts by the intern pool
+        frozen = True
+        copy_on_model_validation = "none"
+
 
 class NfeItem(BaseModel):
     barcode: str
@@ -33,6 +39,9 @@ class NfeItem(BaseModel):
     def __str__(self) -> str:
         return f"{self.description} ({self.quantity} {self.metric_unit.value} * {self.unitary_price} = R${self.total_price})"
 
+    class Config:
+        copy_on_model_validation = "none"
+
 
 class NfeIssuer(BaseModel):
     name: str
@@ -40,6 +49,10 @@ class NfeIssuer(BaseModel):
     state_registration_code: str | None
     address: Address
 
+    class Config:
+        frozen = True
+        copy_on_model_validation = "none"
+
 
 class NfeConsumer(BaseModel):
     identification: str
@@ -61,9 +74,34 @@ class Nfe(BaseModel):
     access_key: str
     total_amount: Decimal
     total_discounts: Decimal
+    # freight, insurance, taxes and other amounts the total adds on top of the items
+    total_charges: Decimal = Decimal("0.00")
     payment_type: PaymentType
     raw_html: str
     items: list[NfeItem] = []
+    _items_loader: Callable[[], list[NfeItem]] | None = PrivateAttr(default=None)
+
+    @classmethod
+    def with_lazy_items(cls, items_loader: Callable[[], list[NfeItem]], **fields) -> "Nfe":
+        """Build an Nfe whose items are only parsed the first time they are accessed."""
+        nfe = cls(**fields)
+        nfe._items_loader = items_loader
+        del nfe.__dict__["items"]
+        return nfe
+
+    def __getattr__(self, name: str):
+        # only reached while `items` is still missing from the instance dict
+        if name != "items" or self._items_loader is None:
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+        items, self._items_loader = self._items_loader(), None
+        self.__dict__["items"] = items
+        return items
+
+    def _iter(self, *args, **kwargs):
+        # dict(), json() and copy() read the instance dict directly
+        if "items" not in self.__dict__:
+            _ = self.items
+        return super()._iter(*args, **kwargs)
 
     def __lt__(self, other: "Nfe"):
         return self.issued_date < other.issued_date
@@ -1,23 +1,141 @@
+import logging
+from typing import Any, Callable, Hashable, Iterator
+
+from nfe_scanner.access_key import AccessKeyInfo
+from nfe_scanner.exceptions import NfeBaseException, NfeParserException
 from nfe_scanner.fetchers.base import NfeFetcher, NfeFetcherResponse, NfeUrl
 from nfe_scanner.fetchers.factory import NfeFetcherFactory
 from nfe_scanner.models import Nfe
-from nfe_scanner.parsers.base import NfeParser
+from nfe_scanner.parsers.base import PARSER_ERRORS, NfeParser, ParseMode
 from nfe_scanner.parsers.factory import NfeParserFactory
+from nfe_scanner.registry import REGISTRY, NfeRegistryEntry
+
+LOGGER = logging.getLogger(__name__)
 
 
-def scan_nfe(url: str) -> Nfe:
-    nfe_url = NfeUrl(url)
-    fetcher: NfeFetcher = NfeFetcherFactory(nfe_url).create()
+def scan_nfe(url: str | NfeUrl, session: Any = None, mode: ParseMode = ParseMode.FULL) -> Nfe:
+    nfe_url = url if isinstance(url, NfeUrl) else NfeUrl(url)
+    fetcher: NfeFetcher = NfeFetcherFactory(nfe_url, session).create()
     response: NfeFetcherResponse = fetcher.fetch()
-    parser: NfeParser = NfeParserFactory(nfe_url, response).create()
+    parser: NfeParser = NfeParserFactory(nfe_url, response, mode).create()
 
-    return parser.parse()
+    try:
+        return parser.parse()
+    except PARSER_ERRORS as err:
+        raise NfeParserException(
+            f"{parser.__class__.__name__} failed to parse {nfe_url}: {err!r}"
+        ) from err
 
 
-def scan_multiple_nfe(urls: list[str]) -> list[Nfe]:
-    nfes: list[Nfe] = []
+def index_urls(urls: list[str]) -> dict[str, list[NfeUrl]]:
+    """Group URLs by access key, keeping the order in which each key was first seen."""
+    index: dict[str, list[NfeUrl]] = {}
 
     for url in urls:
-        nfes.append(scan_nfe(url))
+        nfe_url = NfeUrl(url)
+        index.setdefault(nfe_url.dedup_key, []).append(nfe_url)
+
+    return index
+
+
+def filter_urls(
+    nfe_urls: list[NfeUrl],
+    states: set[str] | None = None,
+    start_period: tuple[int, int] | None = None,
+    end_period: tuple[int, int] | None = None,
+) -> list[NfeUrl]:
+    """
+    Select URLs by the state and issue (year, month) encoded in their access keys.
+
+    URLs without a canonical access key are kept since nothing can be known before fetching.
+    """
+    selected: list[NfeUrl] = []
+
+    for nfe_url in nfe_urls:
+        if (info := nfe_url.access_key_info) is not None:
+            if states is not None and info.state not in states:
+                continue
+            if start_period is not None and info.period < start_period:
+                continue
+            if end_period is not None and info.period > end_period:
+                continue
+        selected.append(nfe_url)
+
+    return selected
+
+
+def partition_urls(
+    nfe_urls: list[NfeUrl], key: Callable[[AccessKeyInfo], Hashable]
+) -> dict[Hashable, list[NfeUrl]]:
+    """
+    Shard URLs by a function of their decoded access key, e.g. `lambda info: info.state`.
+
+    URLs without a canonical access key are grouped under None.
+    """
+    partitions: dict[Hashable, list[NfeUrl]] = {}
+
+    for nfe_url in nfe_urls:
+        info = nfe_url.access_key_info
+        partitions.setdefault(None if info is None else key(info), []).append(nfe_url)
+
+    return partitions
+
+
+def group_urls(nfe_urls: list[NfeUrl]) -> dict[NfeRegistryEntry | None, list[NfeUrl]]:
+    """Group URLs by the registry entry handling their host, None for unsupported hosts."""
+    groups: dict[NfeRegistryEntry | None, list[NfeUrl]] = {}
+
+    for nfe_url in nfe_urls:
+        groups.setdefault(REGISTRY.lookup(nfe_url.host), []).append(nfe_url)
+
+    return groups
+
+
+def log_scan_error(nfe_url: NfeUrl, err: NfeBaseException):
+    LOGGER.warning("Skipping NFe %s: %s", nfe_url, err)
+
+
+def iter_scan_multiple_nfe(
+    urls: list[str],
+    mode: ParseMode = ParseMode.FULL,
+    on_error: Callable[[NfeUrl, NfeBaseException], None] = log_scan_error,
+) -> Iterator[tuple[NfeUrl, Nfe]]:
+    """Scan the URLs once per access key, yielding each NFe as soon as it is parsed."""
+    unique_urls: list[NfeUrl] = []
+
+    for access_key, nfe_urls in index_urls(urls).items():
+        if len(nfe_urls) > 1:
+            LOGGER.info(
+                "Skipping %d duplicated URL(s) for access key %s: %s",
+                len(nfe_urls) - 1,
+                access_key,
+                [nfe_url.full for nfe_url in nfe_urls[1:]],
+            )
+        unique_urls.append(nfe_urls[0])
+
+    for entry, nfe_urls in group_urls(unique_urls).items():
+        # URLs handled by the same fetcher share its session (connection pool, cookies)
+        session = entry.fetcher.create_session() if entry else None
+        for nfe_url in nfe_urls:
+            try:
+                nfe = scan_nfe(nfe_url, session, mode)
+            except NfeBaseException as err:
+                on_error(nfe_url, err)
+                continue
+            yield nfe_url, nfe
+
 
-    return nfes
+def scan_multiple_nfe(
+    urls: list[str],
+    mode: ParseMode = ParseMode.FULL,
+    on_error: Callable[[NfeUrl, NfeBaseException], None] = log_scan_error,
+) -> list[Nfe]:
+    nfes_by_key = {
+        nfe_url.dedup_key: nfe for nfe_url, nfe in iter_scan_multiple_nfe(urls, mode, on_error)
+    }
+    # results come grouped by host, give them back in the order of the input
+    return [
+        nfes_by_key[key]
+        for key in dict.fromkeys(NfeUrl(url).dedup_key for url in urls)
+        if key in nfes_by_key
+    ]
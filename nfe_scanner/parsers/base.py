@@ -1,16 +1,62 @@
 import logging
 from abc import ABC, abstractmethod
+from enum import Enum
+from typing import Callable
 
+from nfe_scanner.exceptions import NfeParserException
 from nfe_scanner.fetchers.base import NfeFetcherResponse
-from nfe_scanner.models import Nfe
+from nfe_scanner.models import Nfe, NfeItem
 
 LOGGER = logging.getLogger(__name__)
 
+# layout changes surface deep inside the parsers as one of these, e.g. a malformed amount
+# raises decimal.InvalidOperation, an ArithmeticError
+PARSER_ERRORS = (
+    ArithmeticError,
+    AssertionError,
+    AttributeError,
+    IndexError,
+    KeyError,
+    TypeError,
+    ValueError,
+)
+
+
+class ParseMode(Enum):
+    FULL = "full"
+    LAZY_ITEMS = "lazy_items"
+    HEADER_ONLY = "header_only"
+
 
 class NfeParser(ABC):
-    def __init__(self, nfe_response: NfeFetcherResponse):
+    def __init__(self, nfe_response: NfeFetcherResponse, mode: ParseMode = ParseMode.FULL):
         self.nfe_response: NfeFetcherResponse = nfe_response
+        self.mode = mode
 
     @abstractmethod
     def parse(self) -> Nfe:
         pass
+
+    def build_nfe(self, items_loader: Callable[[], list[NfeItem]], **fields) -> Nfe:
+        if self.mode == ParseMode.HEADER_ONLY:
+            return Nfe(**fields)
+        if self.mode == ParseMode.LAZY_ITEMS:
+            return Nfe.with_lazy_items(self.guard_items_loader(items_loader), **fields)
+        return Nfe(**fields, items=items_loader())
+
+    def guard_items_loader(
+        self, items_loader: Callable[[], list[NfeItem]]
+    ) -> Callable[[], list[NfeItem]]:
+        """Report errors of a deferred items parse as parser failures, like `parse()`."""
+        # the loader must not keep the parser alive, it holds the whole response
+        parser_name, nfe_url = self.__class__.__name__, self.nfe_response.url
+
+        def load_items() -> list[NfeItem]:
+            try:
+                return items_loader()
+            except PARSER_ERRORS as err:
+                raise NfeParserException(
+                    f"{parser_name} failed to parse the items of {nfe_url}: {err!r}"
+                ) from err
+
+        return load_items
@@ -20,7 +20,7 @@ def parse_metric_unit(unit: str) -> MetricUnit:
     if normalized_unit in ("KG", "KG0001"):
         return MetricUnit.KG
     if normalized_unit not in ("UN", "UNID", "EX", "AVULSO", "POTE", "CAIXA", "FRASCO"):
-        LOGGER.info(
+        LOGGER.warning(
             "Unit '%s' not recognized. Falling back to '%s'", normalized_unit, MetricUnit.UNIT
         )
     return MetricUnit.UNIT
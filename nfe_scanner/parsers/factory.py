@@ -1,9 +1,10 @@
 import logging
 
-from nfe_scanner.exceptions import NfeParserException
+from nfe_scanner.exceptions import NfeParserException, NfeUnknownLayoutException
 from nfe_scanner.fetchers.base import NfeFetcherResponse, NfeFetcherResponseType, NfeUrl
-from nfe_scanner.parsers.base import NfeParser
-from nfe_scanner.parsers.html import NfeHtmlParser, NfeHtmlParser2
+from nfe_scanner.parsers.base import NfeParser, ParseMode
+from nfe_scanner.profiling import timed
+from nfe_scanner.registry import REGISTRY, NfeLayoutRegistry
 
 LOGGER = logging.getLogger(__name__)
 
@@ -13,15 +14,35 @@ class NfeParserFactory:
     SEFAZ_RS_HOSTNAME = "www.sefaz.rs.gov.br"
     SEFAZ_RS_V2_HOSTNAME = "dfe-portal.svrs.rs.gov.br"
 
-    def __init__(self, url: NfeUrl, nfe_response: NfeFetcherResponse):
+    def __init__(
+        self,
+        url: NfeUrl | None,
+        nfe_response: NfeFetcherResponse,
+        mode: ParseMode = ParseMode.FULL,
+    ):
         self.url = url
         self.nfe_response = nfe_response
+        self.mode = mode
 
+    @timed("parser_factory.create")
     def create(self) -> NfeParser:
-        if self.nfe_response.type == NfeFetcherResponseType.HTML:
-            if self.url.host in (self.SEFAZ_RS_HOSTNAME, self.SEFAZ_RS_V2_HOSTNAME):
-                return NfeHtmlParser2(self.nfe_response)
+        if self.url and (entry := REGISTRY.lookup(self.url.host)):
+            if entry.layouts and self.nfe_response.type == NfeFetcherResponseType.HTML:
+                return self._create_from_layout(entry.layouts)
+            if parser_class := entry.parser(self.nfe_response.type):
+                return parser_class(self.nfe_response, self.mode)
+
+        if parser_class := REGISTRY.default_parser(self.nfe_response.type):
+            return parser_class(self.nfe_response, self.mode)
 
         raise NfeParserException(
             f"No parser associated with response of type {self.nfe_response.type}"
         )
+
+    def _create_from_layout(self, layouts: NfeLayoutRegistry) -> NfeParser:
+        layout, fingerprint = layouts.detect(self.nfe_response.text)
+        if layout is None:
+            raise NfeUnknownLayoutException(
+                f"Page layout is not recognized. fingerprint='{fingerprint}' url='{self.url.full}'"
+            )
+        return layout.parser(self.nfe_response, self.mode)
@@ -1,9 +1,12 @@
 import re
 from datetime import datetime
 from decimal import Decimal
+from typing import Callable
 
+import soupsieve
 from bs4 import BeautifulSoup
 
+from nfe_scanner.interning import INTERN_POOL
 from nfe_scanner.models import (
     Address,
     Nfe,
@@ -12,17 +15,42 @@ from nfe_scanner.models import (
     NfeItem,
     PaymentType,
 )
-from nfe_scanner.parsers.base import NfeParser
+from nfe_scanner.parsers.base import NfeParser, ParseMode
 from nfe_scanner.parsers.common import Value
+from nfe_scanner.profiling import stage, timed
 
+ITEM_ROWS_SELECTOR = soupsieve.compile("tr[id^=Item]")
+ITEM_ROWS_PATTERN = re.compile(r"<tr[^>]*\bid=\"Item[^\"]*\".*?</tr>", re.S)
 
+
+@timed("parse.to_bs")
 def to_bs(html: str) -> BeautifulSoup:
     return BeautifulSoup(html, "html.parser")
 
 
+def lazy_items_loader(
+    text: str, parse_items: Callable[[BeautifulSoup], list[NfeItem]]
+) -> Callable[[], list[NfeItem]]:
+    """
+    Loader parsing the items on first access from the item rows of the page.
+
+    Only the rows are kept until then, not the page nor its tree.
+    """
+    rows = "<table>" + "".join(ITEM_ROWS_PATTERN.findall(text)) + "</table>"
+    return lambda: parse_items(to_bs(rows))
+
+
 class NfeHtmlParser(NfeParser):
+    @timed("parse")
     def parse(self) -> Nfe:
         html = to_bs(self.nfe_response.text)
+        if self.mode == ParseMode.LAZY_ITEMS:
+            items_loader = lazy_items_loader(self.nfe_response.text, NfeHtmlParser._parse_nfe_items)
+        else:
+
+            def items_loader() -> list[NfeItem]:
+                return self._parse_nfe_items(html)
+
         issuer = self._parse_issuer(html)
         consumer = self._parse_consumer(html)
         issued_date = self._parse_issued_date(html)
@@ -30,33 +58,26 @@ class NfeHtmlParser(NfeParser):
         total_amount = self._parse_total_amount(html)
         total_discounts = self._parse_total_discounts(html)
         payment_type = self.parse_payment_type(html)
-        items = self._parse_nfe_items(html)
-
-        return Nfe(
-            issuer=issuer,
-            consumer=consumer,
-            issued_date=issued_date,
-            access_key=Value(access_key).text,
-            total_amount=total_amount,
-            total_discounts=total_discounts,
-            payment_type=payment_type,
-            items=items,
-            raw_html=str(html),
-        )
 
-    @staticmethod
-    def assert_values(total_amount: Decimal, items: list[NfeItem]):
-        items_total_amount = sum(item.total_amount for item in items)
-        assert (
-            total_amount == items_total_amount
-        ), f"NFe total: {total_amount} != items total: {items_total_amount}"
+        with stage("parse.validate"):
+            return self.build_nfe(
+                items_loader,
+                issuer=issuer,
+                consumer=consumer,
+                issued_date=issued_date,
+                access_key=Value(access_key).text,
+                total_amount=total_amount,
+                total_discounts=total_discounts,
+                payment_type=payment_type,
+                raw_html=self.nfe_response.text,
+            )
 
+    @timed("parse.issuer")
     def _parse_issuer(self, html: BeautifulSoup) -> NfeIssuer:
         name = html.select_one(".NFCCabecalho_SubTitulo").text
         _, national_registration_code, _, _, state_registration_code = html.select_one(
             ".NFCCabecalho_SubTitulo1"
         ).text.split()
-        address = self._parse_issuer_address(html)
 
         national_registration_code_patter = r"^\d\d\.\d{3}\.\d{3}\/\d{4}-\d{2}$"
         state_registration_code_pattern = r"^\d+$"
@@ -68,14 +89,17 @@ class NfeHtmlParser(NfeParser):
             state_registration_code_pattern, state_registration_code
         ), f"State registration code '{state_registration_code}' does not match the pattern {state_registration_code_pattern}"
 
-        return NfeIssuer(
-            name=Value(name).text,
-            national_registration_code=Value(national_registration_code).text,
-            state_registration_code=Value(state_registration_code).text,
-            address=address,
+        return INTERN_POOL.issuer(
+            NfeIssuer(
+                name=Value(name).text,
+                national_registration_code=Value(national_registration_code).text,
+                state_registration_code=Value(state_registration_code).text,
+                address=self._parse_issuer_address(html),
+            )
         )
 
     @staticmethod
+    @timed("parse.consumer")
     def _parse_consumer(html: BeautifulSoup) -> NfeConsumer:
         consumer = (
             html.select('td:-soup-contains("CONSUMIDOR")')[-1]
@@ -88,6 +112,7 @@ class NfeHtmlParser(NfeParser):
         return NfeConsumer(identification=Value(consumer).text)
 
     @staticmethod
+    @timed("parse.issuer_address")
     def _parse_issuer_address(html: BeautifulSoup) -> Address:
         address_text = html.select(".NFCCabecalho_SubTitulo1")[-1].text.replace("\n", "")
         # remove ", 0," from address
@@ -109,6 +134,7 @@ class NfeHtmlParser(NfeParser):
         )
 
     @staticmethod
+    @timed("parse.issued_date")
     def _parse_issued_date(html: BeautifulSoup) -> datetime:
         issued_date_text = (
             html.select_one('td:-soup-contains("Data de Emissão:")')
@@ -118,6 +144,7 @@ class NfeHtmlParser(NfeParser):
         return Value(issued_date_text).date
 
     @staticmethod
+    @timed("parse.total_amount")
     def _parse_total_amount(html: BeautifulSoup) -> Decimal:
         text_value = (
             html.select('td:-soup-contains("Valor total R$")')[-1].parent.select("td")[1].text
@@ -125,6 +152,7 @@ class NfeHtmlParser(NfeParser):
         return Value(text_value).decimal
 
     @staticmethod
+    @timed("parse.total_discounts")
     def _parse_total_discounts(html: BeautifulSoup) -> Decimal:
         text_value = (
             html.select('td:-soup-contains("Valor descontos R$")')[-1].parent.select("td")[1].text
@@ -132,6 +160,7 @@ class NfeHtmlParser(NfeParser):
         return Value(text_value).decimal
 
     @staticmethod
+    @timed("parse.payment_type")
     def parse_payment_type(html: BeautifulSoup) -> PaymentType:
         payment_type_text = Value(
             html.select('td:-soup-contains("FORMA PAGAMENTO")')[-1]
@@ -155,13 +184,15 @@ class NfeHtmlParser(NfeParser):
         return payment_type
 
     @staticmethod
+    @timed("parse.access_key")
     def _parse_access_key(html: BeautifulSoup) -> str:
         return html.select('td:-soup-contains("CHAVE DE ACESSO")')[-1].find_next("td").text
 
     @staticmethod
+    @timed("parse.nfe_items")
     def _parse_nfe_items(html: BeautifulSoup) -> list[NfeItem]:
         nfe_items: list[NfeItem] = []
-        items = html.select("tr[id^=Item]")
+        items = ITEM_ROWS_SELECTOR.select(html)
 
         for item in items:
             columns = item.find_all("td")
@@ -172,10 +203,13 @@ class NfeHtmlParser(NfeParser):
             unitary_price = columns[4].text
             total_amount = columns[5].text
 
+            barcode, description = INTERN_POOL.item_strings(
+                Value(barcode).text, Value(description).text
+            )
             nfe_items.append(
                 NfeItem(
-                    barcode=Value(barcode).text,
-                    description=Value(description).text,
+                    barcode=barcode,
+                    description=description,
                     quantity=Value(quantity).decimal,
                     metric_unit=Value(metric_unit).metric_unit,
                     unitary_price=Value(unitary_price).decimal,
@@ -187,8 +221,28 @@ class NfeHtmlParser(NfeParser):
 
 
 class NfeHtmlParser2(NfeParser):
+    ITEMS_TABLE_PATTERN = re.compile(r"<table[^>]*\bid=\"tabResult\".*?</table>", re.S)
+    DATE_PATTERN = re.compile(r"\d{2}/\d{2}/\d{4} \d{2}:\d{2}:\d{2}")
+    BARCODE_PATTERN = re.compile(r"\d+")
+    NUMBER_PATTERN = re.compile(r"(\d+\.)?(\d+,)?\d+")
+    METRIC_UNIT_PATTERN = re.compile(r"</strong>\s*(.+)\s*</span>")
+
+    @timed("parse")
     def parse(self) -> Nfe:
-        html = to_bs(self.nfe_response.text)
+        if self.mode == ParseMode.HEADER_ONLY:
+            # the items table is most of the page, don't build a tree for it at all
+            html = to_bs(self.ITEMS_TABLE_PATTERN.sub("", self.nfe_response.text, count=1))
+        else:
+            html = to_bs(self.nfe_response.text)
+        if self.mode == ParseMode.LAZY_ITEMS:
+            items_loader = lazy_items_loader(
+                self.nfe_response.text, NfeHtmlParser2._parse_nfe_items
+            )
+        else:
+
+            def items_loader() -> list[NfeItem]:
+                return self._parse_nfe_items(html)
+
         issuer = self._parse_issuer(html)
         consumer = self._parse_consumer(html)
         issued_date = self._parse_issued_date(html)
@@ -196,34 +250,27 @@ class NfeHtmlParser2(NfeParser):
         total_amount = self._parse_total_amount(html)
         total_discounts = self._parse_total_discounts(html)
         payment_type = self.parse_payment_type(html)
-        items = self._parse_nfe_items(html)
-
-        return Nfe(
-            issuer=issuer,
-            consumer=consumer,
-            issued_date=issued_date,
-            access_key=Value(access_key).text,
-            total_amount=total_amount,
-            total_discounts=total_discounts,
-            payment_type=payment_type,
-            items=items,
-            raw_html=str(html),
-        )
 
-    @staticmethod
-    def assert_values(total_amount: Decimal, items: list[NfeItem]):
-        items_total_amount = sum(item.total_amount for item in items)
-        assert (
-            total_amount == items_total_amount
-        ), f"NFe total: {total_amount} != items total: {items_total_amount}"
+        with stage("parse.validate"):
+            return self.build_nfe(
+                items_loader,
+                issuer=issuer,
+                consumer=consumer,
+                issued_date=issued_date,
+                access_key=Value(access_key).text,
+                total_amount=total_amount,
+                total_discounts=total_discounts,
+                payment_type=payment_type,
+                raw_html=self.nfe_response.text,
+            )
 
+    @timed("parse.issuer")
     def _parse_issuer(self, html: BeautifulSoup) -> NfeIssuer:
         issuer_data = [i for i in html.find(class_="txtCenter").children if i.text != "\n"]
         name = issuer_data[0].text
         national_registration_code = (
             issuer_data[1].text.replace("CNPJ:", "").replace("\t", "").replace("\n", "").strip()
         )
-        address = self._parse_issuer_address(issuer_data[2].text)
 
         national_registration_code_patter = r"^\d\d\.\d{3}\.\d{3}\/\d{4}-\d{2}$"
 
@@ -231,17 +278,20 @@ class NfeHtmlParser2(NfeParser):
             national_registration_code_patter, national_registration_code
         ), f"National registration code '{national_registration_code}' does not match the pattern {national_registration_code_patter}"
 
-        return NfeIssuer(
-            name=Value(name).text,
-            national_registration_code=Value(national_registration_code).text,
-            state_registration_code=None,
-            address=address,
+        return INTERN_POOL.issuer(
+            NfeIssuer(
+                name=Value(name).text,
+                national_registration_code=Value(national_registration_code).text,
+                state_registration_code=None,
+                address=self._parse_issuer_address(issuer_data[2].text),
+            )
         )
 
     @staticmethod
+    @timed("parse.consumer")
     def _parse_consumer(html: BeautifulSoup) -> NfeConsumer:
         consumer = (
-            [i for i in html.find_all("h4") if i.text == "Consumidor"][0]
+            html.find("h4", string="Consumidor")
             .parent.find("strong")
             .text.strip()
             .replace("CPF:", "")
@@ -251,6 +301,7 @@ class NfeHtmlParser2(NfeParser):
         return NfeConsumer(identification=Value(consumer).text)
 
     @staticmethod
+    @timed("parse.issuer_address")
     def _parse_issuer_address(address_text: str) -> Address:
         address_text = re.sub(r"[\n\t]+", " ", address_text)
         address_text = re.sub(r",\s+,", ",", address_text)
@@ -277,34 +328,40 @@ class NfeHtmlParser2(NfeParser):
         )
 
     @staticmethod
+    @timed("parse.issued_date")
     def _parse_issued_date(html: BeautifulSoup) -> datetime:
-        issued_date_text = [i for i in html.find_all("strong") if "Emissão:" in i.text][
-            0
-        ].parent.text
-        match = re.search(r"\d{2}/\d{2}/\d{4} \d{2}:\d{2}:\d{2}", issued_date_text)
+        issued_date_text = html.find(
+            lambda tag: tag.name == "strong" and "Emissão:" in tag.text
+        ).parent.text
+        match = NfeHtmlParser2.DATE_PATTERN.search(issued_date_text)
         # DD/MM/YYYY HH:mm:ss
         return Value(match[0]).date
 
     @staticmethod
+    @timed("parse.total_amount")
     def _parse_total_amount(html: BeautifulSoup) -> Decimal:
-        text_value = [i.text for i in html.find_all(id="linhaTotal") if "Valor a pagar" in i.text][
-            0
-        ]
+        text_value = html.find(
+            lambda tag: tag.get("id") == "linhaTotal" and "Valor a pagar" in tag.text
+        ).text
         return Value(text_value.split(":")[1]).decimal
 
     @staticmethod
+    @timed("parse.total_discounts")
     def _parse_total_discounts(html: BeautifulSoup) -> Decimal:
-        if match := [i.text for i in html.find_all(id="linhaTotal") if "Descontos R$" in i.text]:
-            return Value(match[0].split(":")[1]).decimal
+        if match := html.find(
+            lambda tag: tag.get("id") == "linhaTotal" and "Descontos R$" in tag.text
+        ):
+            return Value(match.text.split(":")[1]).decimal
         return Value("0,00").decimal
 
     @staticmethod
+    @timed("parse.payment_type")
     def parse_payment_type(html: BeautifulSoup) -> PaymentType:
-        payment_type_text = re.sub(
-            "\t|\n",
-            " ",
-            [i for i in html.find_all(id="linhaForma")[0].next_siblings if i.text != "\n"][0].text,
-        ).strip()
+        payment = next(
+            (i for i in html.find(id="linhaForma").next_siblings if i.text != "\n"), None
+        )
+        assert payment is not None, "Payment type is missing"
+        payment_type_text = re.sub("\t|\n", " ", payment.text).strip()
 
         if re.match(".*cart.o de cr.dito.*", payment_type_text, re.I):
             payment_type = PaymentType.CREDIT_CARD
@@ -322,29 +379,34 @@ class NfeHtmlParser2(NfeParser):
         return payment_type
 
     @staticmethod
+    @timed("parse.access_key")
     def _parse_access_key(html: BeautifulSoup) -> str:
         return html.find(class_="chave").text
 
     @staticmethod
+    @timed("parse.nfe_items")
     def _parse_nfe_items(html: BeautifulSoup) -> list[NfeItem]:
         nfe_items: list[NfeItem] = []
-        items = html.select("tr[id^=Item]")
+        items = ITEM_ROWS_SELECTOR.select(html)
 
         for item in items:
             columns = item.find_all("td")
             description_lines = columns[0].find_all("span")
 
             description = description_lines[0].text.strip()
-            barcode = re.search(r"\d+", description_lines[1].text.strip())[0]
-            quantity = re.search(r"(\d+\.)?(\d+,)?\d+", description_lines[2].text)[0]
-            metric_unit = re.search(r"</strong>\s*(.+)\s*</span>", str(description_lines[3]))[1]
-            unitary_price = re.search(r"(\d+\.)?(\d+,)?\d+", description_lines[4].text)[0]
-            total_amount = re.search(r"(\d+\.)?(\d+,)?\d+", columns[1].text)[0]
-
+            barcode = NfeHtmlParser2.BARCODE_PATTERN.search(description_lines[1].text.strip())[0]
+            quantity = NfeHtmlParser2.NUMBER_PATTERN.search(description_lines[2].text)[0]
+            metric_unit = NfeHtmlParser2.METRIC_UNIT_PATTERN.search(str(description_lines[3]))[1]
+            unitary_price = NfeHtmlParser2.NUMBER_PATTERN.search(description_lines[4].text)[0]
+            total_amount = NfeHtmlParser2.NUMBER_PATTERN.search(columns[1].text)[0]
+
+            barcode, description = INTERN_POOL.item_strings(
+                Value(barcode).text, Value(description).text
+            )
             nfe_items.append(
                 NfeItem(
-                    barcode=Value(barcode).text,
-                    description=Value(description).text,
+                    barcode=barcode,
+                    description=description,
                     quantity=Value(quantity).decimal,
                     metric_unit=Value(metric_unit).metric_unit,
                     unitary_price=Value(unitary_price).decimal,
@@ -0,0 +1,287 @@
+import io
+import logging
+import os
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from decimal import Decimal
+from pathlib import Path
+from typing import IO, Callable, Iterable, Iterator
+from xml.etree.ElementTree import Element, iterparse
+
+import arrow
+
+from nfe_scanner.exceptions import NfeParserException
+from nfe_scanner.interning import INTERN_POOL
+from nfe_scanner.logs import pool_logging
+from nfe_scanner.models import (
+    Address,
+    Nfe,
+    NfeConsumer,
+    NfeIssuer,
+    NfeItem,
+    PaymentType,
+)
+from nfe_scanner.parsers.base import NfeParser, ParseMode
+from nfe_scanner.parsers.common import Value, parse_metric_unit
+from nfe_scanner.profiling import timed
+
+LOGGER = logging.getLogger(__name__)
+
+# tPag codes of the NF-e layout
+PAYMENT_TYPES = {
+    "01": PaymentType.MONEY,
+    "03": PaymentType.CREDIT_CARD,
+    "04": PaymentType.DEBIT_CARD,
+    "05": PaymentType.STORE_CARD,
+    "10": PaymentType.FOOD_VOUCHER,
+    "11": PaymentType.FOOD_VOUCHER,
+}
+
+UNIDENTIFIED_CONSUMER = "Consumidor não identificado"
+
+# (file path, zip member), the member is None for plain files
+XmlSource = tuple[str, str | None]
+
+# ICMSTot amounts that vNF adds to the products minus discounts, exempted ICMS is deducted
+CHARGE_FIELDS = ("vST", "vFCPST", "vFrete", "vSeg", "vOutro", "vII", "vIPI", "vIPIDevol")
+
+# (parent, tag) pairs collected into the header, everything else outside `det` is ignored
+HEADER_FIELDS = {
+    ("ide", "dhEmi"),
+    ("emit", "CNPJ"),
+    ("emit", "CPF"),
+    ("emit", "xNome"),
+    ("emit", "IE"),
+    ("enderEmit", "xLgr"),
+    ("enderEmit", "nro"),
+    ("enderEmit", "xBairro"),
+    ("enderEmit", "xMun"),
+    ("enderEmit", "UF"),
+    ("enderEmit", "CEP"),
+    ("dest", "CPF"),
+    ("dest", "CNPJ"),
+    ("ICMSTot", "vNF"),
+    ("ICMSTot", "vDesc"),
+    ("ICMSTot", "vICMSDeson"),
+    *(("ICMSTot", charge) for charge in CHARGE_FIELDS),
+    ("detPag", "tPag"),
+    ("infProt", "chNFe"),
+}
+
+
+def local_name(tag: str) -> str:
+    return tag.rpartition("}")[2]
+
+
+def format_access_key(access_key: str) -> str:
+    """Same representation the SEFAZ pages use, groups of 4 digits."""
+    return " ".join(access_key[i : i + 4] for i in range(0, len(access_key), 4))
+
+
+def format_cnpj(code: str) -> str:
+    if len(code) != 14:
+        return code
+    return f"{code[:2]}.{code[2:5]}.{code[5:8]}/{code[8:12]}-{code[12:]}"
+
+
+def parse_xml_decimal(value: str) -> Decimal:
+    """Drop the padding zeros of the fixed decimals, "10.0000" is 10 rather than 1E+1."""
+    number = Decimal(value)
+    if number == number.to_integral_value():
+        return number.quantize(Decimal(1))
+    return number.normalize()
+
+
+def parse_item(det: Element) -> NfeItem:
+    prod_element = next(child for child in det if local_name(child.tag) == "prod")
+    prod = {local_name(child.tag): child.text or "" for child in prod_element}
+    barcode = prod.get("cEAN", "")
+    barcode, description = INTERN_POOL.item_strings(
+        barcode if barcode.isdigit() else prod["cProd"], Value(prod["xProd"]).text
+    )
+
+    return NfeItem(
+        barcode=barcode,
+        description=description,
+        quantity=parse_xml_decimal(prod["qCom"]),
+        metric_unit=parse_metric_unit(prod["uCom"]),
+        unitary_price=parse_xml_decimal(prod["vUnCom"]),
+        total_price=Decimal(prod["vProd"]),
+    )
+
+
+def parse_xml_stream(source: IO[bytes], raw: str | None = None, parse_items: bool = True) -> Nfe:
+    """
+    Parse a procNFe (or bare NFe) document with iterparse.
+
+    Items are built and their elements released as soon as each `det` closes, so memory
+    does not grow with the document size.
+    """
+    header: dict[str, str] = {}
+    items: list[NfeItem] = []
+    access_key = None
+    stack: list[str] = []
+
+    for event, element in iterparse(source, events=("start", "end")):
+        name = local_name(element.tag)
+        if event == "start":
+            stack.append(name)
+            if name == "infNFe" and (element_id := element.get("Id")):
+                access_key = element_id.removeprefix("NFe")
+            continue
+
+        stack.pop()
+        if name == "det":
+            if parse_items:
+                items.append(parse_item(element))
+            element.clear()
+        elif stack and (stack[-1], name) in HEADER_FIELDS:
+            header.setdefault(f"{stack[-1]}.{name}", element.text or "")
+
+    access_key = header.get("infProt.chNFe", access_key)
+    if not access_key or "ide.dhEmi" not in header:
+        raise NfeParserException("Document is not a valid NF-e XML")
+
+    national_registration_code = format_cnpj(header.get("emit.CNPJ") or header.get("emit.CPF", ""))
+    return Nfe(
+        issuer=INTERN_POOL.issuer(
+            NfeIssuer(
+                name=Value(header.get("emit.xNome", "")).text,
+                national_registration_code=national_registration_code,
+                state_registration_code=header.get("emit.IE"),
+                address=Address(
+                    line1=Value(
+                        f"{header.get('enderEmit.xLgr', '')} {header.get('enderEmit.nro', '')} "
+                        f"{header.get('enderEmit.xBairro', '')}"
+                    ).text,
+                    line2=None,
+                    city=header.get("enderEmit.xMun"),
+                    state=header.get("enderEmit.UF"),
+                    country="BR",
+                    zip_code=header.get("enderEmit.CEP"),
+                ),
+            )
+        ),
+        consumer=NfeConsumer(
+            identification=header.get("dest.CPF")
+            or header.get("dest.CNPJ")
+            or UNIDENTIFIED_CONSUMER
+        ),
+        issued_date=arrow.get(header["ide.dhEmi"]).to("UTC").datetime,
+        access_key=format_access_key(access_key),
+        total_amount=Decimal(header.get("ICMSTot.vNF", "0")),
+        total_discounts=Decimal(header.get("ICMSTot.vDesc", "0")),
+        total_charges=sum(
+            (Decimal(header.get(f"ICMSTot.{charge}", "0")) for charge in CHARGE_FIELDS),
+            -Decimal(header.get("ICMSTot.vICMSDeson", "0")),
+        ),
+        payment_type=PAYMENT_TYPES.get(header.get("detPag.tPag", ""), PaymentType.OTHER),
+        items=items,
+        raw_html=raw or "",
+    )
+
+
+class NfeXmlParser(NfeParser):
+    @timed("parse")
+    def parse(self) -> Nfe:
+        # items are cheap to build from XML, so lazy mode parses them upfront as well
+        text = self.nfe_response.text
+        return parse_xml_stream(
+            io.BytesIO(text.encode("utf-8")),
+            raw=text,
+            parse_items=self.mode != ParseMode.HEADER_ONLY,
+        )
+
+
+def iter_xml_sources(paths: Iterable[str | Path]) -> Iterator[XmlSource]:
+    """
+    Yield (path, zip member) pairs of every XML under the given files, directories or zips.
+
+    The member is None for plain files.
+    """
+    for path in map(Path, paths):
+        if path.is_dir():
+            yield from iter_xml_sources(sorted(p for p in path.rglob("*") if p.is_file()))
+        elif zipfile.is_zipfile(path):
+            with zipfile.ZipFile(path) as archive:
+                for member in archive.namelist():
+                    if member.lower().endswith(".xml"):
+                        yield str(path), member
+        elif path.suffix.lower() == ".xml":
+            yield str(path), None
+
+
+def log_xml_error(source: XmlSource, error: str):
+    path, member = source
+    LOGGER.warning("Skipping '%s': %s", f"{path}:{member}" if member else path, error)
+
+
+def parse_xml_sources(sources: list[XmlSource]) -> list[tuple[XmlSource, Nfe | None, str | None]]:
+    """
+    Parse a batch of documents straight from disk, the raw XML is not kept in `Nfe.raw_html`.
+
+    Each zip of the batch is opened once. A document that cannot be parsed, e.g. a
+    `procEventoNFe` or a truncated file, gets its error message instead of an `Nfe`.
+    """
+    results: list[tuple[XmlSource, Nfe | None, str | None]] = []
+    archives: dict[str, zipfile.ZipFile] = {}
+    with ExitStack() as stack:
+        for source in sources:
+            path, member = source
+            try:
+                if member is None:
+                    with open(path, "rb") as f:
+                        nfe = parse_xml_stream(f)
+                else:
+                    if (archive := archives.get(path)) is None:
+                        archive = archives[path] = stack.enter_context(zipfile.ZipFile(path))
+                    with archive.open(member) as f:
+                        nfe = parse_xml_stream(f)
+            except Exception as err:
+                results.append((source, None, f"{err.__class__.__name__}: {err}"))
+            else:
+                results.append((source, nfe, None))
+    return results
+
+
+def batched(sources: list[XmlSource], size: int) -> list[list[XmlSource]]:
+    return [sources[i : i + size] for i in range(0, len(sources), size)]
+
+
+def collect_nfes(
+    batches: Iterable[list[tuple[XmlSource, Nfe | None, str | None]]],
+    on_error: Callable[[XmlSource, str], None],
+) -> Iterator[Nfe]:
+    for batch in batches:
+        for source, nfe, error in batch:
+            if nfe is None:
+                on_error(source, error)
+            else:
+                yield nfe
+
+
+def scan_xml(
+    paths: Iterable[str | Path],
+    processes: int | None = None,
+    chunksize: int = 64,
+    on_error: Callable[[XmlSource, str], None] = log_xml_error,
+) -> Iterator[Nfe]:
+    """
+    Parse every NF-e XML found in `paths` across a process pool, in a stable order.
+
+    Workers get batches of `chunksize` paths and open the files themselves, so only paths
+    travel to them and only `Nfe` objects travel back. Documents that fail to parse are
+    handed to `on_error` and skipped.
+    """
+    sources = list(iter_xml_sources(paths))
+    LOGGER.info("Parsing %d NF-e XML document(s).", len(sources))
+    batches = batched(sources, chunksize)
+    if processes == 1 or len(batches) <= 1:
+        yield from collect_nfes(map(parse_xml_sources, batches), on_error)
+        return
+
+    with ProcessPoolExecutor(max_workers=processes or os.cpu_count(), **pool_logging()) as executor:
+        # results are unpickled as fresh objects, share them again in this process
+        nfes = collect_nfes(executor.map(parse_xml_sources, batches), on_error)
+        yield from map(INTERN_POOL.intern_nfe, nfes)
@@ -0,0 +1,178 @@
+import logging
+import sqlite3
+from datetime import datetime
+from decimal import Decimal
+from typing import Iterable, NamedTuple
+
+from nfe_scanner.models import Nfe, NfeItem
+
+LOGGER = logging.getLogger(__name__)
+
+# prices and quantities are stored as scaled integers so aggregates stay exact
+PRICE_SCALE = 1000
+QUANTITY_SCALE = 10000
+
+
+class PricePoint(NamedTuple):
+    product: str
+    issuer: str
+    period: str
+    last_price: Decimal
+    min_price: Decimal
+    max_price: Decimal
+    avg_price: Decimal
+    total_quantity: Decimal
+    total_spent: Decimal
+    count: int
+
+
+def connect(filename: str = "nfe-price-history.db"):
+    connection = sqlite3.connect(filename)
+    return connection
+
+
+def create_tables(connection):
+    cursor = connection.cursor()
+
+    cursor.execute(
+        """
+    CREATE TABLE IF NOT EXISTS "price_history_nfe" (
+        "access_key"   TEXT,
+        PRIMARY KEY("access_key")
+    )
+    """
+    )
+
+    cursor.execute(
+        """
+    CREATE TABLE IF NOT EXISTS "price_stats" (
+        "product"        TEXT,
+        "issuer"         TEXT,
+        "period"         TEXT,
+        "last_date"      TIMESTAMP,
+        "last_price"     INTEGER,
+        "min_price"      INTEGER,
+        "max_price"      INTEGER,
+        "total_quantity" INTEGER,
+        "total_spent"    INTEGER,
+        "count"          INTEGER,
+        PRIMARY KEY("product", "issuer", "period")
+    )
+    """
+    )
+    connection.commit()
+
+
+def product_key(item: NfeItem) -> str:
+    """Barcode when the item has one, otherwise its description (e.g. 'SEM GTIN' items)."""
+    return item.barcode if item.barcode.isdigit() else item.description
+
+
+def period_key(issued_date: datetime) -> str:
+    return issued_date.strftime("%Y-%m")
+
+
+def to_scaled(value: Decimal, scale: int) -> int:
+    return int((value * scale).to_integral_value())
+
+
+def from_scaled(value: int, scale: int) -> Decimal:
+    return Decimal(value) / scale
+
+
+def aggregate(nfes: Iterable[Nfe]) -> dict[tuple[str, str, str], list]:
+    """Fold items into one row per (product, issuer, period) before touching the database."""
+    rows: dict[tuple[str, str, str], list] = {}
+
+    for nfe in nfes:
+        issuer = nfe.issuer.national_registration_code
+        period = period_key(nfe.issued_date)
+        issued_date = nfe.issued_date.isoformat()
+        for item in nfe.items:
+            price = to_scaled(item.unitary_price, PRICE_SCALE)
+            quantity = to_scaled(item.quantity, QUANTITY_SCALE)
+            spent = to_scaled(item.total_price, PRICE_SCALE)
+            key = (product_key(item), issuer, period)
+            if (row := rows.get(key)) is None:
+                rows[key] = [issued_date, price, price, price, quantity, spent, 1]
+                continue
+            if issued_date >= row[0]:
+                row[0], row[1] = issued_date, price
+            row[2] = min(row[2], price)
+            row[3] = max(row[3], price)
+            row[4] += quantity
+            row[5] += spent
+            row[6] += 1
+
+    return rows
+
+
+def add_nfes(connection, nfes: Iterable[Nfe]) -> int:
+    """
+    Incrementally fold new NFes into the aggregates, ignoring the ones already added.
+
+    Returns the number of NFes that were added.
+    """
+    cursor = connection.cursor()
+    new_nfes: list[Nfe] = []
+    for nfe in nfes:
+        cursor.execute(
+            "INSERT OR IGNORE INTO price_history_nfe (access_key) VALUES (?)", (nfe.access_key,)
+        )
+        if cursor.rowcount:
+            new_nfes.append(nfe)
+
+    cursor.executemany(
+        """
+        INSERT INTO price_stats (
+            product, issuer, period, last_date, last_price, min_price, max_price,
+            total_quantity, total_spent, count
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT (product, issuer, period) DO UPDATE SET
+            last_price = CASE WHEN excluded.last_date >= last_date
+                THEN excluded.last_price ELSE last_price END,
+            last_date = max(last_date, excluded.last_date),
+            min_price = min(min_price, excluded.min_price),
+            max_price = max(max_price, excluded.max_price),
+            total_quantity = total_quantity + excluded.total_quantity,
+            total_spent = total_spent + excluded.total_spent,
+            count = count + excluded.count
+        """,
+        [(*key, *values) for key, values in aggregate(new_nfes).items()],
+    )
+    connection.commit()
+    LOGGER.debug("Added %d NFe(s) to price history.", len(new_nfes))
+    return len(new_nfes)
+
+
+def price_trend(connection, product: str, issuer: str | None = None) -> list[PricePoint]:
+    """Per period statistics of a product, served by the primary key index."""
+    query = (
+        "SELECT product, issuer, period, last_price, min_price, max_price, total_quantity, "
+        "total_spent, count FROM price_stats WHERE product = ?"
+    )
+    params: tuple = (product,)
+    if issuer is not None:
+        query += " AND issuer = ?"
+        params += (issuer,)
+    query += " ORDER BY period, issuer"
+
+    trend: list[PricePoint] = []
+    for row in connection.execute(query, params):
+        _, _, _, last_price, min_price, max_price, total_quantity, total_spent, count = row
+        quantity = from_scaled(total_quantity, QUANTITY_SCALE)
+        spent = from_scaled(total_spent, PRICE_SCALE)
+        trend.append(
+            PricePoint(
+                *row[:3],
+                last_price=from_scaled(last_price, PRICE_SCALE),
+                min_price=from_scaled(min_price, PRICE_SCALE),
+                max_price=from_scaled(max_price, PRICE_SCALE),
+                avg_price=(spent / quantity).quantize(Decimal("0.001")) if quantity else spent,
+                total_quantity=quantity,
+                total_spent=spent,
+                count=count,
+            )
+        )
+
+    return trend
@@ -0,0 +1,150 @@
+import logging
+import re
+import unicodedata
+from collections import Counter
+from decimal import Decimal
+from typing import Hashable, NamedTuple
+
+from nfe_scanner.models import NfeItem
+
+LOGGER = logging.getLogger(__name__)
+
+# common abbreviations found in receipts, expanded before indexing
+ABBREVIATIONS = {
+    "BEB": "BEBIDA",
+    "BISC": "BISCOITO",
+    "CHOC": "CHOCOLATE",
+    "CX": "CAIXA",
+    "DESOD": "DESODORANTE",
+    "FERM": "FERMENTADO",
+    "FRGO": "FRANGO",
+    "INT": "INTEGRAL",
+    "LTE": "LEITE",
+    "MARG": "MARGARINA",
+    "PCT": "PACOTE",
+    "QJO": "QUEIJO",
+    "REFRIG": "REFRIGERANTE",
+    "SAB": "SABONETE",
+    "DESN": "DESNATADO",
+    "SEMI": "SEMIDESNATADO",
+}
+
+# unit aliases mapped to a base unit and the multiplier to it
+SIZE_UNITS = {
+    "KG": ("G", 1000),
+    "G": ("G", 1),
+    "GR": ("G", 1),
+    "GRS": ("G", 1),
+    "L": ("ML", 1000),
+    "LT": ("ML", 1000),
+    "LTS": ("ML", 1000),
+    "ML": ("ML", 1),
+}
+
+SIZE_PATTERN = re.compile(r"\b(\d+(?:[.,]\d+)?)\s*(KG|GRS|GR|G|LTS|LT|L|ML)\b")
+NON_WORD_PATTERN = re.compile(r"[^A-Z0-9 ]+")
+
+
+class Size(NamedTuple):
+    amount: Decimal
+    unit: str
+
+
+class ProductMatch(NamedTuple):
+    product_id: Hashable
+    description: str
+    score: float
+
+
+def strip_accents(value: str) -> str:
+    return unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode("ascii")
+
+
+def extract_size(description: str) -> Size | None:
+    """Package size in grams or milliliters, e.g. 'LTE FERM YAKULT 480G' -> 480 G."""
+    if not (match := SIZE_PATTERN.search(strip_accents(description).upper())):
+        return None
+    unit, multiplier = SIZE_UNITS[match[2]]
+    return Size((Decimal(match[1].replace(",", ".")) * multiplier).normalize(), unit)
+
+
+def normalize_description(description: str) -> str:
+    """Uppercase ASCII tokens with abbreviations expanded and package sizes removed."""
+    text = SIZE_PATTERN.sub(" ", strip_accents(description).upper())
+    tokens = NON_WORD_PATTERN.sub(" ", text).split()
+    return " ".join(ABBREVIATIONS.get(token, token) for token in tokens)
+
+
+def trigrams(normalized: str) -> frozenset[str]:
+    grams = set()
+    for token in normalized.split():
+        padded = f" {token} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+class ProductIndex:
+    """
+    Inverted trigram index over canonical product descriptions.
+
+    Lookups tally candidates from the posting lists of the query's `candidate_trigrams`
+    rarest trigrams, then only the `max_candidates` sharing most of them are ranked by
+    trigram similarity. The tally still grows with the length of those posting lists, so
+    queries made of common words cost more on large catalogs.
+    """
+
+    def __init__(
+        self, min_score: float = 0.5, candidate_trigrams: int = 6, max_candidates: int = 128
+    ):
+        self.min_score = min_score
+        self.candidate_trigrams = candidate_trigrams
+        self.max_candidates = max_candidates
+        self._ids: list[Hashable] = []
+        self._descriptions: list[str] = []
+        self._trigrams: list[frozenset[str]] = []
+        self._sizes: list[Size | None] = []
+        self._postings: dict[str, list[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, product_id: Hashable, description: str):
+        position = len(self._ids)
+        grams = trigrams(normalize_description(description))
+        self._ids.append(product_id)
+        self._descriptions.append(description)
+        self._trigrams.append(grams)
+        self._sizes.append(extract_size(description))
+        for gram in grams:
+            self._postings.setdefault(gram, []).append(position)
+
+    def lookup(self, description: str, limit: int = 5) -> list[ProductMatch]:
+        grams = trigrams(normalize_description(description))
+        size = extract_size(description)
+        postings = sorted(
+            (self._postings[gram] for gram in grams if gram in self._postings), key=len
+        )
+        candidates = Counter()
+        for posting in postings[: self.candidate_trigrams]:
+            candidates.update(posting)
+
+        matches: list[ProductMatch] = []
+        for position, _ in candidates.most_common(self.max_candidates):
+            # same product in a different package size is a different product
+            if size and self._sizes[position] and size != self._sizes[position]:
+                continue
+            other = self._trigrams[position]
+            score = 2 * len(grams & other) / (len(grams) + len(other))
+            if score >= self.min_score:
+                matches.append(
+                    ProductMatch(self._ids[position], self._descriptions[position], score)
+                )
+
+        matches.sort(key=lambda match: match.score, reverse=True)
+        return matches[:limit]
+
+    def match(self, item: NfeItem) -> ProductMatch | None:
+        """Best canonical product for an item, typically one without a usable barcode."""
+        if matches := self.lookup(item.description, limit=1):
+            return matches[0]
+        return None
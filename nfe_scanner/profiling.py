@@ -0,0 +1,121 @@
+import functools
+import json
+import logging
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, TextIO
+
+LOGGER = logging.getLogger(__name__)
+
+
+class StageStats:
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def add(self, elapsed: float):
+        self.count += 1
+        self.total += elapsed
+        self.min = min(self.min, elapsed)
+        self.max = max(self.max, elapsed)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+class Profiler:
+    """
+    Collects per-stage timings and counters.
+
+    Disabled by default so that instrumented code only pays for a boolean check.
+    """
+
+    def __init__(self, enabled: bool = False, keep_trace: bool = True):
+        self.enabled = enabled
+        self.keep_trace = keep_trace
+        self.stages: dict[str, StageStats] = {}
+        self.counters: dict[str, int] = {}
+        self.trace: list[dict] = []
+
+    def reset(self):
+        self.stages.clear()
+        self.counters.clear()
+        self.trace.clear()
+
+    def observe(self, name: str, elapsed: float):
+        if not self.enabled:
+            return
+        self.stages.setdefault(name, StageStats()).add(elapsed)
+        if self.keep_trace:
+            self.trace.append({"stage": name, "ts": time.time(), "elapsed": elapsed})
+
+    def count(self, name: str, value: int = 1):
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def timed(self, name: str | None = None) -> Callable:
+        def decorator(func: Callable) -> Callable:
+            stage_name = name or func.__qualname__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.observe(stage_name, time.perf_counter() - start)
+
+            return wrapper
+
+        return decorator
+
+    def summary_table(self) -> str:
+        header = f"{'Stage':<45} {'Calls':>7} {'Total (s)':>10} {'Mean (ms)':>10} {'Max (ms)':>10}"
+        lines = [header, "-" * len(header)]
+        for name, stats in sorted(self.stages.items(), key=lambda i: i[1].total, reverse=True):
+            lines.append(
+                f"{name:<45} {stats.count:>7} {stats.total:>10.3f} "
+                f"{stats.mean * 1000:>10.2f} {stats.max * 1000:>10.2f}"
+            )
+        for name, value in sorted(self.counters.items()):
+            lines.append(f"{name:<45} {value:>7}")
+        return "\n".join(lines)
+
+    def write_jsonl(self, f: TextIO):
+        for event in self.trace:
+            f.write(json.dumps(event) + "\n")
+
+    def prometheus_text(self, prefix: str = "nfe_scanner") -> str:
+        lines = [
+            f"# TYPE {prefix}_stage_seconds summary",
+        ]
+        for name, stats in sorted(self.stages.items()):
+            labels = f'{{stage="{name}"}}'
+            lines.append(f"{prefix}_stage_seconds_count{labels} {stats.count}")
+            lines.append(f"{prefix}_stage_seconds_sum{labels} {stats.total}")
+        if self.counters:
+            lines.append(f"# TYPE {prefix}_events_total counter")
+        for name, value in sorted(self.counters.items()):
+            lines.append(f'{prefix}_events_total{{event="{name}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+
+PROFILER = Profiler()
+timed = PROFILER.timed
+stage = PROFILER.stage
@@ -0,0 +1,179 @@
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable, Iterator, NamedTuple
+
+from nfe_scanner.exceptions import NfeReceiptException
+from nfe_scanner.fetchers.base import NfeUrl
+from nfe_scanner.logs import pool_logging
+from nfe_scanner.models import Nfe
+from nfe_scanner.nfe import scan_multiple_nfe
+from nfe_scanner.parsers.base import ParseMode
+
+try:
+    from PIL import Image, ImageOps
+    from pyzbar import pyzbar
+except ImportError:  # pragma: no cover
+    Image = ImageOps = pyzbar = None
+
+try:
+    import pypdfium2
+except ImportError:  # pragma: no cover
+    pypdfium2 = None
+
+LOGGER = logging.getLogger(__name__)
+
+IMAGE_SUFFIXES = {".jpg", ".jpeg", ".png", ".webp", ".bmp", ".tif", ".tiff"}
+PDF_SUFFIX = ".pdf"
+
+# longest side of the first, cheap decoding attempt; phone photos are usually 3000-4000px
+MAX_IMAGE_SIDE = 1280
+# PDF pages are rendered at 72 dpi times this scale
+PDF_RENDER_SCALE = 3
+
+# errors of a single unreadable or corrupt file, the other files are still decoded;
+# Pillow plugins raise SyntaxError and EOFError on truncated images, pdfium raises
+# PdfiumError, a RuntimeError, on damaged or encrypted PDFs
+RECEIPT_FILE_ERRORS: tuple[type[Exception], ...] = (
+    OSError,
+    ValueError,
+    EOFError,
+    SyntaxError,
+    RuntimeError,
+)
+if Image is not None:
+    RECEIPT_FILE_ERRORS += (Image.DecompressionBombError,)
+if pypdfium2 is not None:
+    RECEIPT_FILE_ERRORS += (pypdfium2.PdfiumError,)
+
+
+class ReceiptQrCode(NamedTuple):
+    path: str
+    page: int
+    text: str
+
+
+def iter_receipt_files(paths: Iterable[str | Path]) -> Iterator[Path]:
+    """Yield every image or PDF under the given files or directories."""
+    for path in map(Path, paths):
+        if path.is_dir():
+            yield from iter_receipt_files(sorted(p for p in path.rglob("*") if p.is_file()))
+        elif path.suffix.lower() in IMAGE_SUFFIXES or path.suffix.lower() == PDF_SUFFIX:
+            yield path
+
+
+def downscale(image, max_side: int = MAX_IMAGE_SIDE):
+    if max(image.size) <= max_side:
+        return image
+    scale = max_side / max(image.size)
+    return image.resize((round(image.width * scale), round(image.height * scale)), Image.BILINEAR)
+
+
+def candidate_regions(image) -> Iterator:
+    """
+    Regions to decode, cheapest and most likely first.
+
+    The NFC-e QR code is printed below the items, so after the downscaled page the bottom
+    half is tried at a higher resolution, and only then the full resolution page.
+    """
+    yield downscale(image)
+    bottom = image.crop((0, image.height // 2, image.width, image.height))
+    yield downscale(bottom, MAX_IMAGE_SIDE * 2)
+    if max(image.size) > MAX_IMAGE_SIDE * 2:
+        yield image
+
+
+def decode_image(image) -> list[str]:
+    # EXIF rotation and colors are irrelevant for the decoder, grayscale is faster to scan
+    image = ImageOps.exif_transpose(image).convert("L")
+    for region in candidate_regions(image):
+        symbols = pyzbar.decode(region, symbols=[pyzbar.ZBarSymbol.QRCODE])
+        if symbols:
+            return [symbol.data.decode("utf-8", "replace") for symbol in symbols]
+    return []
+
+
+def iter_pages(path: Path) -> Iterator:
+    if path.suffix.lower() != PDF_SUFFIX:
+        with Image.open(path) as image:
+            image.load()
+            yield image
+        return
+
+    if pypdfium2 is None:
+        raise NfeReceiptException("Decoding PDFs requires the 'pypdfium2' package")
+    document = pypdfium2.PdfDocument(path)
+    try:
+        for page in document:
+            yield page.render(scale=PDF_RENDER_SCALE, grayscale=True).to_pil()
+    finally:
+        document.close()
+
+
+def decode_receipt_file(path: str | Path) -> list[ReceiptQrCode]:
+    """QR codes of every page of an image or PDF, runs in the worker processes."""
+    qr_codes: list[ReceiptQrCode] = []
+    try:
+        for page_number, page in enumerate(iter_pages(Path(path)), start=1):
+            qr_codes.extend(
+                ReceiptQrCode(str(path), page_number, text) for text in decode_image(page)
+            )
+    except RECEIPT_FILE_ERRORS as err:
+        LOGGER.warning("Could not read receipt '%s': %s", path, err)
+    return qr_codes
+
+
+def decode_receipts(
+    paths: Iterable[str | Path], processes: int | None = None, chunksize: int = 4
+) -> Iterator[ReceiptQrCode]:
+    """
+    Decode the QR codes of every image and PDF found in `paths` across a process pool.
+
+    Workers open the files themselves, so only paths travel to them and only the decoded
+    texts travel back. Results keep the order of the files.
+    """
+    if pyzbar is None:
+        raise NfeReceiptException(
+            "Decoding receipts requires the 'Pillow' and 'pyzbar' packages, "
+            "install the 'receipts' extra"
+        )
+    files = [str(path) for path in iter_receipt_files(paths)]
+    LOGGER.info("Decoding QR codes of %d receipt file(s).", len(files))
+    if processes == 1 or len(files) <= chunksize:
+        for qr_codes in map(decode_receipt_file, files):
+            yield from qr_codes
+        return
+
+    with ProcessPoolExecutor(max_workers=processes or os.cpu_count(), **pool_logging()) as executor:
+        for qr_codes in executor.map(decode_receipt_file, files, chunksize=chunksize):
+            yield from qr_codes
+
+
+def receipt_url(qr_code: ReceiptQrCode) -> NfeUrl | None:
+    """The NFC-e URL of a QR code, None for other QR codes or keys failing the check digit."""
+    try:
+        nfe_url = NfeUrl(qr_code.text.strip())
+    except ValueError:
+        nfe_url = None
+    if nfe_url is None or nfe_url.canonical_access_key is None:
+        LOGGER.warning(
+            "Ignoring QR code of '%s' page %d: %r", qr_code.path, qr_code.page, qr_code.text
+        )
+        return None
+    return nfe_url
+
+
+def receipt_urls(paths: Iterable[str | Path], processes: int | None = None) -> list[str]:
+    urls: list[str] = []
+    for qr_code in decode_receipts(paths, processes):
+        if nfe_url := receipt_url(qr_code):
+            urls.append(nfe_url.full)
+    return urls
+
+
+def scan_receipts(
+    paths: Iterable[str | Path], mode: ParseMode = ParseMode.FULL, processes: int | None = None
+) -> list[Nfe]:
+    """Decode receipt photos and PDFs and scan their NFes through the batch path."""
+    return scan_multiple_nfe(receipt_urls(paths, processes), mode)
@@ -0,0 +1,200 @@
+import hashlib
+import importlib
+import logging
+import re
+from importlib.metadata import entry_points
+from typing import Callable
+
+from nfe_scanner.fetchers.base import NfeFetcherResponseType
+
+LOGGER = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = "nfe_scanner.registry"
+
+# classes can be given as "package.module:ClassName" so their modules are only imported when used
+Target = str | type
+
+
+def load_target(target: Target) -> type:
+    if isinstance(target, type):
+        return target
+    module_name, _, attribute = target.partition(":")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+TAG_PATTERN = re.compile(r"<([a-zA-Z][\w:-]*)([^>]*)>")
+CLASS_PATTERN = re.compile(r'\bclass\s*=\s*"([^"]*)"')
+# ids with digits are per row ("Item + 1") and would make every page look different
+ID_PATTERN = re.compile(r'\bid\s*=\s*"([^"\d]*)"')
+
+
+def page_skeleton(text: str) -> frozenset[str]:
+    """Set of `tag`, `tag.class` and `tag#id` tokens of a page, found with a single regex scan."""
+    tokens: set[str] = set()
+    for tag, attributes in TAG_PATTERN.findall(text):
+        tag = tag.lower()
+        tokens.add(tag)
+        if "class" in attributes and (match := CLASS_PATTERN.search(attributes)):
+            tokens.update(f"{tag}.{class_name}" for class_name in match[1].split())
+        if "id" in attributes and (match := ID_PATTERN.search(attributes)):
+            tokens.add(f"{tag}#{match[1]}")
+    return frozenset(tokens)
+
+
+def page_fingerprint(skeleton: frozenset[str]) -> str:
+    content = "\n".join(sorted(skeleton)).encode("utf-8")
+    return hashlib.blake2b(content, digest_size=8).hexdigest()
+
+
+class NfeLayout:
+    """A page template, recognized by the skeleton tokens it must contain."""
+
+    def __init__(self, name: str, parser: Target, markers: tuple[str, ...]):
+        self.name = name
+        self.markers = frozenset(markers)
+        self._parser = parser
+
+    @property
+    def parser(self) -> type:
+        if not isinstance(self._parser, type):
+            self._parser = load_target(self._parser)
+        return self._parser
+
+    def matches(self, skeleton: frozenset[str]) -> bool:
+        return self.markers <= skeleton
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(name='{self.name}')"
+
+
+class NfeLayoutRegistry:
+    """
+    Picks the layout of a page from its structural fingerprint.
+
+    The first page of each template is matched against the layout markers, after that the
+    fingerprint alone resolves the layout (or its absence) with a dict lookup.
+    """
+
+    def __init__(self, layouts: tuple[NfeLayout, ...] = ()):
+        self._layouts: list[NfeLayout] = list(layouts)
+        self._by_fingerprint: dict[str, NfeLayout | None] = {}
+
+    def register(self, layout: NfeLayout):
+        self._layouts.append(layout)
+        self._by_fingerprint.clear()
+
+    def detect(self, text: str) -> tuple[NfeLayout | None, str]:
+        skeleton = page_skeleton(text)
+        fingerprint = page_fingerprint(skeleton)
+        if fingerprint not in self._by_fingerprint:
+            layout = next((layout for layout in self._layouts if layout.matches(skeleton)), None)
+            self._by_fingerprint[fingerprint] = layout
+            LOGGER.debug("Page fingerprint %s mapped to %s.", fingerprint, layout)
+        return self._by_fingerprint[fingerprint], fingerprint
+
+
+class NfeRegistryEntry:
+    def __init__(
+        self,
+        name: str,
+        hosts: tuple[str, ...],
+        fetcher: Target,
+        parsers: dict[NfeFetcherResponseType, Target],
+        layouts: NfeLayoutRegistry | None = None,
+    ):
+        self.name = name
+        self.hosts = hosts
+        self._fetcher = fetcher
+        self._parsers = parsers
+        # when set, HTML pages are dispatched by layout instead of the HTML parser
+        self.layouts = layouts
+
+    @property
+    def fetcher(self) -> type:
+        if not isinstance(self._fetcher, type):
+            self._fetcher = load_target(self._fetcher)
+        return self._fetcher
+
+    def add_parser(self, response_type: NfeFetcherResponseType, parser: Target):
+        self._parsers[response_type] = parser
+
+    def parser(self, response_type: NfeFetcherResponseType) -> type | None:
+        target = self._parsers.get(response_type)
+        if target is None:
+            return None
+        if not isinstance(target, type):
+            target = self._parsers[response_type] = load_target(target)
+        return target
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(name='{self.name}', hosts={self.hosts})"
+
+
+class NfeRegistry:
+    """
+    Maps portal hosts to the fetcher and parsers able to handle them.
+
+    Third party packages can add states by exposing a `register(registry)` callable under
+    the `nfe_scanner.registry` entry point group. Entry points are only loaded on the first
+    lookup.
+    """
+
+    def __init__(self, discover: bool = True):
+        self._entries_by_host: dict[str, NfeRegistryEntry] = {}
+        self._default_parsers = NfeRegistryEntry("default", (), "", {})
+        self._discovered = not discover
+
+    def register(self, entry: NfeRegistryEntry):
+        for host in entry.hosts:
+            self._entries_by_host[host] = entry
+
+    def register_default_parser(self, response_type: NfeFetcherResponseType, parser: Target):
+        """Parser used for a response type regardless of its host, e.g. for official XMLs."""
+        self._default_parsers.add_parser(response_type, parser)
+
+    def default_parser(self, response_type: NfeFetcherResponseType) -> type | None:
+        if not self._discovered:
+            self.discover()
+        return self._default_parsers.parser(response_type)
+
+    def lookup(self, host: str) -> NfeRegistryEntry | None:
+        if not self._discovered:
+            self.discover()
+        return self._entries_by_host.get(host)
+
+    def discover(self):
+        self._discovered = True
+        for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+            try:
+                register: Callable[[NfeRegistry], None] = entry_point.load()
+                register(self)
+            except Exception as err:
+                LOGGER.warning("Could not load registry plugin '%s': %s", entry_point.name, err)
+
+
+REGISTRY = NfeRegistry()
+
+REGISTRY.register(
+    NfeRegistryEntry(
+        name="sefaz-rs",
+        hosts=("www.sefaz.rs.gov.br", "dfe-portal.svrs.rs.gov.br"),
+        fetcher="nfe_scanner.fetchers.html:NfeHtmlFetcher",
+        parsers={NfeFetcherResponseType.HTML: "nfe_scanner.parsers.html:NfeHtmlParser2"},
+        layouts=NfeLayoutRegistry(
+            (
+                NfeLayout(
+                    name="sefaz-rs-v2",
+                    parser="nfe_scanner.parsers.html:NfeHtmlParser2",
+                    markers=("div.txtCenter", "span.chave", "div#linhaTotal", "div#linhaForma"),
+                ),
+                NfeLayout(
+                    name="sefaz-rs-legacy",
+                    parser="nfe_scanner.parsers.html:NfeHtmlParser",
+                    markers=("td.NFCCabecalho_SubTitulo", "td.NFCCabecalho_SubTitulo1"),
+                ),
+            )
+        ),
+    )
+)
+
+REGISTRY.register_default_parser(NfeFetcherResponseType.XML, "nfe_scanner.parsers.xml:NfeXmlParser")
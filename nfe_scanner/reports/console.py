@@ -1,12 +1,14 @@
 import logging
 
 from nfe_scanner.models import Nfe
+from nfe_scanner.profiling import timed
 
 LOGGER = logging.getLogger(__name__)
 
 
+@timed("report.console")
 def console_report(nfes: list[Nfe]):
     LOGGER.info("%s", "=" * 25 + "RESULT" + "=" * 25)
     for nfe in nfes:
-        LOGGER.info(nfe)
+        LOGGER.info("%s", nfe)
         LOGGER.info("-" * 50)
@@ -4,6 +4,7 @@ from datetime import datetime
 from decimal import Decimal
 
 from nfe_scanner.models import Nfe
+from nfe_scanner.profiling import timed
 
 LOGGER = logging.getLogger(__name__)
 
@@ -23,6 +24,7 @@ def l10n_decimal(value: Decimal) -> str:
     return str(value).replace(".", ",")
 
 
+@timed("report.csv")
 def csv_report(nfes: list[Nfe]):
     now = datetime.now().strftime("%Y-%m-%d_%H_%M_%S")
     report_name = f"report-{now}.csv"
@@ -0,0 +1,54 @@
+import logging
+from typing import BinaryIO, Iterable
+
+from nfe_scanner.models import Nfe
+from nfe_scanner.profiling import timed
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+
+class JsonlWriter:
+    """
+    Writes NFes as JSON lines, one per NFe, as soon as they are handed over.
+
+    Lines are gathered in memory and written to `f` in blocks of about `buffer_size` bytes,
+    so a large scan costs a handful of writes instead of one per NFe.
+    """
+
+    def __init__(self, f: BinaryIO, buffer_size: int = DEFAULT_BUFFER_SIZE):
+        self.f = f
+        self.buffer_size = buffer_size
+        self.count = 0
+        self._lines: list[bytes] = []
+        self._buffered = 0
+
+    def __enter__(self) -> "JsonlWriter":
+        return self
+
+    def __exit__(self, *_):
+        self.flush()
+
+    @timed("report.jsonl")
+    def write(self, nfe: Nfe):
+        line = nfe.json().encode("utf-8") + b"\n"
+        self._lines.append(line)
+        self._buffered += len(line)
+        self.count += 1
+        if self._buffered >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        if self._lines:
+            self.f.write(b"".join(self._lines))
+            self._lines.clear()
+            self._buffered = 0
+        self.f.flush()
+
+
+def jsonl_report(nfes: Iterable[Nfe], f: BinaryIO):
+    with JsonlWriter(f) as writer:
+        for nfe in nfes:
+            writer.write(nfe)
+    LOGGER.debug("%d NFe(s) written as JSON lines.", writer.count)
@@ -5,17 +5,31 @@ from decimal import Decimal
 from arrow import Arrow
 
 from nfe_scanner.models import Nfe
+from nfe_scanner.profiling import timed
 
 LOGGER = logging.getLogger(__name__)
 
 
+@timed("report.sqlite")
 def sqlite_report(nfes: list[Nfe]):
     conn = connect()
     create_tables(conn)
+    # interned issuers are shared between NFes, write each of them once
+    written_issuers: set[int] = set()
     for nfe in nfes:
-        add_nfe(conn, **nfe.dict())
+        if id(nfe.issuer) not in written_issuers:
+            written_issuers.add(id(nfe.issuer))
+            add_issuer(conn, **nfe.issuer.dict())
+        add_nfe(
+            conn,
+            **nfe.dict(exclude={"items", "issuer"}),
+            title=nfe.issuer.name,
+            issuer=nfe.issuer.national_registration_code,
+        )
         for item in nfe.items:
-            add_nfe_item(conn, **item.dict(), nfe_access_key=nfe.access_key)
+            add_nfe_item(
+                conn, **item.dict(), total_amount=item.total_price, nfe_access_key=nfe.access_key
+            )
 
 
 def connect(filename: str = "nfe-reader.db"):
@@ -26,15 +40,31 @@ def connect(filename: str = "nfe-reader.db"):
 def create_tables(connection):
     cursor = connection.cursor()
 
+    cursor.execute(
+        """
+    CREATE TABLE "issuer" (
+        "national_registration_code" TEXT,
+        "name"                       TEXT,
+        "state_registration_code"    TEXT,
+        "address_line1"              TEXT,
+        "city"                       TEXT,
+        "state"                      TEXT,
+        PRIMARY KEY("national_registration_code")
+    )
+    """
+    )
+
     cursor.execute(
         """
     CREATE TABLE "nfe" (
         "access_key"   TEXT,
         "title"        TEXT,
+        "issuer"       TEXT,
         "issued_date"  TIMESTAMP,
         "total_amount" REAL,
         "raw_html"     TEXT,
-        PRIMARY KEY("access_key")
+        PRIMARY KEY("access_key"),
+        FOREIGN KEY("issuer") REFERENCES "issuer"
     )
     """
     )
@@ -56,11 +86,36 @@ def create_tables(connection):
     )
 
 
+def add_issuer(
+    connection,
+    *,
+    national_registration_code: str,
+    name: str,
+    state_registration_code: str | None,
+    address: dict,
+    **_,
+):
+    cursor = connection.cursor()
+    cursor.execute(
+        "INSERT OR IGNORE INTO issuer (national_registration_code, name, state_registration_code, address_line1, city, state) VALUES (?, ?, ?, ?, ?, ?)",
+        (
+            national_registration_code,
+            name,
+            state_registration_code,
+            address["line1"],
+            address["city"],
+            address["state"],
+        ),
+    )
+    connection.commit()
+
+
 def add_nfe(
     connection,
     *,
     access_key: str,
     title: str,
+    issuer: str,
     issued_date: Arrow,
     total_amount: Decimal,
     raw_html: str,
@@ -68,8 +123,8 @@ def add_nfe(
 ):
     cursor = connection.cursor()
     cursor.execute(
-        "INSERT INTO nfe (access_key, title, issued_date, total_amount, raw_html) VALUES (?, ?, ?, ?, ?)",
-        (access_key, title, str(issued_date), float(total_amount), raw_html),
+        "INSERT INTO nfe (access_key, title, issuer, issued_date, total_amount, raw_html) VALUES (?, ?, ?, ?, ?, ?)",
+        (access_key, title, issuer, str(issued_date), float(total_amount), raw_html),
     )
     connection.commit()
 
@@ -0,0 +1,95 @@
+import json
+import logging
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Callable, Iterable, Iterator, TextIO
+
+from nfe_scanner.exceptions import NfeValidationException
+from nfe_scanner.models import Nfe, NfeItem
+
+LOGGER = logging.getLogger(__name__)
+
+# quantity * unitary price is rounded or truncated by the issuer, accept one cent of difference
+ITEM_TOLERANCE_CENTS = 1
+
+QuarantineSink = Callable[[Nfe, list[str]], None]
+
+
+def to_cents(value: Decimal) -> int:
+    return int((value * 100).to_integral_value(ROUND_HALF_UP))
+
+
+def to_digits(value: Decimal) -> tuple[int, int]:
+    """Exact (integer, decimal places) form of a value, e.g. 0.1234567 is (1234567, 7)."""
+    places = max(0, -value.as_tuple().exponent)
+    return int(value.scaleb(places)), places
+
+
+def check_item(item: NfeItem) -> str | None:
+    quantity, quantity_places = to_digits(item.quantity)
+    unitary_price, price_places = to_digits(item.unitary_price)
+    # the product is exact at the decimal places of both factors, cents are brought to them
+    places = max(quantity_places + price_places, 2)
+    expected = quantity * unitary_price * 10 ** (places - quantity_places - price_places)
+    cent = 10 ** (places - 2)
+    difference = abs(expected - to_cents(item.total_price) * cent)
+    if difference > ITEM_TOLERANCE_CENTS * cent:
+        return (
+            f"Item '{item.description}': {item.quantity} * {item.unitary_price} "
+            f"!= {item.total_price}"
+        )
+    return None
+
+
+def check_nfe(nfe: Nfe) -> list[str]:
+    """
+    Inconsistencies between the items, the discounts, the charges and the NFe total, in
+    integer cents.
+    """
+    problems = [problem for item in nfe.items if (problem := check_item(item))]
+
+    items_total = sum(to_cents(item.total_price) for item in nfe.items)
+    expected_total = items_total - to_cents(nfe.total_discounts) + to_cents(nfe.total_charges)
+    if nfe.items and expected_total != to_cents(nfe.total_amount):
+        problems.append(
+            f"NFe total: {nfe.total_amount} != items total: {Decimal(items_total) / 100} "
+            f"- discounts: {nfe.total_discounts} + charges: {nfe.total_charges}"
+        )
+
+    return problems
+
+
+def assert_nfe(nfe: Nfe):
+    if problems := check_nfe(nfe):
+        raise NfeValidationException(f"NFe {nfe.access_key} is inconsistent: {problems}")
+
+
+def log_quarantine(nfe: Nfe, problems: list[str]):
+    LOGGER.warning("Quarantined NFe %s: %s", nfe.access_key, "; ".join(problems))
+
+
+class JsonlQuarantine:
+    """Writes each quarantined NFe and its problems as a JSON line."""
+
+    def __init__(self, f: TextIO):
+        self.f = f
+
+    def __call__(self, nfe: Nfe, problems: list[str]):
+        log_quarantine(nfe, problems)
+        record = {"access_key": nfe.access_key, "problems": problems, "nfe": json.loads(nfe.json())}
+        self.f.write(json.dumps(record) + "\n")
+
+
+def iter_reconciled(
+    nfes: Iterable[Nfe], quarantine: QuarantineSink = log_quarantine
+) -> Iterator[Nfe]:
+    """Consistent NFes of the stream, the others are handed to `quarantine`."""
+    for nfe in nfes:
+        if problems := check_nfe(nfe):
+            quarantine(nfe, problems)
+        else:
+            yield nfe
+
+
+def reconcile(nfes: Iterable[Nfe], quarantine: QuarantineSink = log_quarantine) -> list[Nfe]:
+    """Consistent NFes of the batch, the others are handed to `quarantine`."""
+    return list(iter_reconciled(nfes, quarantine))
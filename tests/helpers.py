@@ -0,0 +1,20 @@
+import pathlib
+
+from nfe_scanner.fetchers.base import NfeFetcherResponse, NfeFetcherResponseType, NfeUrl
+from nfe_scanner.models import Nfe
+from nfe_scanner.parsers.html import NfeHtmlParser2
+
+
+def read_html(filename: str) -> str:
+    parent = pathlib.Path(__file__).parent.resolve()
+    with open(f"{parent}/html/{filename}", encoding="utf-8") as f:
+        html = f.read()
+    return html
+
+
+def parse_nfe_rs_v2() -> Nfe:
+    url = NfeUrl("https://dfe-portal.svrs.rs.gov.br/Dfe/QrCodeNFce?p=1")
+    response = NfeFetcherResponse(
+        url, read_html("nfe_rs_v2.html"), NfeFetcherResponseType.HTML, True
+    )
+    return NfeHtmlParser2(response).parse()
@@ -16,4 +16,4 @@ snapshots[
 
 snapshots[
     "test_parse_one_nfe_rs_v2 1"
-] = '{"issuer": {"name": "SUPERMERCADO", "national_registration_code": "00.000.000/0001-00", "state_registration_code": null, "address": {"line1": "ALGUMA RUA 100 ALGUM BAIRRO", "line2": null, "city": "PORTO ALEGRE", "state": "RS", "country": "BR", "zip_code": null}}, "consumer": {"identification": "Consumidor n\\u00e3o identificado"}, "issued_date": "2022-01-01T19:57:49+00:00", "access_key": "0000 0000 0000 0000 0000 0000 0000 0000 0000 0000 0000", "total_amount": 86.19, "total_discounts": 0.0, "payment_type": "CREDIT_CARD", "raw_html": "<!DOCTYPE html PUBLIC \\" -//W3C//DTD XHTML 1.0 Transitional//EN\\"\\n        \\"http://www.w3.org/TR/xhtml1/DTD/xhtml1-transitional.dtd\\">\\n\\n<meta content=\\"IE=9, IE=edge\\" http-equiv=\\"X-UA-Compatible\\"/>\\n<meta charset=\\"utf-8\\"/>\\n<meta content=\\"width=device-width, initial-scale=1\\" name=\\"viewport\\"/>\\n<link href=\\"../Content/Estilos/Nfce/QrCode/css/jquery.mobile-1.4.5.min.css\\" rel=\\"stylesheet\\" type=\\"text/css\\"/>\\n<link href=\\"../Content/Estilos/Nfce/QrCode/css/nfceMob.css\\" rel=\\"stylesheet\\" type=\\"text/css\\"/>\\n<link href=\\"../Content/Estilos/Nfce/QrCode/css/nfceMob_ie.css\\" rel=\\"stylesheet\\" type=\\"text/css\\"/>\\n<div data-role=\\"header\\" xmlns:chave=\\"http://exslt.org/chaveacesso\\" xmlns:n=\\"http://www.portalfiscal.inf.br/nfe\\" xmlns:r=\\"http://www.serpro.gov.br/nfe/remessanfe.xsd\\">\\n<h1 class=\\"tit\\"><img alt=\\"NFC-e\\" height=\\"64\\" src=\\"../Content/Estilos/Nfce/QrCode/images/logoNFCe.png\\" width=\\"90\\"/>\\n<p>DOCUMENTO AUXILIAR DA NOTA FISCAL DE CONSUMIDOR ELETR\\u00d4NICA</p>\\n<p></p></h1>\\n</div>\\n<div data-role=\\"content\\" xmlns:chave=\\"http://exslt.org/chaveacesso\\" xmlns:n=\\"http://www.portalfiscal.inf.br/nfe\\" xmlns:r=\\"http://www.serpro.gov.br/nfe/remessanfe.xsd\\">\\n<div id=\\"conteudo\\">\\n<div class=\\"txtCenter\\">\\n<div class=\\"txtTopo\\" id=\\"u20\\">SUPERMERCADO</div>\\n<div class=\\"text\\">\\n                CNPJ:\\n                00.000.000/0001-00\\n            </div>\\n<div class=\\"text\\">ALGUMA RUA\\n                ,\\n                100\\n                ,\\n\\n                ,\\n                ALGUM BAIRRO\\n                ,\\n                PORTO ALEGRE\\n                ,\\n                RS\\n            </div>\\n</div>\\n<table align=\\"center\\" border=\\"0\\" cellpadding=\\"0\\" cellspacing=\\"0\\" data-filter=\\"true\\" id=\\"tabResult\\">\\n<tr id=\\"Item + 1\\">\\n<td valign=\\"top\\"><span class=\\"txtTit\\">TOMATE LONGA VIDA GRANEL</span><span class=\\"RCod\\">\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t(C\\u00f3digo:\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t2009490000000\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t)\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t</span><br/><span class=\\"Rqtd\\"><strong>Qtde.:</strong>0,39</span><span class=\\"RUN\\"><strong>UN: </strong>KG</span><span class=\\"RvlUnit\\"><strong>Vl. Unit.:</strong>\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t\\u00a0\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t6,59</span></td>\\n<td align=\\"right\\" class=\\"txtTit noWrap\\" valign=\\"top\\">\\n                    Vl. Total\\n                    <br/><span class=\\"valor\\">2,57</span></td>\\n</tr>\\n<tr id=\\"Item + 2\\">\\n<td valign=\\"top\\"><span class=\\"txtTit\\">AMENDOIM C CASCA</span><span class=\\"RCod\\">\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t(C\\u00f3digo:\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t2375250000000\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t)\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t</span><br/><span class=\\"Rqtd\\"><strong>Qtde.:</strong>0,1361</span><span class=\\"RUN\\"><strong>UN: </strong>KG</span><span class=\\"RvlUnit\\"><strong>Vl. Unit.:</strong>\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t\\u00a0\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t29,9</span></td>\\n<td align=\\"right\\" class=\\"txtTit noWrap\\" valign=\\"top\\">\\n                    Vl. Total\\n                    <br/><span class=\\"valor\\">4,07</span></td>\\n</tr>\\n<tr id=\\"Item + 3\\">\\n<td valign=\\"top\\"><span class=\\"txtTit\\">PEITO PERU SADIA DEFUMADO AT</span><span class=\\"RCod\\">\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t(C\\u00f3digo:\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t2541020000000\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t)\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t</span><br/><span class=\\"Rqtd\\"><strong>Qtde.:</strong>0,2439</span><span class=\\"RUN\\"><strong>UN: </strong>KG</span><span class=\\"RvlUnit\\"><strong>Vl. Unit.:</strong>\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t\\u00a0\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t61,9</span></td>\\n<td align=\\"right\\" class=\\"txtTit noWrap\\" valign=\\"top\\">\\n                    Vl. Total\\n                    <br/><span class=\\"valor\\">15,10</span></td>\\n</tr>\\n<tr id=\\"Item + 4\\">\\n<td valign=\\"top\\"><span class=\\"txtTit\\">QJO MUSSARELA LACMAX AT</span><span class=\\"RCod\\">\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t(C\\u00f3digo:\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t2152330000002\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t)\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t</span><br/><span class=\\"Rqtd\\"><strong>Qtde.:</strong>0,116</span><span class=\\"RUN\\"><strong>UN: </strong>KG</span><span class=\\"RvlUnit\\"><strong>Vl. Unit.:</strong>\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t\\u00a0\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t58,9</span></td>\\n<td align=\\"right\\" class=\\"txtTit noWrap\\" valign=\\"top\\">\\n                    Vl. Total\\n                    <br/><span class=\\"valor\\">6,83</span></td>\\n</tr>\\n<tr id=\\"Item + 5\\">\\n<td valign=\\"top\\"><span class=\\"txtTit\\">PAO CACETINHO               .ZAF</span><span class=\\"RCod\\">\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t(C\\u00f3digo:\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t2650230000004\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t)\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t</span><br/><span class=\\"Rqtd\\"><strong>Qtde.:</strong>0,4144</span><span class=\\"RUN\\"><strong>UN: </strong>KG</span><span class=\\"RvlUnit\\"><strong>Vl. Unit.:</strong>\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t\\u00a0\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t12,5</span></td>\\n<td align=\\"right\\" class=\\"txtTit noWrap\\" valign=\\"top\\">\\n                    Vl. Total\\n                    <br/><span class=\\"valor\\">5,18</span></td>\\n</tr>\\n<tr id=\\"Item + 6\\">\\n<td valign=\\"top\\"><span class=\\"txtTit\\">CHOC NEUGEBAUER NAPOLIT 70G</span><span class=\\"RCod\\">\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t(C\\u00f3digo:\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t7891330014934\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t)\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t</span><br/><span class=\\"Rqtd\\"><strong>Qtde.:</strong>1</span><span class=\\"RUN\\"><strong>UN: </strong>UN</span><span class=\\"RvlUnit\\"><strong>Vl. Unit.:</strong>\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t\\u00a0\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t3,27</span></td>\\n<td align=\\"right\\" class=\\"txtTit noWrap\\" valign=\\"top\\">\\n                    Vl. Total\\n                    <br/><span class=\\"valor\\">3,27</span></td>\\n</tr>\\n<tr id=\\"Item + 7\\">\\n<td valign=\\"top\\"><span class=\\"txtTit\\">BEB L YOPRO CHOC Z.L 25 250ML</span><span class=\\"RCod\\">\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t(C\\u00f3digo:\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t7891025118978\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t)\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t</span><br/><span class=\\"Rqtd\\"><strong>Qtde.:</strong>2</span><span class=\\"RUN\\"><strong>UN: </strong>UN</span><span class=\\"RvlUnit\\"><strong>Vl. Unit.:</strong>\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t\\u00a0\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t9,9</span></td>\\n<td align=\\"right\\" class=\\"txtTit noWrap\\" valign=\\"top\\">\\n                    Vl. Total\\n                    <br/><span class=\\"valor\\">19,80</span></td>\\n</tr>\\n<tr id=\\"Item + 8\\">\\n<td valign=\\"top\\"><span class=\\"txtTit\\">ANTIUMIDADE JIMO IN RF200G</span><span class=\\"RCod\\">\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t(C\\u00f3digo:\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t7896027093094\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t)\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t</span><br/><span class=\\"Rqtd\\"><strong>Qtde.:</strong>2</span><span class=\\"RUN\\"><strong>UN: </strong>UN</span><span class=\\"RvlUnit\\"><strong>Vl. Unit.:</strong>\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t\\u00a0\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t11,9</span></td>\\n<td align=\\"right\\" class=\\"txtTit noWrap\\" valign=\\"top\\">\\n                    Vl. Total\\n                    <br/><span class=\\"valor\\">23,80</span></td>\\n</tr>\\n<tr id=\\"Item + 9\\">\\n<td valign=\\"top\\"><span class=\\"txtTit\\">LAV LOUCA SPLENDO COCO 500ML</span><span class=\\"RCod\\">\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t(C\\u00f3digo:\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t7896333033401\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t)\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t</span><br/><span class=\\"Rqtd\\"><strong>Qtde.:</strong>1</span><span class=\\"RUN\\"><strong>UN: </strong>UN</span><span class=\\"RvlUnit\\"><strong>Vl. Unit.:</strong>\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t\\u00a0\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t2,09</span></td>\\n<td align=\\"right\\" class=\\"txtTit noWrap\\" valign=\\"top\\">\\n                    Vl. Total\\n                    <br/><span class=\\"valor\\">2,09</span></td>\\n</tr>\\n<tr id=\\"Item + 10\\">\\n<td valign=\\"top\\"><span class=\\"txtTit\\">VINAG ALCOOL WINNA 750ML</span><span class=\\"RCod\\">\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t(C\\u00f3digo:\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t7896407500358\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t)\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t</span><br/><span class=\\"Rqtd\\"><strong>Qtde.:</strong>1</span><span class=\\"RUN\\"><strong>UN: </strong>UN</span><span class=\\"RvlUnit\\"><strong>Vl. Unit.:</strong>\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t\\u00a0\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t1,89</span></td>\\n<td align=\\"right\\" class=\\"txtTit noWrap\\" valign=\\"top\\">\\n                    Vl. Total\\n                    <br/><span class=\\"valor\\">1,89</span></td>\\n</tr>\\n<tr id=\\"Item + 11\\">\\n<td valign=\\"top\\"><span class=\\"txtTit\\">BALA HALLS EXTRA FORTE 27,5G</span><span class=\\"RCod\\">\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t(C\\u00f3digo:\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t0000078938816\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t)\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t</span><br/><span class=\\"Rqtd\\"><strong>Qtde.:</strong>1</span><span class=\\"RUN\\"><strong>UN: </strong>UN</span><span class=\\"RvlUnit\\"><strong>Vl. Unit.:</strong>\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t\\u00a0\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t1,59</span></td>\\n<td align=\\"right\\" class=\\"txtTit noWrap\\" valign=\\"top\\">\\n                    Vl. Total\\n                    <br/><span class=\\"valor\\">1,59</span></td>\\n</tr>\\n</table>\\n<div class=\\"txtRight\\" id=\\"totalNota\\">\\n<div id=\\"linhaTotal\\"><label>Qtd. total de itens:</label><span class=\\"totalNumb\\">11</span></div>\\n<div class=\\"linhaShade\\" id=\\"linhaTotal\\"><label>Valor a pagar R$:</label><span class=\\"totalNumb txtMax\\">86,19</span></div>\\n<div id=\\"linhaForma\\"><label>Forma de pagamento:</label><span class=\\"totalNumb txtTitR\\">Valor pago R$:</span>\\n</div>\\n<div id=\\"linhaTotal\\"><label class=\\"tx\\">\\n                Cart\\u00e3o de Cr\\u00e9dito\\n            </label><span class=\\"totalNumb\\">86,19</span></div>\\n<div id=\\"linhaTotal\\"></div>\\n<div class=\\"spcTop\\" id=\\"linhaTotal\\"><label class=\\"txtObs\\">Informa\\u00e7\\u00e3o dos Tributos Totais Incidentes\\n                (Lei Federal 12.741/2012)\\u00a0R$</label><span class=\\"totalNumb txtObs\\">0,00</span></div>\\n</div>\\n</div>\\n<div class=\\"txtCenter\\" id=\\"infos\\">\\n<div data-collapsed=\\"false\\" data-collapsed-icon=\\"carat-d\\" data-expanded-icon=\\"carat-u\\" data-role=\\"collapsible\\">\\n<h4>Informa\\u00e7\\u00f5es gerais da Nota</h4>\\n<ul data-inset=\\"false\\" data-role=\\"listview\\">\\n<li><strong>EMISS\\u00c3O NORMAL</strong><br/><br/><strong>N\\u00famero: </strong>123789<strong> S\\u00e9rie: </strong>123<strong>\\n                    Emiss\\u00e3o: </strong>01/01/2022 16:57:49\\n                    - Via Consumidor 2\\n                    <br/><br/><strong>Protocolo de Autoriza\\u00e7\\u00e3o: </strong>143220972242161 01/01/2022\\n                    \\u00e0s\\n                    16:57:49<br/><br/><strong>\\n                        Ambiente de Produ\\u00e7\\u00e3o -\\n\\n                        Vers\\u00e3o XML:\\n                        4.00\\n                        - Vers\\u00e3o XSLT: 2.07\\n                    </strong></li>\\n</ul>\\n</div>\\n<div data-collapsed=\\"false\\" data-collapsed-icon=\\"carat-d\\" data-expanded-icon=\\"carat-u\\" data-role=\\"collapsible\\">\\n<h4>Chave de acesso</h4>\\n<ul data-inset=\\"false\\" data-role=\\"listview\\">\\n<li>\\n                    Consulte pela Chave de Acesso em\\n\\n                    https://www.sefaz.rs.gov.br/nfce/consulta<br/><br/><strong>Chave de acesso:</strong><br/><span class=\\"chave\\">0000 0000 0000 0000 0000 0000 0000 0000 0000 0000 0000</span></li>\\n</ul>\\n</div>\\n<div data-collapsed=\\"false\\" data-collapsed-icon=\\"carat-d\\" data-expanded-icon=\\"carat-u\\" data-role=\\"collapsible\\">\\n<h4>Consumidor</h4>\\n<ul data-inset=\\"false\\" data-role=\\"listview\\">\\n<li><strong>Consumidor n\\u00e3o identificado</strong></li>\\n</ul>\\n</div>\\n<div data-collapsed=\\"false\\" data-collapsed-icon=\\"carat-d\\" data-expanded-icon=\\"carat-u\\" data-role=\\"collapsible\\">\\n<h4>Informa\\u00e7\\u00f5es de interesse do contribuinte</h4>\\n<ul data-inset=\\"false\\" data-role=\\"listview\\">\\n<li>Trib aprox R$ 11,74 Federal, R$ 12,64 Estadual Fonte: IBPT 9B0A66</li>\\n</ul>\\n</div>\\n</div>\\n</div>\\n<script src=\\"../Content/Estilos/Nfce/QrCode/js/jquery.js\\"></script>\\n<script src=\\"../Content/Estilos/Nfce/QrCode/js/jqueryui.js\\"></script>\\n<script src=\\"../Content/Estilos/Nfce/QrCode/js/jquery.mobile-1.4.5.min.js\\"></script>\\n<script src=\\"../Content/Estilos/Nfce/QrCode/js/index.js\\"></script>\\n", "items": [{"barcode": "2009490000000", "description": "TOMATE LONGA VIDA GRANEL", "quantity": 0.39, "metric_unit": "KG", "unitary_price": 6.59, "total_price": 2.57}, {"barcode": "2375250000000", "description": "AMENDOIM C CASCA", "quantity": 0.1361, "metric_unit": "KG", "unitary_price": 29.9, "total_price": 4.07}, {"barcode": "2541020000000", "description": "PEITO PERU SADIA DEFUMADO AT", "quantity": 0.2439, "metric_unit": "KG", "unitary_price": 61.9, "total_price": 15.1}, {"barcode": "2152330000002", "description": "QJO MUSSARELA LACMAX AT", "quantity": 0.116, "metric_unit": "KG", "unitary_price": 58.9, "total_price": 6.83}, {"barcode": "2650230000004", "description": "PAO CACETINHO .ZAF", "quantity": 0.4144, "metric_unit": "KG", "unitary_price": 12.5, "total_price": 5.18}, {"barcode": "7891330014934", "description": "CHOC NEUGEBAUER NAPOLIT 70G", "quantity": 1, "metric_unit": "UNIT", "unitary_price": 3.27, "total_price": 3.27}, {"barcode": "7891025118978", "description": "BEB L YOPRO CHOC Z.L 25 250ML", "quantity": 2, "metric_unit": "UNIT", "unitary_price": 9.9, "total_price": 19.8}, {"barcode": "7896027093094", "description": "ANTIUMIDADE JIMO IN RF200G", "quantity": 2, "metric_unit": "UNIT", "unitary_price": 11.9, "total_price": 23.8}, {"barcode": "7896333033401", "description": "LAV LOUCA SPLENDO COCO 500ML", "quantity": 1, "metric_unit": "UNIT", "unitary_price": 2.09, "total_price": 2.09}, {"barcode": "7896407500358", "description": "VINAG ALCOOL WINNA 750ML", "quantity": 1, "metric_unit": "UNIT", "unitary_price": 1.89, "total_price": 1.89}, {"barcode": "0000078938816", "description": "BALA HALLS EXTRA FORTE 27,5G", "quantity": 1, "metric_unit": "UNIT", "unitary_price": 1.59, "total_price": 1.59}]}'
+] = '{"issuer": {"name": "SUPERMERCADO", "national_registration_code": "00.000.000/0001-00", "state_registration_code": null, "address": {"line1": "ALGUMA RUA 100 ALGUM BAIRRO", "line2": null, "city": "PORTO ALEGRE", "state": "RS", "country": "BR", "zip_code": null}}, "consumer": {"identification": "Consumidor n\\u00e3o identificado"}, "issued_date": "2022-01-01T19:57:49+00:00", "access_key": "0000 0000 0000 0000 0000 0000 0000 0000 0000 0000 0000", "total_amount": 86.19, "total_discounts": 0.0, "total_charges": 0.0, "payment_type": "CREDIT_CARD", "raw_html": "<!DOCTYPE html PUBLIC \\" -//W3C//DTD XHTML 1.0 Transitional//EN\\"\\n        \\"http://www.w3.org/TR/xhtml1/DTD/xhtml1-transitional.dtd\\">\\n<meta http-equiv=\\"X-UA-Compatible\\" content=\\"IE=9, IE=edge\\"/>\\n<meta charset=\\"utf-8\\"/>\\n<meta name=\\"viewport\\" content=\\"width=device-width, initial-scale=1\\"/>\\n<link href=\'../Content/Estilos/Nfce/QrCode/css/jquery.mobile-1.4.5.min.css\' rel=\'stylesheet\' type=\'text/css\'>\\n<link href=\'../Content/Estilos/Nfce/QrCode/css/nfceMob.css\' rel=\'stylesheet\' type=\'text/css\'>\\n<link href=\'../Content/Estilos/Nfce/QrCode/css/nfceMob_ie.css\' rel=\'stylesheet\' type=\'text/css\'>\\n<div data-role=\\"header\\" xmlns:n=\\"http://www.portalfiscal.inf.br/nfe\\" xmlns:chave=\\"http://exslt.org/chaveacesso\\"\\n     xmlns:r=\\"http://www.serpro.gov.br/nfe/remessanfe.xsd\\">\\n    <h1 class=\\"tit\\"><img src=\\"../Content/Estilos/Nfce/QrCode/images/logoNFCe.png\\" width=\\"90\\" height=\\"64\\" alt=\\"NFC-e\\"/>\\n        <p>DOCUMENTO AUXILIAR DA NOTA FISCAL DE CONSUMIDOR ELETR\\u00d4NICA</p>\\n        <p/></h1>\\n</div>\\n<div data-role=\\"content\\" xmlns:n=\\"http://www.portalfiscal.inf.br/nfe\\" xmlns:chave=\\"http://exslt.org/chaveacesso\\"\\n     xmlns:r=\\"http://www.serpro.gov.br/nfe/remessanfe.xsd\\">\\n    <div id=\\"conteudo\\">\\n        <div class=\\"txtCenter\\">\\n            <div id=\\"u20\\" class=\\"txtTopo\\">SUPERMERCADO</div>\\n            <div class=\\"text\\">\\n                CNPJ:\\n                00.000.000/0001-00\\n            </div>\\n            <div class=\\"text\\">ALGUMA RUA\\n                ,\\n                100\\n                ,\\n\\n                ,\\n                ALGUM BAIRRO\\n                ,\\n                PORTO ALEGRE\\n                ,\\n                RS\\n            </div>\\n        </div>\\n        <table border=\\"0\\" align=\\"center\\" cellpadding=\\"0\\" cellspacing=\\"0\\" id=\\"tabResult\\" data-filter=\\"true\\">\\n            <tr id=\\"Item + 1\\">\\n                <td valign=\\"top\\"><span class=\\"txtTit\\">TOMATE LONGA VIDA GRANEL</span><span class=\\"RCod\\">\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t(C\\u00f3digo:\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t2009490000000\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t)\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t</span><br/><span class=\\"Rqtd\\"><strong>Qtde.:</strong>0,39</span><span\\n                        class=\\"RUN\\"><strong>UN: </strong>KG</span><span class=\\"RvlUnit\\"><strong>Vl. Unit.:</strong>\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t\\u00a0\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t6,59</span></td>\\n                <td align=\\"right\\" valign=\\"top\\" class=\\"txtTit noWrap\\">\\n                    Vl. Total\\n                    <br/><span class=\\"valor\\">2,57</span></td>\\n            </tr>\\n            <tr id=\\"Item + 2\\">\\n                <td valign=\\"top\\"><span class=\\"txtTit\\">AMENDOIM C CASCA</span><span class=\\"RCod\\">\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t(C\\u00f3digo:\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t2375250000000\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t)\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t</span><br/><span class=\\"Rqtd\\"><strong>Qtde.:</strong>0,1361</span><span\\n                        class=\\"RUN\\"><strong>UN: </strong>KG</span><span class=\\"RvlUnit\\"><strong>Vl. Unit.:</strong>\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t\\u00a0\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t29,9</span></td>\\n                <td align=\\"right\\" valign=\\"top\\" class=\\"txtTit noWrap\\">\\n                    Vl. Total\\n                    <br/><span class=\\"valor\\">4,07</span></td>\\n            </tr>\\n            <tr id=\\"Item + 3\\">\\n                <td valign=\\"top\\"><span class=\\"txtTit\\">PEITO PERU SADIA DEFUMADO AT</span><span class=\\"RCod\\">\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t(C\\u00f3digo:\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t2541020000000\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t)\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t</span><br/><span class=\\"Rqtd\\"><strong>Qtde.:</strong>0,2439</span><span\\n                        class=\\"RUN\\"><strong>UN: </strong>KG</span><span class=\\"RvlUnit\\"><strong>Vl. Unit.:</strong>\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t\\u00a0\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t61,9</span></td>\\n                <td align=\\"right\\" valign=\\"top\\" class=\\"txtTit noWrap\\">\\n                    Vl. Total\\n                    <br/><span class=\\"valor\\">15,10</span></td>\\n            </tr>\\n            <tr id=\\"Item + 4\\">\\n                <td valign=\\"top\\"><span class=\\"txtTit\\">QJO MUSSARELA LACMAX AT</span><span class=\\"RCod\\">\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t(C\\u00f3digo:\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t2152330000002\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t)\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t</span><br/><span class=\\"Rqtd\\"><strong>Qtde.:</strong>0,116</span><span class=\\"RUN\\"><strong>UN: </strong>KG</span><span\\n                        class=\\"RvlUnit\\"><strong>Vl. Unit.:</strong>\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t\\u00a0\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t58,9</span></td>\\n                <td align=\\"right\\" valign=\\"top\\" class=\\"txtTit noWrap\\">\\n                    Vl. Total\\n                    <br/><span class=\\"valor\\">6,83</span></td>\\n            </tr>\\n            <tr id=\\"Item + 5\\">\\n                <td valign=\\"top\\"><span class=\\"txtTit\\">PAO CACETINHO               .ZAF</span><span class=\\"RCod\\">\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t(C\\u00f3digo:\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t2650230000004\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t)\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t</span><br/><span class=\\"Rqtd\\"><strong>Qtde.:</strong>0,4144</span><span\\n                        class=\\"RUN\\"><strong>UN: </strong>KG</span><span class=\\"RvlUnit\\"><strong>Vl. Unit.:</strong>\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t\\u00a0\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t12,5</span></td>\\n                <td align=\\"right\\" valign=\\"top\\" class=\\"txtTit noWrap\\">\\n                    Vl. Total\\n                    <br/><span class=\\"valor\\">5,18</span></td>\\n            </tr>\\n            <tr id=\\"Item + 6\\">\\n                <td valign=\\"top\\"><span class=\\"txtTit\\">CHOC NEUGEBAUER NAPOLIT 70G</span><span class=\\"RCod\\">\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t(C\\u00f3digo:\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t7891330014934\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t)\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t</span><br/><span class=\\"Rqtd\\"><strong>Qtde.:</strong>1</span><span\\n                        class=\\"RUN\\"><strong>UN: </strong>UN</span><span class=\\"RvlUnit\\"><strong>Vl. Unit.:</strong>\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t\\u00a0\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t3,27</span></td>\\n                <td align=\\"right\\" valign=\\"top\\" class=\\"txtTit noWrap\\">\\n                    Vl. Total\\n                    <br/><span class=\\"valor\\">3,27</span></td>\\n            </tr>\\n            <tr id=\\"Item + 7\\">\\n                <td valign=\\"top\\"><span class=\\"txtTit\\">BEB L YOPRO CHOC Z.L 25 250ML</span><span class=\\"RCod\\">\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t(C\\u00f3digo:\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t7891025118978\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t)\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t</span><br/><span class=\\"Rqtd\\"><strong>Qtde.:</strong>2</span><span\\n                        class=\\"RUN\\"><strong>UN: </strong>UN</span><span class=\\"RvlUnit\\"><strong>Vl. Unit.:</strong>\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t\\u00a0\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t9,9</span></td>\\n                <td align=\\"right\\" valign=\\"top\\" class=\\"txtTit noWrap\\">\\n                    Vl. Total\\n                    <br/><span class=\\"valor\\">19,80</span></td>\\n            </tr>\\n            <tr id=\\"Item + 8\\">\\n                <td valign=\\"top\\"><span class=\\"txtTit\\">ANTIUMIDADE JIMO IN RF200G</span><span class=\\"RCod\\">\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t(C\\u00f3digo:\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t7896027093094\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t)\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t</span><br/><span class=\\"Rqtd\\"><strong>Qtde.:</strong>2</span><span\\n                        class=\\"RUN\\"><strong>UN: </strong>UN</span><span class=\\"RvlUnit\\"><strong>Vl. Unit.:</strong>\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t\\u00a0\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t11,9</span></td>\\n                <td align=\\"right\\" valign=\\"top\\" class=\\"txtTit noWrap\\">\\n                    Vl. Total\\n                    <br/><span class=\\"valor\\">23,80</span></td>\\n            </tr>\\n            <tr id=\\"Item + 9\\">\\n                <td valign=\\"top\\"><span class=\\"txtTit\\">LAV LOUCA SPLENDO COCO 500ML</span><span class=\\"RCod\\">\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t(C\\u00f3digo:\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t7896333033401\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t)\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t</span><br/><span class=\\"Rqtd\\"><strong>Qtde.:</strong>1</span><span\\n                        class=\\"RUN\\"><strong>UN: </strong>UN</span><span class=\\"RvlUnit\\"><strong>Vl. Unit.:</strong>\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t\\u00a0\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t2,09</span></td>\\n                <td align=\\"right\\" valign=\\"top\\" class=\\"txtTit noWrap\\">\\n                    Vl. Total\\n                    <br/><span class=\\"valor\\">2,09</span></td>\\n            </tr>\\n            <tr id=\\"Item + 10\\">\\n                <td valign=\\"top\\"><span class=\\"txtTit\\">VINAG ALCOOL WINNA 750ML</span><span class=\\"RCod\\">\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t(C\\u00f3digo:\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t7896407500358\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t)\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t</span><br/><span class=\\"Rqtd\\"><strong>Qtde.:</strong>1</span><span\\n                        class=\\"RUN\\"><strong>UN: </strong>UN</span><span class=\\"RvlUnit\\"><strong>Vl. Unit.:</strong>\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t\\u00a0\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t1,89</span></td>\\n                <td align=\\"right\\" valign=\\"top\\" class=\\"txtTit noWrap\\">\\n                    Vl. Total\\n                    <br/><span class=\\"valor\\">1,89</span></td>\\n            </tr>\\n            <tr id=\\"Item + 11\\">\\n                <td valign=\\"top\\"><span class=\\"txtTit\\">BALA HALLS EXTRA FORTE 27,5G</span><span class=\\"RCod\\">\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t(C\\u00f3digo:\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t0000078938816\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t)\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t</span><br/><span class=\\"Rqtd\\"><strong>Qtde.:</strong>1</span><span\\n                        class=\\"RUN\\"><strong>UN: </strong>UN</span><span class=\\"RvlUnit\\"><strong>Vl. Unit.:</strong>\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t\\u00a0\\n\\t\\t\\t\\t\\t\\t\\t\\t\\t\\t1,59</span></td>\\n                <td align=\\"right\\" valign=\\"top\\" class=\\"txtTit noWrap\\">\\n                    Vl. Total\\n                    <br/><span class=\\"valor\\">1,59</span></td>\\n            </tr>\\n        </table>\\n        <div id=\\"totalNota\\" class=\\"txtRight\\">\\n            <div id=\\"linhaTotal\\"><label>Qtd. total de itens:</label><span class=\\"totalNumb\\">11</span></div>\\n            <div id=\\"linhaTotal\\" class=\\"linhaShade\\"><label>Valor a pagar R$:</label><span\\n                    class=\\"totalNumb txtMax\\">86,19</span></div>\\n            <div id=\\"linhaForma\\"><label>Forma de pagamento:</label><span class=\\"totalNumb txtTitR\\">Valor pago R$:</span>\\n            </div>\\n            <div id=\\"linhaTotal\\"><label class=\\"tx\\">\\n                Cart\\u00e3o de Cr\\u00e9dito\\n            </label><span class=\\"totalNumb\\">86,19</span></div>\\n            <div id=\\"linhaTotal\\"/>\\n            <div id=\\"linhaTotal\\" class=\\"spcTop\\"><label class=\\"txtObs\\">Informa\\u00e7\\u00e3o dos Tributos Totais Incidentes\\n                (Lei Federal 12.741/2012)\\u00a0R$</label><span class=\\"totalNumb txtObs\\">0,00</span></div>\\n        </div>\\n    </div>\\n    <div id=\\"infos\\" class=\\"txtCenter\\">\\n        <div data-role=\\"collapsible\\" data-collapsed-icon=\\"carat-d\\" data-expanded-icon=\\"carat-u\\" data-collapsed=\\"false\\">\\n            <h4>Informa\\u00e7\\u00f5es gerais da Nota</h4>\\n            <ul data-role=\\"listview\\" data-inset=\\"false\\">\\n                <li><strong>EMISS\\u00c3O NORMAL</strong><br/><br/><strong>N\\u00famero: </strong>123789<strong> S\\u00e9rie: </strong>123<strong>\\n                    Emiss\\u00e3o: </strong>01/01/2022 16:57:49\\n                    - Via Consumidor 2\\n                    <br/><br/><strong>Protocolo de Autoriza\\u00e7\\u00e3o: </strong>143220972242161 01/01/2022\\n                    \\u00e0s\\n                    16:57:49<br/><br/><strong>\\n                        Ambiente de Produ\\u00e7\\u00e3o -\\n\\n                        Vers\\u00e3o XML:\\n                        4.00\\n                        - Vers\\u00e3o XSLT: 2.07\\n                    </strong></li>\\n            </ul>\\n        </div>\\n        <div data-role=\\"collapsible\\" data-collapsed-icon=\\"carat-d\\" data-expanded-icon=\\"carat-u\\" data-collapsed=\\"false\\">\\n            <h4>Chave de acesso</h4>\\n            <ul data-role=\\"listview\\" data-inset=\\"false\\">\\n                <li>\\n                    Consulte pela Chave de Acesso em\\n\\n                    https://www.sefaz.rs.gov.br/nfce/consulta<br/><br/><strong>Chave de acesso:</strong><br/><span\\n                        class=\\"chave\\">0000 0000 0000 0000 0000 0000 0000 0000 0000 0000 0000</span></li>\\n            </ul>\\n        </div>\\n        <div data-role=\\"collapsible\\" data-collapsed-icon=\\"carat-d\\" data-expanded-icon=\\"carat-u\\" data-collapsed=\\"false\\">\\n            <h4>Consumidor</h4>\\n            <ul data-role=\\"listview\\" data-inset=\\"false\\">\\n                <li><strong>Consumidor n\\u00e3o identificado</strong></li>\\n            </ul>\\n        </div>\\n        <div data-role=\\"collapsible\\" data-collapsed-icon=\\"carat-d\\" data-expanded-icon=\\"carat-u\\" data-collapsed=\\"false\\">\\n            <h4>Informa\\u00e7\\u00f5es de interesse do contribuinte</h4>\\n            <ul data-role=\\"listview\\" data-inset=\\"false\\">\\n                <li>Trib aprox R$ 11,74 Federal, R$ 12,64 Estadual Fonte: IBPT 9B0A66</li>\\n            </ul>\\n        </div>\\n    </div>\\n</div>\\n<script src=\'../Content/Estilos/Nfce/QrCode/js/jquery.js\'></script>\\n<script src=\'../Content/Estilos/Nfce/QrCode/js/jqueryui.js\'></script>\\n<script src=\'../Content/Estilos/Nfce/QrCode/js/jquery.mobile-1.4.5.min.js\'></script>\\n<script src=\'../Content/Estilos/Nfce/QrCode/js/index.js\'></script>\\n", "items": [{"barcode": "2009490000000", "description": "TOMATE LONGA VIDA GRANEL", "quantity": 0.39, "metric_unit": "KG", "unitary_price": 6.59, "total_price": 2.57}, {"barcode": "2375250000000", "description": "AMENDOIM C CASCA", "quantity": 0.1361, "metric_unit": "KG", "unitary_price": 29.9, "total_price": 4.07}, {"barcode": "2541020000000", "description": "PEITO PERU SADIA DEFUMADO AT", "quantity": 0.2439, "metric_unit": "KG", "unitary_price": 61.9, "total_price": 15.1}, {"barcode": "2152330000002", "description": "QJO MUSSARELA LACMAX AT", "quantity": 0.116, "metric_unit": "KG", "unitary_price": 58.9, "total_price": 6.83}, {"barcode": "2650230000004", "description": "PAO CACETINHO .ZAF", "quantity": 0.4144, "metric_unit": "KG", "unitary_price": 12.5, "total_price": 5.18}, {"barcode": "7891330014934", "description": "CHOC NEUGEBAUER NAPOLIT 70G", "quantity": 1, "metric_unit": "UNIT", "unitary_price": 3.27, "total_price": 3.27}, {"barcode": "7891025118978", "description": "BEB L YOPRO CHOC Z.L 25 250ML", "quantity": 2, "metric_unit": "UNIT", "unitary_price": 9.9, "total_price": 19.8}, {"barcode": "7896027093094", "description": "ANTIUMIDADE JIMO IN RF200G", "quantity": 2, "metric_unit": "UNIT", "unitary_price": 11.9, "total_price": 23.8}, {"barcode": "7896333033401", "description": "LAV LOUCA SPLENDO COCO 500ML", "quantity": 1, "metric_unit": "UNIT", "unitary_price": 2.09, "total_price": 2.09}, {"barcode": "7896407500358", "description": "VINAG ALCOOL WINNA 750ML", "quantity": 1, "metric_unit": "UNIT", "unitary_price": 1.89, "total_price": 1.89}, {"barcode": "0000078938816", "description": "BALA HALLS EXTRA FORTE 27,5G", "quantity": 1, "metric_unit": "UNIT", "unitary_price": 1.59, "total_price": 1.59}]}'
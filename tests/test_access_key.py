@@ -0,0 +1,66 @@
+from nfe_scanner.access_key import (
+    decode_access_key,
+    decode_access_keys,
+    extract_access_key,
+    is_valid_access_key,
+)
+from nfe_scanner.fetchers.base import NfeUrl
+from nfe_scanner.nfe import filter_urls, index_urls, partition_urls
+
+ACCESS_KEY = "43231100000000000001650010000000011000000004"
+
+
+def test_valid_access_key():
+    assert is_valid_access_key(ACCESS_KEY)
+    assert not is_valid_access_key(ACCESS_KEY[:-1] + "1")
+    assert not is_valid_access_key(ACCESS_KEY[:-1])
+
+
+def test_extract_access_key_from_qrcode_parameter():
+    assert extract_access_key(f"{ACCESS_KEY}|2|1|1|AAAA") == ACCESS_KEY
+    assert (
+        extract_access_key(" ".join(ACCESS_KEY[i : i + 4] for i in range(0, 44, 4))) == ACCESS_KEY
+    )
+    assert extract_access_key("1") is None
+
+
+def test_index_urls_groups_duplicates_across_hosts_and_parameters():
+    urls = [
+        f"https://www.sefaz.rs.gov.br/NFCE/NFCE-COM.aspx?p={ACCESS_KEY}|2|1|1|AAAA",
+        f"https://dfe-portal.svrs.rs.gov.br/Dfe/QrCodeNFce?p={ACCESS_KEY}|2|1|1|AAAA",
+        f"https://www.sefaz.rs.gov.br/NFCE/NFCE-COM.aspx?chNFe={ACCESS_KEY}",
+        "https://www.sefaz.rs.gov.br/NFCE/NFCE-COM.aspx?p=1",
+    ]
+
+    index = index_urls(urls)
+
+    assert list(index) == [ACCESS_KEY, "1"]
+    assert [nfe_url.full for nfe_url in index[ACCESS_KEY]] == urls[:3]
+    assert NfeUrl(urls[3]).canonical_access_key is None
+
+
+def test_decode_access_key():
+    info = decode_access_key(ACCESS_KEY)
+
+    assert info.state == "RS"
+    assert info.period == (2023, 11)
+    assert info.national_registration_code == "00.000.000/0000-01"
+    assert info.model == "65"
+    assert info.series == 1
+    assert info.number == 1
+    assert list(decode_access_keys([ACCESS_KEY, "1"])) == [info]
+
+
+def test_filter_and_partition_urls():
+    nfe_urls = [
+        NfeUrl(f"https://www.sefaz.rs.gov.br/NFCE/NFCE-COM.aspx?chNFe={ACCESS_KEY}"),
+        NfeUrl("https://www.sefaz.rs.gov.br/NFCE/NFCE-COM.aspx?p=1"),
+    ]
+
+    assert filter_urls(nfe_urls, states={"SP"}) == nfe_urls[1:]
+    assert filter_urls(nfe_urls, start_period=(2023, 12)) == nfe_urls[1:]
+    assert filter_urls(nfe_urls, states={"RS"}, end_period=(2023, 11)) == nfe_urls
+    assert partition_urls(nfe_urls, lambda info: info.state) == {
+        "RS": nfe_urls[:1],
+        None: nfe_urls[1:],
+    }
@@ -0,0 +1,73 @@
+from unittest import mock
+
+import pytest
+
+pytest.importorskip("zstandard")
+
+# pylint: disable=wrong-import-position
+from nfe_scanner.archive import NfeHtmlArchive  # noqa: E402
+from nfe_scanner.exceptions import NfeArchiveException  # noqa: E402
+from nfe_scanner.parsers.base import ParseMode  # noqa: E402
+from tests.helpers import read_html  # noqa: E402
+
+ACCESS_KEY = "43231100000000000001650010000000011000000004"
+URL = f"https://dfe-portal.svrs.rs.gov.br/Dfe/QrCodeNFce?p={ACCESS_KEY}|2|1|1|AAAA"
+
+
+def test_add_and_get(tmp_path):
+    html = read_html("nfe_rs_v2.html")
+
+    with NfeHtmlArchive(tmp_path, samples=[html, read_html("nfe_rs.html")]) as archive:
+        assert archive.add(ACCESS_KEY, URL, html)
+        assert not archive.add(ACCESS_KEY, URL, html)
+
+    with NfeHtmlArchive(tmp_path) as archive:
+        assert len(archive) == 1
+        assert ACCESS_KEY in archive
+        assert archive.get(ACCESS_KEY) == html
+        assert archive.get("0" * 44) is None
+        (nfe,) = archive.parse(ParseMode.HEADER_ONLY)
+        assert nfe.issuer.name == "SUPERMERCADO"
+
+
+def test_index_grows(tmp_path):
+    with NfeHtmlArchive(tmp_path, samples=["<html></html>"]) as archive:
+        keys = [f"{i:044d}" for i in range(2000)]
+        for key in keys:
+            archive.add(key, URL, f"<html>{key}</html>")
+
+        assert len(archive) == 2000
+        assert all(archive.get(key) == f"<html>{key}</html>" for key in keys)
+
+        archive.rebuild_index()
+
+        assert len(archive) == 2000
+        assert archive.get(keys[-1]) == f"<html>{keys[-1]}</html>"
+
+
+def test_missing_archive_requires_samples(tmp_path):
+    with pytest.raises(NfeArchiveException):
+        NfeHtmlArchive(tmp_path)
+
+
+def test_interrupted_add_is_recovered(tmp_path):
+    keys = [f"{i:044d}" for i in range(3)]
+    with NfeHtmlArchive(tmp_path, samples=["<html></html>"]) as archive:
+        archive.add(keys[0], URL, "<html>0</html>")
+        archive.add(keys[1], URL, "<html>1</html>")
+    data_file = tmp_path / "pages.data"
+    # crash after the data write but before the index insert
+    with NfeHtmlArchive(tmp_path) as archive, mock.patch.object(archive, "_insert"):
+        archive.add(keys[2], URL, "<html>2</html>")
+    # then a crash in the middle of the next record, its header is complete but not its body
+    torn_record = data_file.read_bytes()[:60]
+    with open(data_file, "ab") as f:
+        f.write(torn_record)
+
+    with NfeHtmlArchive(tmp_path) as archive:
+        assert len(archive) == 3
+        assert archive.get(keys[2]) == "<html>2</html>"
+        assert len(list(archive.responses())) == 3
+        archive.rebuild_index()
+        assert archive.add("9" * 44, URL, "<html>9</html>")
+        assert archive.get("9" * 44) == "<html>9</html>"
@@ -0,0 +1,55 @@
+import json
+from decimal import Decimal
+
+from nfe_scanner.categories import UNCATEGORIZED, Categorizer, load_categorizer
+from tests.helpers import parse_nfe_rs_v2
+
+RULES = {
+    "DAIRY": ["leite", "iogurte", "queijo"],
+    "BEVERAGES": ["bebida", "leite de coco"],
+    "PRODUCE": ["tomate", "beterraba", "salsa"],
+}
+
+
+def test_categorize():
+    categorizer = Categorizer(RULES)
+
+    assert categorizer.categorize("LTE FERM YAKULT 480G") == "DAIRY"
+    assert categorizer.categorize("LEITE DE COCO 200ML") == "BEVERAGES"
+    assert categorizer.categorize("TOMATE LONGA VIDA GRANEL") == "PRODUCE"
+    # whole words only
+    assert categorizer.categorize("SALSICHA") == UNCATEGORIZED
+
+
+def test_category_totals():
+    nfe = parse_nfe_rs_v2()
+
+    totals = Categorizer(RULES).category_totals(nfe)
+
+    assert sum(totals.values()) == sum(item.total_price for item in nfe.items)
+    assert totals["PRODUCE"] > Decimal(0)
+
+
+def test_load_categorizer_uses_cache(tmp_path):
+    rules_file = tmp_path / "rules.json"
+    rules_file.write_text(json.dumps(RULES), encoding="utf-8")
+
+    categorizer = load_categorizer(rules_file)
+    (cache_file,) = tmp_path.glob(".rules-*.automaton.json")
+    cached = load_categorizer(rules_file)
+
+    assert cache_file.exists()
+    assert cached is not categorizer
+    assert cached.fingerprint == categorizer.fingerprint
+    assert cached.categorize("QUEIJO MUSSARELA") == "DAIRY"
+
+
+def test_load_categorizer_ignores_cache_of_other_rules(tmp_path):
+    rules_file = tmp_path / "rules.json"
+    rules_file.write_text(json.dumps(RULES), encoding="utf-8")
+    load_categorizer(rules_file)
+    (cache_file,) = tmp_path.glob(".rules-*.automaton.json")
+    tables = Categorizer({"OTHER": ["queijo"]}).tables()
+    cache_file.write_text(json.dumps(tables), encoding="utf-8")
+
+    assert load_categorizer(rules_file).categorize("QUEIJO MUSSARELA") == "DAIRY"
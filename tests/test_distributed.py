@@ -0,0 +1,107 @@
+from unittest import mock
+
+from nfe_scanner.distributed import ScanCoordinator, ScanWorker
+from nfe_scanner.exceptions import NfeParserException
+from nfe_scanner.fetchers.base import NfeUrl
+from tests.helpers import parse_nfe_rs_v2
+
+HOST = "https://dfe-portal.svrs.rs.gov.br/Dfe/QrCodeNFce?p="
+URLS = [f"{HOST}{index}" for index in range(10)]
+
+
+def scan(nfe_url: NfeUrl, *_):
+    if nfe_url.access_key.startswith("9"):
+        raise NfeParserException("broken page")
+    if nfe_url.access_key.startswith("8"):
+        raise ConnectionError("connection reset")
+    nfe = parse_nfe_rs_v2()
+    nfe.access_key = nfe_url.dedup_key
+    return nfe
+
+
+@mock.patch("nfe_scanner.distributed.scan_nfe", side_effect=scan)
+def test_each_access_key_is_scanned_once(scan_nfe, tmp_path):
+    coordinator = ScanCoordinator(str(tmp_path / "work.db"))
+
+    assert coordinator.submit(URLS + URLS[:3], shard_count=4) == 10
+    assert coordinator.submit(URLS[:5]) == 0
+    assert ScanWorker(coordinator, "a").run(max_shards=2) == 2
+    assert ScanWorker(ScanCoordinator(coordinator.filename), "b").run() == 2
+
+    progress = coordinator.progress()
+    assert (progress.total, progress.done, progress.failed) == (10, 8, 2)
+    assert progress.shards_done == progress.shards == 4
+    assert scan_nfe.call_count == 10
+    assert sorted(nfe.access_key for nfe in coordinator.results()) == [str(i) for i in range(8)]
+    assert [url for url, _ in coordinator.errors()] == URLS[8:]
+
+
+@mock.patch("nfe_scanner.distributed.scan_nfe", side_effect=scan)
+def test_expired_lease_is_requeued(_scan_nfe, tmp_path):
+    coordinator = ScanCoordinator(str(tmp_path / "work.db"), lease_seconds=-1)
+    coordinator.submit(URLS[:1], shard_count=1)
+    stale_lease = coordinator.lease("stale")
+
+    assert coordinator.requeue_expired() == 1
+    lease = coordinator.lease("fresh")
+    (nfe_url,) = coordinator.pending_urls(lease)
+
+    assert not coordinator.complete(stale_lease, nfe_url, error="too late")
+    assert coordinator.complete(lease, nfe_url, nfe=scan(nfe_url))
+    assert not coordinator.complete(lease, nfe_url, nfe=scan(nfe_url))
+    coordinator.release(lease)
+    assert coordinator.lease("other") is None
+    assert coordinator.progress().done == 1
+
+
+def test_shard_fails_after_max_attempts(tmp_path):
+    coordinator = ScanCoordinator(str(tmp_path / "work.db"), lease_seconds=-1, max_attempts=2)
+    coordinator.submit(URLS[:3], shard_count=1)
+
+    # workers dying before finishing the shard
+    assert coordinator.lease("a") is not None
+    assert coordinator.lease("b") is not None
+    assert coordinator.lease("c") is None
+
+    progress = coordinator.progress()
+    assert progress.finished
+    assert (progress.failed, progress.shards_failed) == (3, 1)
+    assert [url for url, _ in coordinator.errors()] == URLS[:3]
+
+    # new work reopens the shard with fresh attempts
+    coordinator.submit(URLS[3:4], shard_count=1)
+    assert coordinator.lease("d").shard == 0
+
+
+def test_urls_submitted_during_a_lease_are_scanned(tmp_path):
+    coordinator = ScanCoordinator(str(tmp_path / "work.db"))
+    coordinator.submit(URLS[:1], shard_count=1)
+
+    def scan_and_submit(nfe_url: NfeUrl, *args):
+        coordinator.submit(URLS[1:2], shard_count=1)
+        return scan(nfe_url, *args)
+
+    with mock.patch("nfe_scanner.distributed.scan_nfe", side_effect=scan_and_submit):
+        assert ScanWorker(coordinator, "a").run(max_shards=1) == 1
+        assert not coordinator.progress().finished
+        assert ScanWorker(coordinator, "b").run() == 1
+
+    progress = coordinator.progress()
+    assert progress.finished
+    assert progress.done == 2
+
+
+@mock.patch("nfe_scanner.distributed.scan_nfe", side_effect=scan)
+def test_worker_waits_for_the_leases_of_crashed_workers(_scan_nfe, tmp_path):
+    coordinator = ScanCoordinator(str(tmp_path / "work.db"))
+    coordinator.submit(URLS, shard_count=4)
+    coordinator.lease("crashed")
+
+    def expire_leases(_seconds):
+        coordinator.connection.execute("UPDATE work_shard SET lease_expires = 0")
+
+    with mock.patch("nfe_scanner.distributed.time.sleep", side_effect=expire_leases) as sleep:
+        assert ScanWorker(coordinator, "survivor").run() == 4
+
+    assert sleep.call_count == 1
+    assert coordinator.progress().shards_done == 4
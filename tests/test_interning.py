@@ -0,0 +1,47 @@
+import io
+
+from nfe_scanner.interning import INTERN_POOL, InternPool
+from nfe_scanner.models import Nfe
+from nfe_scanner.parsers.xml import parse_xml_stream
+from tests.helpers import parse_nfe_rs_v2
+from tests.test_parse_nfe_xml import XML_DIR
+
+
+def test_parsed_nfes_share_issuer_and_item_strings():
+    nfe = parse_nfe_rs_v2()
+    other = parse_nfe_rs_v2()
+
+    assert other.issuer is nfe.issuer
+    assert other.items[0].description is nfe.items[0].description
+    assert other.items[0].barcode is nfe.items[0].barcode
+    assert len(INTERN_POOL) > 0
+
+
+def test_intern_deserialized_nfe():
+    pool = InternPool()
+    nfe = pool.intern_nfe(parse_nfe_rs_v2())
+
+    deserialized = pool.intern_nfe(Nfe.parse_raw(nfe.json()))
+
+    assert deserialized.issuer is nfe.issuer
+    assert deserialized.items[0].description is nfe.items[0].description
+    assert deserialized == nfe
+
+
+def test_issuers_with_the_same_cnpj_are_kept_apart():
+    html_nfe = parse_nfe_rs_v2()
+    xml_nfe = parse_xml_stream(io.BytesIO((XML_DIR / "nfe_rs.xml").read_bytes()))
+
+    assert xml_nfe.issuer.national_registration_code == html_nfe.issuer.national_registration_code
+    assert xml_nfe.issuer is not html_nfe.issuer
+    assert xml_nfe.issuer.state_registration_code is not None
+    assert xml_nfe.issuer.address.zip_code is not None
+
+
+def test_pool_is_bounded():
+    pool = InternPool(max_entries=2)
+
+    for index in range(5):
+        pool.item_strings(str(index), "ITEM")
+
+    assert len(pool) <= 2
@@ -0,0 +1,20 @@
+import io
+import json
+from unittest import mock
+
+from nfe_scanner.reports.jsonl import JsonlWriter
+from tests.helpers import parse_nfe_rs_v2
+
+
+def test_jsonl_writer_buffers_lines():
+    nfe = parse_nfe_rs_v2()
+    f = mock.MagicMock(wraps=io.BytesIO())
+
+    with JsonlWriter(f, buffer_size=10_000_000) as writer:
+        writer.write(nfe)
+        writer.write(nfe)
+        assert not f.write.called
+
+    lines = f.getvalue().splitlines()
+    assert f.write.call_count == 1
+    assert [json.loads(line)["access_key"] for line in lines] == [nfe.access_key] * 2
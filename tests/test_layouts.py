@@ -0,0 +1,131 @@
+from unittest import mock
+
+import pytest
+import requests
+
+from nfe_scanner.exceptions import (
+    NfeFetcherException,
+    NfeParserException,
+    NfeUnknownLayoutException,
+)
+from nfe_scanner.fetchers.base import NfeFetcherResponse, NfeFetcherResponseType, NfeUrl
+from nfe_scanner.nfe import scan_multiple_nfe
+from nfe_scanner.parsers.factory import NfeParserFactory
+from nfe_scanner.parsers.html import NfeHtmlParser, NfeHtmlParser2
+from nfe_scanner.registry import REGISTRY
+from tests.helpers import read_html
+
+URL = NfeUrl("https://dfe-portal.svrs.rs.gov.br/Dfe/QrCodeNFce?p=1")
+
+
+def create_parser(text: str):
+    response = NfeFetcherResponse(URL, text, NfeFetcherResponseType.HTML, True)
+    return NfeParserFactory(URL, response).create()
+
+
+@pytest.mark.parametrize(
+    "html_file, parser_class",
+    [("nfe_rs_v2.html", NfeHtmlParser2), ("nfe_rs.html", NfeHtmlParser)],
+)
+def test_parser_is_chosen_by_layout(html_file, parser_class):
+    assert isinstance(create_parser(read_html(html_file)), parser_class)
+
+
+def test_same_template_has_same_fingerprint():
+    layouts = REGISTRY.lookup(URL.host).layouts
+    text = read_html("nfe_rs_v2.html")
+
+    layout, fingerprint = layouts.detect(text)
+
+    assert layout.name == "sefaz-rs-v2"
+    assert layouts.detect(text.replace("Item + 1", "Item + 99")) == (layout, fingerprint)
+
+
+def test_unknown_layout_is_rejected_before_parsing():
+    with pytest.raises(NfeUnknownLayoutException, match="fingerprint="):
+        create_parser("<html><body><div class='maintenance'>Fora do ar</div></body></html>")
+
+
+@mock.patch(
+    "nfe_scanner.fetchers.html.NfeHtmlFetcher.maybe_process_iframe",
+    side_effect=lambda _session, resp: resp,
+)
+@mock.patch("requests_html.HTMLSession.get")
+def test_scan_multiple_skips_bad_pages(requests_get, _maybe_process_iframe):
+    pages = {
+        "p=1": "<html><body><p>Fora do ar</p></body></html>",
+        "p=2": read_html("nfe_rs_v2.html"),
+    }
+    requests_get.side_effect = lambda url, **_: mock.MagicMock(
+        text=pages[url.rpartition("?")[2]], ok=True
+    )
+    errors = []
+
+    nfes = scan_multiple_nfe(
+        [
+            "https://dfe-portal.svrs.rs.gov.br/Dfe/QrCodeNFce?p=1",
+            "https://dfe-portal.svrs.rs.gov.br/Dfe/QrCodeNFce?p=2",
+        ],
+        on_error=lambda nfe_url, err: errors.append((nfe_url.full, type(err))),
+    )
+
+    assert len(nfes) == 1
+    assert errors == [
+        ("https://dfe-portal.svrs.rs.gov.br/Dfe/QrCodeNFce?p=1", NfeUnknownLayoutException)
+    ]
+
+
+@mock.patch(
+    "nfe_scanner.fetchers.html.NfeHtmlFetcher.maybe_process_iframe",
+    side_effect=lambda _session, resp: resp,
+)
+@mock.patch("requests_html.HTMLSession.get")
+def test_scan_multiple_skips_pages_with_broken_amounts(requests_get, _maybe_process_iframe):
+    page = read_html("nfe_rs_v2.html")
+    pages = {
+        "p=1": page.replace(
+            'class="totalNumb txtMax">86,19</span>', 'class="totalNumb txtMax">-</span>'
+        ),
+        "p=2": page,
+    }
+    requests_get.side_effect = lambda url, **_: mock.MagicMock(
+        text=pages[url.rpartition("?")[2]], ok=True
+    )
+    errors = []
+
+    nfes = scan_multiple_nfe(
+        [
+            "https://dfe-portal.svrs.rs.gov.br/Dfe/QrCodeNFce?p=1",
+            "https://dfe-portal.svrs.rs.gov.br/Dfe/QrCodeNFce?p=2",
+        ],
+        on_error=lambda nfe_url, err: errors.append((nfe_url.full, type(err))),
+    )
+
+    assert len(nfes) == 1
+    assert errors == [("https://dfe-portal.svrs.rs.gov.br/Dfe/QrCodeNFce?p=1", NfeParserException)]
+
+
+@mock.patch(
+    "nfe_scanner.fetchers.html.NfeHtmlFetcher.maybe_process_iframe",
+    side_effect=lambda _session, resp: resp,
+)
+@mock.patch("requests_html.HTMLSession.get")
+def test_scan_multiple_skips_unreachable_pages(requests_get, _maybe_process_iframe):
+    def get(url, **_):
+        if url.endswith("p=1"):
+            raise requests.ConnectionError("connection reset")
+        return mock.MagicMock(text=read_html("nfe_rs_v2.html"), ok=True)
+
+    requests_get.side_effect = get
+    errors = []
+
+    nfes = scan_multiple_nfe(
+        [
+            "https://dfe-portal.svrs.rs.gov.br/Dfe/QrCodeNFce?p=1",
+            "https://dfe-portal.svrs.rs.gov.br/Dfe/QrCodeNFce?p=2",
+        ],
+        on_error=lambda nfe_url, err: errors.append((nfe_url.full, type(err))),
+    )
+
+    assert len(nfes) == 1
+    assert errors == [("https://dfe-portal.svrs.rs.gov.br/Dfe/QrCodeNFce?p=1", NfeFetcherException)]
@@ -0,0 +1,71 @@
+import io
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+
+import pytest
+
+from nfe_scanner.logs import (
+    RateLimitFilter,
+    configure_logging,
+    pool_logging,
+    stop_logging,
+)
+
+
+def make_record(msg: str, *args, level: int = logging.WARNING) -> logging.LogRecord:
+    return logging.LogRecord("test", level, __file__, 1, msg, args, None)
+
+
+@mock.patch("nfe_scanner.logs.time.monotonic")
+def test_repeated_warnings_are_rate_limited(monotonic):
+    monotonic.return_value = 0
+    rate_limit = RateLimitFilter(burst=2, interval=10)
+
+    passed = [rate_limit.filter(make_record("Unit '%s' not recognized", "PCT")) for _ in range(5)]
+    assert passed == [True, True, False, False, False]
+    assert rate_limit.filter(make_record("Unit '%s' not recognized", "BDJ"))
+    assert rate_limit.filter(make_record("info", level=logging.INFO))
+
+    monotonic.return_value = 10
+    record = make_record("Unit '%s' not recognized", "PCT")
+    assert rate_limit.filter(record)
+    assert record.getMessage() == "Unit 'PCT' not recognized (3 similar message(s) suppressed)"
+
+
+@pytest.fixture(name="root_logger")
+def fixture_root_logger():
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield root
+    stop_logging()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+def test_configure_logging_writes_from_a_queue(root_logger):
+    stream = io.StringIO()
+
+    configure_logging("WARNING", stream=stream)
+    logging.getLogger("nfe_scanner.test").info("hidden")
+    logging.getLogger("nfe_scanner.test").warning("shown %d", 1)
+    stop_logging()
+
+    assert root_logger.level == logging.WARNING
+    assert stream.getvalue() == "shown 1\n"
+
+
+def warn_from_worker(number: int):
+    logging.getLogger("nfe_scanner.test").warning("worker warning %d", number)
+
+
+@pytest.mark.usefixtures("root_logger")
+def test_pool_workers_log_to_the_parent():
+    stream = io.StringIO()
+
+    configure_logging("WARNING", stream=stream)
+    with ProcessPoolExecutor(max_workers=2, **pool_logging()) as executor:
+        list(executor.map(warn_from_worker, range(3)))
+    stop_logging()
+
+    assert sorted(stream.getvalue().splitlines()) == [f"worker warning {i}" for i in range(3)]
@@ -1,20 +1,18 @@
-import pathlib
+import gc
+import weakref
 from unittest import mock
 
 import pytest
 from bs4 import BeautifulSoup
 
-from nfe_scanner.exceptions import NfeFetcherException
+from nfe_scanner.exceptions import NfeFetcherException, NfeParserException
+from nfe_scanner.fetchers.base import NfeFetcherResponse, NfeFetcherResponseType
 from nfe_scanner.fetchers.factory import NfeFetcherFactory
 from nfe_scanner.models import Nfe
 from nfe_scanner.nfe import scan_nfe
-
-
-def read_html(filename: str) -> BeautifulSoup:
-    parent = pathlib.Path(__file__).parent.resolve()
-    with open(f"{parent}/html/{filename}", encoding="utf-8") as f:
-        html = f.read()
-    return html
+from nfe_scanner.parsers.base import ParseMode
+from nfe_scanner.parsers.html import NfeHtmlParser2, to_bs
+from tests.helpers import read_html
 
 
 @pytest.mark.skip
@@ -51,3 +49,80 @@ def test_url_not_associated_to_any_available_fetcher():
         scan_nfe("http://host/?p=1")
 
     assert expected_error_message in str(exc_info.value)
+
+
+@mock.patch(
+    "requests_html.HTMLSession.get",
+    return_value=mock.MagicMock(text=read_html("nfe_rs_v2.html"), ok=True),
+)
+def test_parse_modes_rs_v2(_requests_get):
+    url = "http://" + NfeFetcherFactory.SEFAZ_RS_V2_HOSTNAME + "/Dfe/QrCodeNFce?p=1"
+    nfe: Nfe = scan_nfe(url)
+    header_only: Nfe = scan_nfe(url, mode=ParseMode.HEADER_ONLY)
+    lazy: Nfe = scan_nfe(url, mode=ParseMode.LAZY_ITEMS)
+
+    assert header_only.items == []
+    assert header_only.raw_html == read_html("nfe_rs_v2.html")
+    assert header_only.json(exclude={"items", "raw_html"}) == nfe.json(
+        exclude={"items", "raw_html"}
+    )
+    assert "items" not in lazy.__dict__
+    assert lazy.json() == nfe.json()
+    assert lazy.items == nfe.items
+
+
+def test_lazy_items_keep_no_tree():
+    pages = []
+
+    def tracked_to_bs(html: str) -> BeautifulSoup:
+        page = to_bs(html)
+        pages.append(weakref.ref(page))
+        return page
+
+    response = NfeFetcherResponse(None, read_html("nfe_rs_v2.html"), NfeFetcherResponseType.HTML)
+    parser = NfeHtmlParser2(response, ParseMode.LAZY_ITEMS)
+    with mock.patch("nfe_scanner.parsers.html.to_bs", side_effect=tracked_to_bs):
+        lazy: Nfe = parser.parse()
+    parser_ref = weakref.ref(parser)
+    del parser
+    gc.collect()
+
+    # only the item rows are kept until the items are loaded, not the parser nor the page tree
+    assert parser_ref() is None
+    assert [page() for page in pages] == [None]
+    assert lazy.items
+
+
+@mock.patch(
+    "requests_html.HTMLSession.get",
+    return_value=mock.MagicMock(
+        # an item without its barcode, the header still parses
+        text=read_html("nfe_rs_v2.html").replace("2009490000000", "", 1),
+        ok=True,
+    ),
+)
+def test_lazy_items_errors_are_parser_errors(_requests_get):
+    url = "http://" + NfeFetcherFactory.SEFAZ_RS_V2_HOSTNAME + "/Dfe/QrCodeNFce?p=1"
+    lazy: Nfe = scan_nfe(url, mode=ParseMode.LAZY_ITEMS)
+
+    with pytest.raises(NfeParserException, match="failed to parse the items"):
+        _ = lazy.items
+
+
+@mock.patch(
+    "requests_html.HTMLSession.get",
+    return_value=mock.MagicMock(
+        # the payment type is the sibling following "linhaForma"
+        text=read_html("nfe_rs_v2.html")
+        .replace('<div id="linhaForma">', '<div><div id="linhaForma">', 1)
+        .replace(
+            "Valor pago R$:</span>\n            </div>", "Valor pago R$:</span></div></div>", 1
+        ),
+        ok=True,
+    ),
+)
+def test_missing_payment_type_is_a_parser_error(_requests_get):
+    url = "http://" + NfeFetcherFactory.SEFAZ_RS_V2_HOSTNAME + "/Dfe/QrCodeNFce?p=1"
+
+    with pytest.raises(NfeParserException, match="Payment type is missing"):
+        scan_nfe(url)
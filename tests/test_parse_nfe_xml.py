@@ -0,0 +1,77 @@
+import io
+import pathlib
+import zipfile
+from decimal import Decimal
+
+from nfe_scanner.fetchers.base import NfeFetcherResponse, NfeFetcherResponseType
+from nfe_scanner.models import MetricUnit, PaymentType
+from nfe_scanner.parsers.factory import NfeParserFactory
+from nfe_scanner.parsers.xml import NfeXmlParser, parse_xml_stream, scan_xml
+
+XML_DIR = pathlib.Path(__file__).parent.resolve() / "xml"
+
+
+def test_parse_xml_response():
+    text = (XML_DIR / "nfe_rs.xml").read_text(encoding="utf-8")
+    response = NfeFetcherResponse(None, text, NfeFetcherResponseType.XML, True)
+
+    parser = NfeParserFactory(None, response).create()
+    nfe = parser.parse()
+
+    assert isinstance(parser, NfeXmlParser)
+    assert nfe.access_key == "4323 1100 0000 0000 0001 6500 1000 0000 0110 0000 0004"
+    assert nfe.issuer.name == "SUPERMERCADO"
+    assert nfe.issuer.national_registration_code == "00.000.000/0001-00"
+    assert nfe.issuer.address.line1 == "ALGUMA RUA 100 ALGUM BAIRRO"
+    assert nfe.consumer.identification == "Consumidor não identificado"
+    assert nfe.issued_date.isoformat() == "2023-11-01T11:19:40+00:00"
+    assert nfe.total_amount == Decimal("17.65")
+    assert nfe.payment_type == PaymentType.CREDIT_CARD
+    assert nfe.raw_html == text
+    assert [(i.barcode, i.description, i.metric_unit) for i in nfe.items] == [
+        ("123", "BETERRABA GRANEL", MetricUnit.KG),
+        ("7896715601129", "OVO BRANCO EXTRA NATUROVOS C/30", MetricUnit.UNIT),
+    ]
+    assert nfe.items[0].quantity == Decimal("0.5102")
+    assert str(nfe.items[1].unitary_price) == "14.9"
+
+
+def test_round_quantities_have_no_exponent():
+    text = (XML_DIR / "nfe_rs.xml").read_text(encoding="utf-8")
+    text = text.replace("<qCom>1.0000</qCom>", "<qCom>10.0000</qCom>")
+    text = text.replace("<vUnCom>14.9000000000</vUnCom>", "<vUnCom>20.0000000000</vUnCom>")
+
+    item = parse_xml_stream(io.BytesIO(text.encode("utf-8"))).items[1]
+
+    assert (str(item.quantity), str(item.unitary_price)) == ("10", "20")
+
+
+def test_scan_xml_directories_and_zips(tmp_path):
+    archive_path = tmp_path / "nfes.zip"
+    with zipfile.ZipFile(archive_path, "w") as archive:
+        archive.write(XML_DIR / "nfe_rs.xml", "a/nfe_rs.xml")
+        archive.writestr("readme.txt", "not a NF-e")
+
+    nfes = list(scan_xml([XML_DIR, archive_path]))
+
+    assert len(nfes) == 2
+    assert nfes[0] == nfes[1]
+    assert nfes[0].raw_html == ""
+
+
+def test_scan_xml_skips_documents_that_are_not_nfes(tmp_path):
+    archive_path = tmp_path / "nfes.zip"
+    with zipfile.ZipFile(archive_path, "w") as archive:
+        archive.writestr("a/evento.xml", "<procEventoNFe><evento/></procEventoNFe>")
+        archive.writestr("b/broken.xml", "<nfeProc><NFe>")
+        archive.write(XML_DIR / "nfe_rs.xml", "c/nfe_rs.xml")
+    errors = []
+
+    nfes = list(scan_xml([archive_path], chunksize=2, on_error=lambda *error: errors.append(error)))
+
+    assert len(nfes) == 1
+    assert [source for source, _ in errors] == [
+        (str(archive_path), "a/evento.xml"),
+        (str(archive_path), "b/broken.xml"),
+    ]
+    assert "ParseError" in errors[1][1]
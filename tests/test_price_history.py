@@ -0,0 +1,33 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from nfe_scanner import price_history
+from tests.helpers import parse_nfe_rs_v2
+
+
+def test_add_nfes_incrementally():
+    connection = price_history.connect(":memory:")
+    price_history.create_tables(connection)
+    nfe = parse_nfe_rs_v2()
+    item = nfe.items[0]
+    later_nfe = nfe.copy(deep=True)
+    later_nfe.access_key = "1"
+    later_nfe.issued_date += timedelta(days=1)
+    later_nfe.items = [item.copy(update={"unitary_price": item.unitary_price + 1})]
+
+    assert price_history.add_nfes(connection, [nfe]) == 1
+    assert price_history.add_nfes(connection, [nfe, later_nfe]) == 1
+
+    (point,) = price_history.price_trend(connection, price_history.product_key(item))
+    assert point.issuer == nfe.issuer.national_registration_code
+    assert point.count == 2
+    assert point.last_price == item.unitary_price + 1
+    assert point.min_price == item.unitary_price
+    assert point.max_price == item.unitary_price + 1
+    assert point.total_spent == item.total_price * 2
+    assert price_history.price_trend(connection, "unknown") == []
+
+
+def test_scaled_values_are_exact():
+    assert price_history.to_scaled(Decimal("0.5102"), price_history.QUANTITY_SCALE) == 5102
+    assert price_history.from_scaled(14900, price_history.PRICE_SCALE) == Decimal("14.9")
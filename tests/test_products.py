@@ -0,0 +1,27 @@
+from decimal import Decimal
+
+from nfe_scanner.products import ProductIndex, Size, extract_size, normalize_description
+
+
+def test_normalize_description():
+    assert normalize_description("LTE FERM YAKULT 480G") == "LEITE FERMENTADO YAKULT"
+    assert normalize_description("Pão de Açúcar, 1kg") == "PAO DE ACUCAR"
+
+
+def test_extract_size():
+    assert extract_size("LTE FERM YAKULT 480G") == Size(Decimal("480"), "G")
+    assert extract_size("REFRIG COLA 1,5L") == Size(Decimal("1500"), "ML")
+    assert extract_size("SALSA") is None
+
+
+def test_lookup_matches_abbreviated_descriptions():
+    index = ProductIndex()
+    index.add(1, "LEITE FERMENTADO YAKULT 480G")
+    index.add(2, "LEITE FERMENTADO YAKULT 80G")
+    index.add(3, "OVO BRANCO EXTRA C/30")
+
+    (match,) = index.lookup("LTE FERM YAKULT 480G")
+
+    assert match.product_id == 1
+    assert match.score == 1
+    assert index.lookup("DETERGENTE") == []
@@ -0,0 +1,70 @@
+import io
+import json
+from unittest import mock
+
+import pytest
+
+from nfe_scanner.__main__ import report_timings
+from nfe_scanner.fetchers.factory import NfeFetcherFactory
+from nfe_scanner.nfe import scan_nfe
+from nfe_scanner.profiling import PROFILER, Profiler
+from tests.helpers import read_html
+
+
+@pytest.fixture(name="profiler")
+def fixture_profiler():
+    PROFILER.enabled = True
+    yield PROFILER
+    PROFILER.enabled = False
+    PROFILER.reset()
+
+
+@mock.patch(
+    "requests_html.HTMLSession.get",
+    return_value=mock.MagicMock(text=read_html("nfe_rs_v2.html"), ok=True),
+)
+def test_scan_records_stages(_requests_get, profiler):
+    scan_nfe("http://" + NfeFetcherFactory.SEFAZ_RS_V2_HOSTNAME + "/Dfe/QrCodeNFce?p=1")
+
+    for name in (
+        "fetch",
+        "fetch.iframe",
+        "parser_factory.create",
+        "parse.to_bs",
+        "parse.nfe_items",
+    ):
+        assert profiler.stages[name].count == 1
+    # the mocked response always contains an iframe
+    assert profiler.stages["fetch.http_get"].count == 2
+    assert profiler.counters["fetch.requests"] == 2
+    assert "parse.validate" in profiler.summary_table()
+    assert 'nfe_scanner_stage_seconds_count{stage="parse"} 1' in profiler.prometheus_text()
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = Profiler()
+
+    with profiler.stage("stage"):
+        profiler.count("event")
+
+    assert not profiler.stages and not profiler.counters
+
+
+def test_write_jsonl():
+    profiler = Profiler(enabled=True)
+    profiler.observe("stage", 0.5)
+    f = io.StringIO()
+
+    profiler.write_jsonl(f)
+
+    assert json.loads(f.getvalue())["elapsed"] == 0.5
+
+
+def test_timings_stay_out_of_stdout(profiler, capsys):
+    profiler.observe("stage", 0.5)
+
+    report_timings("jsonl")
+
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert json.loads(captured.err)["stage"] == "stage"
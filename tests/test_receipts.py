@@ -0,0 +1,54 @@
+from unittest import mock
+
+from nfe_scanner.receipts import (
+    ReceiptQrCode,
+    decode_receipt_file,
+    iter_receipt_files,
+    receipt_url,
+    receipt_urls,
+)
+
+ACCESS_KEY = "43231100000000000001650010000000011000000004"
+URL = f"https://dfe-portal.svrs.rs.gov.br/Dfe/QrCodeNFce?p={ACCESS_KEY}|2|1|1|AAAA"
+
+
+def test_iter_receipt_files(tmp_path):
+    for name in ("b.JPG", "a/c.pdf", "a/notes.txt", "d.png"):
+        (tmp_path / name).parent.mkdir(exist_ok=True)
+        (tmp_path / name).touch()
+
+    files = list(iter_receipt_files([tmp_path]))
+
+    assert [path.relative_to(tmp_path).as_posix() for path in files] == [
+        "a/c.pdf",
+        "b.JPG",
+        "d.png",
+    ]
+
+
+def test_receipt_url_validation():
+    assert receipt_url(ReceiptQrCode("a.jpg", 1, f" {URL}\n")).dedup_key == ACCESS_KEY
+    assert receipt_url(ReceiptQrCode("a.jpg", 1, "https://example.com/promo")) is None
+    assert receipt_url(ReceiptQrCode("a.jpg", 1, URL.replace("0004|", "0005|"))) is None
+
+
+@mock.patch("nfe_scanner.receipts.iter_pages")
+def test_unreadable_receipt_is_skipped(iter_pages):
+    # what pypdfium2.PdfiumError derives from
+    iter_pages.side_effect = RuntimeError("Failed to load document (PDFium: Data format error).")
+    assert decode_receipt_file("broken.pdf") == []
+
+    # Pillow on a truncated image
+    iter_pages.side_effect = SyntaxError("broken PNG file")
+    assert decode_receipt_file("broken.png") == []
+
+
+@mock.patch("nfe_scanner.receipts.decode_receipts")
+def test_receipt_urls(decode_receipts):
+    decode_receipts.return_value = [
+        ReceiptQrCode("a.pdf", 1, URL),
+        ReceiptQrCode("a.pdf", 2, "WIFI:S:loja;;"),
+        ReceiptQrCode("b.jpg", 1, URL),
+    ]
+
+    assert receipt_urls(["receipts"]) == [URL, URL]
@@ -0,0 +1,37 @@
+from nfe_scanner.fetchers.base import NfeFetcherResponseType, NfeUrl
+from nfe_scanner.fetchers.html import NfeHtmlFetcher
+from nfe_scanner.nfe import group_urls
+from nfe_scanner.parsers.html import NfeHtmlParser
+from nfe_scanner.registry import REGISTRY, NfeRegistry, NfeRegistryEntry
+
+
+def test_entry_loads_targets_lazily():
+    entry = NfeRegistryEntry(
+        name="test",
+        hosts=("host",),
+        fetcher="nfe_scanner.fetchers.html:NfeHtmlFetcher",
+        parsers={NfeFetcherResponseType.HTML: "nfe_scanner.parsers.html:NfeHtmlParser"},
+    )
+    registry = NfeRegistry(discover=False)
+    registry.register(entry)
+
+    assert registry.lookup("host") is entry
+    assert registry.lookup("other") is None
+    assert entry.fetcher is NfeHtmlFetcher
+    assert entry.parser(NfeFetcherResponseType.HTML) is NfeHtmlParser
+    assert entry.parser(NfeFetcherResponseType.JSON) is None
+
+
+def test_group_urls_by_registry_entry():
+    nfe_urls = [
+        NfeUrl("https://www.sefaz.rs.gov.br/NFCE/NFCE-COM.aspx?p=1"),
+        NfeUrl("https://unknown/?p=2"),
+        NfeUrl("https://dfe-portal.svrs.rs.gov.br/Dfe/QrCodeNFce?p=3"),
+    ]
+
+    groups = group_urls(nfe_urls)
+
+    assert groups == {
+        REGISTRY.lookup("www.sefaz.rs.gov.br"): [nfe_urls[0], nfe_urls[2]],
+        None: [nfe_urls[1]],
+    }
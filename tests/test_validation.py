@@ -0,0 +1,66 @@
+import io
+import json
+from decimal import Decimal
+
+import pytest
+
+from nfe_scanner.exceptions import NfeValidationException
+from nfe_scanner.parsers.xml import parse_xml_stream
+from nfe_scanner.validation import (
+    JsonlQuarantine,
+    assert_nfe,
+    check_item,
+    check_nfe,
+    reconcile,
+)
+from tests.helpers import parse_nfe_rs_v2
+from tests.test_parse_nfe_xml import XML_DIR
+
+
+def test_consistent_nfe():
+    nfe = parse_nfe_rs_v2()
+
+    assert check_nfe(nfe) == []
+    assert reconcile([nfe]) == [nfe]
+
+
+def test_inconsistent_nfe_is_quarantined():
+    nfe = parse_nfe_rs_v2()
+    nfe.total_amount += Decimal("0.01")
+    nfe.items[0] = nfe.items[0].copy(update={"total_price": nfe.items[0].total_price + 1})
+    f = io.StringIO()
+
+    assert reconcile([nfe], JsonlQuarantine(f)) == []
+
+    record = json.loads(f.getvalue())
+    assert record["access_key"] == nfe.access_key
+    assert len(record["problems"]) == 2
+    with pytest.raises(NfeValidationException):
+        assert_nfe(nfe)
+
+
+def test_unit_prices_with_many_decimals():
+    item = (
+        parse_nfe_rs_v2()
+        .items[0]
+        .copy(
+            update={
+                "quantity": Decimal("120"),
+                "unitary_price": Decimal("0.1234567"),
+                "total_price": Decimal("14.81"),
+            }
+        )
+    )
+
+    assert check_item(item) is None
+    assert check_item(item.copy(update={"total_price": Decimal("14.83")}))
+
+
+def test_charges_are_part_of_the_total():
+    text = (XML_DIR / "nfe_rs.xml").read_text(encoding="utf-8")
+    text = text.replace("<vNF>17.65</vNF>", "<vFrete>5.00</vFrete><vNF>22.65</vNF>")
+
+    nfe = parse_xml_stream(io.BytesIO(text.encode("utf-8")))
+
+    assert nfe.total_charges == Decimal("5.00")
+    assert check_nfe(nfe) == []